@@ -0,0 +1,302 @@
+"""
+크롤러 처리량 벤치마크 (오프라인)
+benchmark/fixture_server.py 대역 서버(별도 프로세스)의 고정 페이지로 초당 페이지 수와 페이지당 CPU 시간 측정
+
+대상
+    bs      BSCrawler.extract_api_info (--transports별: aiohttp, httpx)
+    pw      PlaywrightCrawler.extract_api_info_pw (컨텍스트 풀 재사용, crawl_single 경유)
+    hybrid  HybridCrawler.run 전략별 (임시 디렉토리에서 저장까지 포함, smart는 이력 없음/있음 두 번)
+
+CPU 시간은 벤치마크 프로세스와 그 자식 프로세스(브라우저, 샤드) 합계이며 대역 서버 프로세스는 제외
+(실행 중인 자식 프로세스 CPU는 psutil이 있을 때만 포함)
+
+실행 (openapi_crawler 디렉토리에서):
+    python benchmark/bench_crawlers.py
+    python benchmark/bench_crawlers.py --targets bs --pages 200 --repeat 5
+    python benchmark/bench_crawlers.py --targets hybrid --strategies optimized smart --latency-ms 30
+    python benchmark/bench_crawlers.py --targets bs --transports aiohttp httpx
+    python benchmark/bench_crawlers.py --output before.json
+
+대역 서버는 평문 HTTP/1.1이므로 httpx 측정은 전송 계층 오버헤드 비교용
+(HTTP/2 다중화 효과는 TLS/ALPN을 지원하는 실제 서버에서만 나타남)
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs_crawler import BSCrawler
+from fixture_server import PAGE_KINDS, fixture_urls
+from util.http_client import TRANSPORT_AIOHTTP, TRANSPORT_HTTPX, TRANSPORTS, require_httpx
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+HYBRID_STRATEGIES = ('optimized', 'fallback', 'smart')
+
+
+def cpu_seconds(exclude_pids=()) -> float:
+    """현재 프로세스 + 자식 프로세스(종료된 것 포함) CPU 시간 합계 (초)"""
+    times = os.times()
+    total = times.user + times.system + times.children_user + times.children_system
+    if psutil is not None:
+        for child in psutil.Process().children(recursive=True):
+            if child.pid in exclude_pids:
+                continue
+            try:
+                child_times = child.cpu_times()
+                total += child_times.user + child_times.system
+            except psutil.Error:
+                continue
+    return total
+
+
+class Meter:
+    """구간 벽시계/CPU 시간 측정"""
+
+    def __init__(self, exclude_pids=()):
+        self.exclude_pids = set(exclude_pids)
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = cpu_seconds(self.exclude_pids)
+        return self
+
+    def __exit__(self, *exc):
+        self.wall = time.perf_counter() - self._wall
+        self.cpu = cpu_seconds(self.exclude_pids) - self._cpu
+        return False
+
+
+def free_port() -> int:
+    """사용 가능한 로컬 포트"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_fixture_server(port: int, latency_ms: float) -> subprocess.Popen:
+    """대역 서버를 별도 프로세스로 시작하고 접속 가능해질 때까지 대기"""
+    server_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixture_server.py')
+    proc = subprocess.Popen(
+        [sys.executable, server_path, '--port', str(port), '--latency-ms', str(latency_ms)],
+        stdout=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f'대역 서버 시작 실패 (exit={proc.returncode})')
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return proc
+        except OSError:
+            time.sleep(0.05)
+    proc.terminate()
+    raise RuntimeError('대역 서버 시작 시간 초과')
+
+
+@contextlib.contextmanager
+def quiet(enabled: bool):
+    """크롤러 진행 출력 숨기기"""
+    if not enabled:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def measurement(label: str, results: List[Dict], meter: Meter, transport: str = TRANSPORT_AIOHTTP) -> Dict:
+    """측정 결과 한 줄"""
+    pages = len(results)
+    return {
+        'label': label,
+        'transport': transport,
+        'pages': pages,
+        'success': sum(1 for r in results if r.get('success')),
+        'wall_sec': round(meter.wall, 4),
+        'cpu_sec': round(meter.cpu, 4),
+        'pages_per_sec': round(pages / meter.wall, 2) if meter.wall else 0.0,
+        'cpu_ms_per_page': round(meter.cpu / pages * 1000, 3) if pages else 0.0
+    }
+
+
+def best_of(runs: List[Dict]) -> Dict:
+    """반복 측정 중 가장 빠른 결과"""
+    return min(runs, key=lambda m: m['wall_sec'])
+
+
+async def bench_bs(urls: List[str], workers: int, repeat: int, server_pid: int, hide: bool,
+                   transport: str = TRANSPORT_AIOHTTP) -> Dict:
+    """BSCrawler.extract_api_info (세션 재사용, 정제/저장 제외)"""
+    crawler = BSCrawler(max_workers=workers, transport=transport)
+    await crawler.start()
+    runs = []
+    try:
+        # 커넥션 풀 예열
+        with quiet(hide):
+            await crawler.extract_api_info(crawler.session, urls[0])
+        for _ in range(repeat):
+            with quiet(hide), Meter([server_pid]) as meter:
+                results = await asyncio.gather(*[
+                    crawler.extract_api_info(crawler.session, url) for url in urls
+                ])
+            runs.append(measurement(f'bs extract_api_info [{transport}]', results, meter, transport))
+        best = best_of(runs)
+        # httpx는 응답 HTTP 버전별 요청 수 기록 (HTTP/2 협상 여부 확인)
+        if getattr(crawler.session, 'http_versions', None):
+            best['http_versions'] = dict(crawler.session.http_versions)
+    finally:
+        await crawler.close()
+    return best
+
+
+async def bench_pw(urls: List[str], workers: int, repeat: int, server_pid: int, hide: bool) -> Dict:
+    """PlaywrightCrawler.extract_api_info_pw (브라우저/컨텍스트 풀 재사용, 정제/저장 제외)"""
+    from playwright_crawler import PlaywrightCrawler
+
+    crawler = PlaywrightCrawler(max_workers=workers)
+    await crawler.start()
+    runs = []
+    try:
+        with quiet(hide):
+            await crawler.crawl_single(crawler.pool, urls[0])
+        for _ in range(repeat):
+            with quiet(hide), Meter([server_pid]) as meter:
+                results = await asyncio.gather(*[
+                    crawler.crawl_single(crawler.pool, url) for url in urls
+                ])
+            runs.append(measurement('pw extract_api_info_pw', results, meter))
+    finally:
+        await crawler.close()
+    return best_of(runs)
+
+
+async def bench_hybrid(urls: List[str], strategy: str, workers: int, formats: List[str],
+                       server_pid: int, hide: bool, warm: bool = False,
+                       transport: str = TRANSPORT_AIOHTTP) -> Dict:
+    """HybridCrawler.run 1회 (임시 디렉토리에서 실행, warm이면 같은 디렉토리에서 한 번 먼저 실행)"""
+    from main_openapi import HybridCrawler
+
+    label = f"hybrid {strategy}" + (' (warm)' if warm else '') + f" [{transport}]"
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='bench_hybrid_') as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            if warm:
+                with quiet(hide):
+                    await HybridCrawler('./data', formats, max_workers=workers,
+                                        transport=transport).run(urls, strategy=strategy)
+            crawler = HybridCrawler('./data', formats, max_workers=workers, transport=transport)
+            with quiet(hide), Meter([server_pid]) as meter:
+                results, _ = await crawler.run(urls, strategy=strategy)
+        finally:
+            os.chdir(cwd)
+    return measurement(label, results, meter, transport)
+
+
+def print_row(m: Dict):
+    versions = ''.join(f", {v} {n}건" for v, n in sorted(m.get('http_versions', {}).items()))
+    print(f"   {m['label']:<38} {m['pages_per_sec']:9.1f} pages/s  {m['cpu_ms_per_page']:9.2f} ms CPU/page"
+          f"  (성공 {m['success']}/{m['pages']}, {m['wall_sec']:.2f}s{versions})")
+
+
+async def run_benchmarks(args, base_url: str, server_pid: int) -> List[Dict]:
+    urls = fixture_urls(base_url, args.pages)
+    hide = not args.verbose
+    measurements = []
+
+    print(f"\n📦 페이지 {len(urls)}개 ({', '.join(PAGE_KINDS)} 순환), 지연 {args.latency_ms}ms, 작업자 {args.workers}")
+    transports = list(args.transports)
+    if TRANSPORT_HTTPX in transports:
+        try:
+            require_httpx()
+        except ImportError as e:
+            print(f"   ⚠️ {e} - httpx 측정을 건너뜁니다.")
+            transports.remove(TRANSPORT_HTTPX)
+
+    if 'bs' in args.targets:
+        for transport in transports:
+            m = await bench_bs(urls, args.workers, args.repeat, server_pid, hide, transport)
+            print_row(m)
+            measurements.append(m)
+
+    browser_targets = [t for t in args.targets if t in ('pw', 'hybrid')]
+    if browser_targets:
+        try:
+            import playwright  # noqa: F401
+        except ImportError:
+            print(f"   ⚠️ playwright가 없어 {', '.join(browser_targets)} 측정을 건너뜁니다.")
+            return measurements
+
+    if 'pw' in args.targets:
+        m = await bench_pw(urls, args.workers, args.repeat, server_pid, hide)
+        print_row(m)
+        measurements.append(m)
+
+    if 'hybrid' in args.targets:
+        for strategy in args.strategies:
+            warm_cases = (False, True) if strategy == 'smart' else (False,)
+            for warm in warm_cases:
+                for transport in transports:
+                    m = await bench_hybrid(urls, strategy, args.workers, args.formats, server_pid, hide,
+                                           warm, transport)
+                    print_row(m)
+                    measurements.append(m)
+
+    return measurements
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러 처리량 벤치마크 (오프라인 대역 서버)')
+    parser.add_argument('--targets', nargs='+', choices=['bs', 'pw', 'hybrid'], default=['bs', 'pw', 'hybrid'],
+                        help='측정 대상 (기본값: bs pw hybrid)')
+    parser.add_argument('--strategies', nargs='+', choices=HYBRID_STRATEGIES, default=list(HYBRID_STRATEGIES),
+                        help='hybrid 측정 전략 (기본값: optimized fallback smart)')
+    parser.add_argument('--transports', nargs='+', choices=TRANSPORTS, default=list(TRANSPORTS),
+                        help='BS HTTP 전송 방식 (기본값: aiohttp httpx, httpx는 설치된 경우만)')
+    parser.add_argument('--pages', type=int, default=40, help='페이지 수 (기본값: 40)')
+    parser.add_argument('--repeat', type=int, default=3, help='bs/pw 반복 횟수, 가장 빠른 결과 사용 (기본값: 3)')
+    parser.add_argument('--workers', type=int, default=20, help='동시 작업자 수 (기본값: 20)')
+    parser.add_argument('--latency-ms', type=float, default=0, help='대역 서버 응답 지연 ms (기본값: 0)')
+    parser.add_argument('--formats', nargs='+', default=['json'], help='hybrid 저장 형식 (기본값: json)')
+    parser.add_argument('--output', help='측정 결과 JSON 저장 경로 (변경 전후 비교용)')
+    parser.add_argument('--verbose', action='store_true', help='크롤러 진행 출력 표시')
+    args = parser.parse_args()
+
+    port = free_port()
+    server = start_fixture_server(port, args.latency_ms)
+    try:
+        measurements = asyncio.run(run_benchmarks(args, f'http://127.0.0.1:{port}', server.pid))
+    finally:
+        server.terminate()
+        server.wait()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'pages': args.pages,
+                'workers': args.workers,
+                'latency_ms': args.latency_ms,
+                'psutil': psutil is not None,
+                'measurements': measurements
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 측정 결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
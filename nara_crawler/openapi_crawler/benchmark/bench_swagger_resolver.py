@@ -0,0 +1,137 @@
+"""
+Swagger $ref 해석/평탄화 벤치마크
+경로 수백 개가 공통 definitions(중첩, 순환 포함)를 참조하는 명세로 NaraParser.extract_endpoints 시간 측정
+참조별 메모이제이션을 끈 해석기와 비교
+같은 명세를 공유하는 문서의 EndpointCache 적중 비용(공유 반환 vs 깊은 복사)도 함께 측정
+
+실행 (openapi_crawler 디렉토리에서):
+    python benchmark/bench_swagger_resolver.py
+    python benchmark/bench_swagger_resolver.py --paths 100 500 1000 --repeat 5
+"""
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import util.parser as parser_module
+from util.parser import NaraParser
+from util.spec_store import EndpointCache
+from util.swagger_resolver import SwaggerResolver
+
+
+class NoMemoResolver(SwaggerResolver):
+    """비교용: 참조별 평탄화 결과를 저장하지 않는 해석기"""
+
+    def _ref_fields(self, ref, stack):
+        self._fields_memo.clear()
+        return super()._ref_fields(ref, stack)
+
+
+def make_spec(path_count: int, item_fields: int = 30) -> dict:
+    """공통 응답 래퍼 + 항목 스키마(하위 객체, 순환 참조 포함)를 공유하는 Swagger 2.0 명세"""
+    definitions = {
+        'Header': {'type': 'object', 'properties': {
+            'resultCode': {'type': 'string', 'description': '결과코드'},
+            'resultMsg': {'type': 'string', 'description': '결과메세지'}
+        }},
+        'Org': {'type': 'object', 'properties': {
+            'code': {'type': 'string', 'description': '기관코드'},
+            'name': {'type': 'string', 'description': '기관명'},
+            'parent': {'$ref': '#/definitions/Org'}
+        }},
+        'Item': {'type': 'object', 'properties': {
+            **{f'field{i}': {'type': 'string', 'description': f'항목 {i}'} for i in range(item_fields)},
+            'org': {'$ref': '#/definitions/Org'},
+            'related': {'type': 'array', 'items': {'$ref': '#/definitions/Item'}}
+        }},
+        'ListResponse': {'type': 'object', 'properties': {
+            'response': {'type': 'object', 'properties': {
+                'header': {'$ref': '#/definitions/Header'},
+                'body': {'type': 'object', 'properties': {
+                    'items': {'type': 'array', 'items': {'$ref': '#/definitions/Item'}},
+                    'totalCount': {'type': 'integer'}
+                }}
+            }}
+        }}
+    }
+    paths = {}
+    for i in range(path_count):
+        paths[f'/getItem{i}'] = {
+            'parameters': [{'$ref': '#/parameters/serviceKey'}],
+            'get': {
+                'tags': [f'섹션 {i % 10}'],
+                'summary': f'항목 {i} 조회',
+                'parameters': [
+                    {'$ref': '#/parameters/pageNo'},
+                    {'name': 'query', 'in': 'body', 'schema': {'$ref': '#/definitions/Item'}}
+                ],
+                'responses': {
+                    '200': {'description': '성공', 'schema': {'$ref': '#/definitions/ListResponse'}},
+                    '400': {'$ref': '#/responses/BadRequest'}
+                }
+            }
+        }
+    return {
+        'swagger': '2.0',
+        'info': {'title': '벤치마크 명세', 'version': '1.0'},
+        'paths': paths,
+        'parameters': {
+            'serviceKey': {'name': 'serviceKey', 'in': 'query', 'required': True, 'type': 'string'},
+            'pageNo': {'name': 'pageNo', 'in': 'query', 'required': True, 'type': 'integer'}
+        },
+        'responses': {'BadRequest': {'description': '잘못된 요청', 'schema': {'$ref': '#/definitions/Header'}}},
+        'definitions': definitions
+    }
+
+
+def bench(spec: dict, repeat: int) -> float:
+    """repeat회 실행 후 최소 시간(ms)"""
+    return bench_call(lambda: NaraParser().extract_endpoints(spec), repeat)
+
+
+def bench_call(func, repeat: int) -> float:
+    """func를 repeat회 실행 후 최소 시간(ms)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Swagger $ref 해석/평탄화 벤치마크')
+    parser.add_argument('--paths', type=int, nargs='+', default=[100, 500, 1000], help='경로 수 (기본값: 100 500 1000)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (기본값: 3)')
+    args = parser.parse_args()
+
+    for path_count in args.paths:
+        spec = make_spec(path_count)
+        endpoints = NaraParser().extract_endpoints(spec)
+        field_count = sum(len(r.get('fields', [])) for e in endpoints for r in e['responses'])
+
+        memo_ms = bench(spec, args.repeat)
+        parser_module.SwaggerResolver = NoMemoResolver
+        try:
+            no_memo_ms = bench(spec, args.repeat)
+        finally:
+            parser_module.SwaggerResolver = SwaggerResolver
+
+        print(f"\n📦 {path_count} paths (응답 필드 {field_count}개)")
+        print(f"   {'no memo':<20} {no_memo_ms:9.2f} ms")
+        print(f"   {'memo (ref별)':<20} {memo_ms:9.2f} ms  (x{no_memo_ms / memo_ms:.2f})")
+
+        # 캐시 적중: 같은 명세를 공유하는 다른 문서가 받는 비용 (재추출 memo 시간과 비교)
+        cache = EndpointCache()
+        cache.get_or_compute('spec', lambda: endpoints)
+        shared_ms = bench_call(lambda: cache.get_or_compute('spec', list), args.repeat)
+        deepcopy_ms = bench_call(lambda: copy.deepcopy(endpoints), args.repeat)
+        print(f"   {'cache hit (공유)':<20} {shared_ms:9.3f} ms")
+        print(f"   {'cache hit (deepcopy)':<20} {deepcopy_ms:9.2f} ms  (재추출 대비 x{deepcopy_ms / memo_ms:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""
+텍스트 정제 마이크로 벤치마크
+크롤링 결과와 같은 형태의 페이로드(Swagger/General)로 clean_all_text 성능 비교
+
+실행 (openapi_crawler 디렉토리에서):
+    python benchmark/bench_text_cleaner.py
+    python benchmark/bench_text_cleaner.py --paths 2000 --repeat 5
+"""
+import argparse
+import copy
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from util.text_cleaner import PRECLEANED_KEYS, clean_all_text
+
+
+def legacy_clean_text(text):
+    """이전 구현 (패턴 매 호출 컴파일 조회 + 3회 치환)"""
+    if not isinstance(text, str):
+        return text
+    text = re.sub(r'[\n\r\t]+', ' ', text)
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r' +', ' ', text)
+    return text.strip()
+
+
+def legacy_clean_all_text(obj):
+    """이전 구현 (재귀 + 전체 트리 복사)"""
+    if isinstance(obj, dict):
+        return {k: legacy_clean_all_text(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [legacy_clean_all_text(v) for v in obj]
+    elif isinstance(obj, str):
+        return legacy_clean_text(obj)
+    return obj
+
+
+def make_swagger_payload(path_count: int) -> dict:
+    """SwaggerProcessor.process_swagger_data 결과와 같은 형태의 페이로드"""
+    paths = {}
+    endpoints = []
+    for i in range(path_count):
+        params = [{
+            'name': f'param{j}',
+            'in': 'query',
+            'description': f'요청 변수 {j} 설명<br/>\n\t(필수 여부 확인)',
+            'required': j == 0,
+            'type': 'string'
+        } for j in range(6)]
+        paths[f'/getItem{i}'] = {
+            'get': {
+                'summary': f'항목 {i} 조회',
+                'description': f'<p>항목 {i}을(를) 조회합니다.</p>\n  페이지 단위로  반환',
+                'parameters': params,
+                'responses': {'200': {'description': '성공'}, '500': {'description': '서버 오류'}}
+            }
+        }
+        endpoints.append({
+            'method': 'GET',
+            'path': f'/getItem{i}',
+            'description': f'항목 {i} 조회',
+            'parameters': [{k: v for k, v in p.items() if k != 'in'} for p in params],
+            'responses': [{'status_code': '200', 'description': '성공'}],
+            'tags': ['기본'],
+            'section': '기본'
+        })
+
+    return {
+        'api_id': '15000000',
+        'crawled_url': 'https://www.data.go.kr/data/15000000/openapi.do',
+        'crawled_time': '2025-01-01 00:00:00',
+        'info': {
+            '분류체계': '공공행정 - 일반공공행정',
+            '제공기관': '조달청',
+            '관리부서명': '전자조달국',
+            'API 유형': 'REST',
+            '데이터포맷': 'JSON+XML',
+            '수정일': '2025-01-01'
+        },
+        'api_info': {'title': '나라장터 조회 서비스', 'description': '조달 정보\n조회', 'version': '1.0'},
+        'endpoints': endpoints,
+        'swagger_json': {
+            'swagger': '2.0',
+            'info': {'title': '나라장터 조회 서비스', 'version': '1.0'},
+            'host': 'apis.data.go.kr',
+            'basePath': '/1230000',
+            'paths': paths
+        },
+        'api_type': 'swagger'
+    }
+
+
+def make_general_payload(operation_count: int) -> dict:
+    """PlaywrightCrawler 일반 API 결과와 같은 형태의 페이로드"""
+    api_details = []
+    endpoints = []
+    for i in range(operation_count):
+        basic = {
+            '활용승인 절차': '개발단계 : 자동승인 / 운영단계 : 자동승인',
+            '요청주소': f'http://apis.data.go.kr/1230000/Service/getItem{i}',
+            '서비스URL': 'http://apis.data.go.kr/1230000/Service'
+        }
+        api_details.append({'descriptions': {
+            **basic,
+            '요청변수(Request Parameter)': [{
+                '항목명(영문)': f'param{j}', '항목명(국문)': f'변수 {j}',
+                '항목크기': '10', '항목구분': '1', '샘플데이터': '1',
+                '항목설명': f'  변수 {j}\n 설명  '
+            } for j in range(8)],
+            '출력결과(Response Element)': [{
+                '항목명(영문)': f'field{j}', '항목명(국문)': f'필드 {j}',
+                '항목크기': '20', '항목구분': '0', '샘플데이터': 'ABC',
+                '항목설명': f'필드 {j} 설명'
+            } for j in range(20)]
+        }})
+        endpoints.append(basic)
+
+    return {
+        'api_id': '15000001',
+        'crawled_url': 'https://www.data.go.kr/data/15000001/openapi.do',
+        'crawled_time': '2025-01-01 00:00:00',
+        'info': {'제공기관': '조달청', 'API 유형': 'REST', '수정일': '2025-01-01'},
+        'general_api_info': {'detail_info': {'descriptions': '상세기능'}},
+        'api_details': api_details,
+        'endpoints': endpoints,
+        'api_type': 'general'
+    }
+
+
+def bench(func, payload, repeat: int) -> float:
+    """repeat회 실행 후 최소 시간(ms) 반환 (in-place 변형은 매번 복사본 사용)"""
+    best = float('inf')
+    for _ in range(repeat):
+        data = copy.deepcopy(payload)
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='clean_all_text 마이크로 벤치마크')
+    parser.add_argument('--paths', type=int, default=1000, help='Swagger 경로 수 (기본값: 1000)')
+    parser.add_argument('--operations', type=int, default=40, help='일반 API 상세기능 수 (기본값: 40)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (기본값: 5)')
+    args = parser.parse_args()
+
+    payloads = {
+        f'Swagger ({args.paths} paths)': make_swagger_payload(args.paths),
+        f'General ({args.operations} operations)': make_general_payload(args.operations)
+    }
+
+    for name, payload in payloads.items():
+        print(f"\n📦 {name}")
+        # 결과 동일성 확인 (swagger_json 건너뛰기 제외)
+        assert legacy_clean_all_text(payload) == clean_all_text(payload)
+
+        base = bench(legacy_clean_all_text, payload, args.repeat)
+        print(f"   {'legacy (recursive, copy)':<48} {base * 1000:9.2f} ms")
+        cases = [
+            ('clean_all_text (copy)', lambda d: clean_all_text(d)),
+            ('clean_all_text (in_place)', lambda d: clean_all_text(d, in_place=True)),
+            ('clean_all_text (in_place, skip swagger_json)',
+             lambda d: clean_all_text(d, in_place=True, skip_subtrees={'swagger_json'})),
+            # 크롤러 마무리 정제: 추출 시점에 정제된 필드는 건너뛰고 나머지만 처리
+            ('clean_all_text (in_place, skip PRECLEANED_KEYS)',
+             lambda d: clean_all_text(d, in_place=True, skip_subtrees=PRECLEANED_KEYS)),
+        ]
+        for label, func in cases:
+            elapsed = bench(func, payload, args.repeat)
+            print(f"   {label:<48} {elapsed * 1000:9.2f} ms  (x{base / elapsed:.2f})")
+
+
+if __name__ == '__main__':
+    main()
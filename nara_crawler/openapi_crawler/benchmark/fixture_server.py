@@ -0,0 +1,155 @@
+"""
+오프라인 벤치마크용 data.go.kr 대역 서버 (aiohttp)
+benchmark/fixtures의 페이지를 문서번호별로 제공하여 네트워크 없이 크롤러를 검증/측정
+
+페이지 종류 (문서번호 % 4)
+    0 link      LINK 타입 (테이블 정보만)
+    1 swagger   var swaggerJson 대입문 포함
+    2 general   selectApiDetailFunction.do 상세기능 (POST 응답 조각)
+    3 dynamic   상세 영역을 페이지 스크립트로 렌더링 (BS 실패 → Playwright 필요)
+
+실행 (openapi_crawler 디렉토리에서):
+    python benchmark/fixture_server.py --port 8765
+    python benchmark/fixture_server.py --port 8765 --latency-ms 50
+"""
+import argparse
+import asyncio
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from util.common import DETAIL_FUNCTION_PATH
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+PAGE_KINDS = ('link', 'swagger', 'general', 'dynamic')
+
+# 상세기능 번호(oprtinSeqNo) → (오퍼레이션, 상세기능명), general.html의 select 옵션과 일치
+DETAIL_OPERATIONS = {
+    '1': ('getCntrctInfoListThng', '물품 계약현황 조회'),
+    '2': ('getCntrctInfoListCnstwk', '공사 계약현황 조회'),
+    '3': ('getCntrctInfoListServc', '용역 계약현황 조회'),
+    '4': ('getCntrctInfoListFrgcpt', '외자 계약현황 조회'),
+}
+
+# 페이지 부속 리소스 (차단 프로필/속도 제한의 asset 요청 확인용)
+ASSETS = {
+    '/js/common.js': ('application/javascript', 'function fn_selectApiDetailFunction(v) { return v; }\n'),
+    '/css/portal.css': ('text/css', '.dataset-table { border-collapse: collapse; }\n'),
+}
+
+
+def page_kind(doc_num: int) -> str:
+    """문서번호의 페이지 종류"""
+    return PAGE_KINDS[doc_num % len(PAGE_KINDS)]
+
+
+def load_fixtures(fixture_dir: str = FIXTURE_DIR) -> Dict[str, str]:
+    """페이지 종류별 HTML과 상세기능 응답 조각 템플릿 로드"""
+    fixtures = {}
+    for name in PAGE_KINDS + ('detail_fragment',):
+        with open(os.path.join(fixture_dir, f'{name}.html'), 'r', encoding='utf-8') as f:
+            fixtures[name] = f.read()
+    return fixtures
+
+
+def render_page(fixtures: Dict[str, str], doc_num: int) -> str:
+    """문서번호에 해당하는 openapi.do 페이지"""
+    return fixtures[page_kind(doc_num)].replace('{{DOC_NUM}}', str(doc_num))
+
+
+def render_detail(fixtures: Dict[str, str], oprtin_seq_no: str) -> Optional[str]:
+    """상세기능 POST 응답 조각 (알 수 없는 번호면 None)"""
+    operation = DETAIL_OPERATIONS.get(oprtin_seq_no)
+    if not operation:
+        return None
+    name, title = operation
+    return (fixtures['detail_fragment']
+            .replace('{{OPERATION}}', name)
+            .replace('{{OPERATION_NAME}}', title))
+
+
+def create_app(latency_ms: float = 0, fixtures: Optional[Dict[str, str]] = None) -> web.Application:
+    """
+    대역 서버 애플리케이션
+
+    Args:
+        latency_ms: 모든 응답 전 지연 시간 (실제 서버 응답 시간 흉내)
+        fixtures: load_fixtures() 결과 (None이면 기본 디렉토리에서 로드)
+    """
+    fixtures = fixtures or load_fixtures()
+    delay = max(0.0, latency_ms) / 1000
+    stats = {'page': 0, 'detail': 0, 'asset': 0}
+
+    async def wait():
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def handle_page(request: web.Request) -> web.Response:
+        await wait()
+        stats['page'] += 1
+        html = render_page(fixtures, int(request.match_info['doc_num']))
+        return web.Response(text=html, content_type='text/html', charset='utf-8')
+
+    async def handle_detail(request: web.Request) -> web.Response:
+        await wait()
+        stats['detail'] += 1
+        form = await request.post()
+        html = render_detail(fixtures, form.get('oprtinSeqNo', ''))
+        if html is None:
+            return web.Response(status=404, text='not found')
+        return web.Response(text=html, content_type='text/html', charset='utf-8')
+
+    async def handle_asset(request: web.Request) -> web.Response:
+        stats['asset'] += 1
+        content_type, body = ASSETS[request.path]
+        return web.Response(text=body, content_type=content_type)
+
+    app = web.Application()
+    app['stats'] = stats
+    app.router.add_get(r'/data/{doc_num:\d+}/openapi.do', handle_page)
+    app.router.add_post(DETAIL_FUNCTION_PATH, handle_detail)
+    for path in ASSETS:
+        app.router.add_get(path, handle_asset)
+    return app
+
+
+async def start_server(host: str = '127.0.0.1', port: int = 0,
+                       latency_ms: float = 0) -> Tuple[web.AppRunner, str]:
+    """현재 이벤트 루프에서 서버 시작 (port=0이면 빈 포트 자동 선택)
+
+    Returns:
+        (runner, base_url) - 종료 시 await runner.cleanup()
+    """
+    runner = web.AppRunner(create_app(latency_ms), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    return runner, f'http://{host}:{bound_port}'
+
+
+def fixture_urls(base_url: str, count: int, start_num: int = 15000000) -> List[str]:
+    """대역 서버의 openapi.do URL 목록 (페이지 종류가 번갈아 나오도록 연속 번호)"""
+    return [f'{base_url}/data/{num}/openapi.do' for num in range(start_num, start_num + count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='오프라인 벤치마크용 data.go.kr 대역 서버')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='포트 (기본값: 8765)')
+    parser.add_argument('--latency-ms', type=float, default=0, help='응답 지연 시간 ms (기본값: 0)')
+    args = parser.parse_args()
+
+    print(f"🧪 대역 서버: http://{args.host}:{args.port}/data/{{번호}}/openapi.do "
+          f"(번호 % {len(PAGE_KINDS)} → {', '.join(PAGE_KINDS)})")
+    web.run_app(create_app(args.latency_ms), host=args.host, port=args.port,
+                access_log=None, print=None)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,23 +3,73 @@ BeautifulSoup 기반 정적 콘텐츠 크롤러
 """
 
 import asyncio
+import time
 import aiohttp
 from bs4 import BeautifulSoup
-import re
-import json
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 
-from util.text_cleaner import clean_text, clean_all_text
-from util.common import SwaggerProcessor, ApiIdExtractor
+from util.text_cleaner import PRECLEANED_KEYS, clean_text, clean_all_text
+from util.common import SwaggerProcessor, GeneralApiProcessor, ApiIdExtractor, DETAIL_FUNCTION_PATH
+from util.swagger_extractor import extract_swagger_json_from_html
+from util.rate_limiter import RateLimiter
+from util.timing import PhaseTimer, create_trace_config
+from util.http_client import TRANSPORT_AIOHTTP, TRANSPORT_HTTPX, TRANSPORTS, HttpxSession
 
 class BSCrawler:
-    def __init__(self, max_workers: int = 20):
+    # 페이지당 상세기능 POST 동시 요청 수
+    DETAIL_CONCURRENCY = 6
+
+    def __init__(self, max_workers: int = 20, rate_limiter: Optional[RateLimiter] = None,
+                 transport: str = TRANSPORT_AIOHTTP):
+        if transport not in TRANSPORTS:
+            raise ValueError(f"지원하지 않는 전송 방식: {transport} (가능: {', '.join(TRANSPORTS)})")
         self.max_workers = max_workers
         self.semaphore = asyncio.Semaphore(max_workers)
+        # 스캐너/Playwright와 공유하는 호스트별 속도 제한 (None이면 제한 없음)
+        self.rate_limiter = rate_limiter
+        # HTTP 전송 방식 (aiohttp: HTTP/1.1 연결 풀, httpx: HTTP/2 다중화)
+        self.transport = transport
+        # start()로 연 공유 세션 (없으면 배치마다 새 세션)
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self):
+        """여러 배치에서 재사용할 세션 생성 (커넥션 풀 유지)"""
+        if self.session is None:
+            self.session = await self.create_session()
+
+    async def close(self):
+        """공유 세션 종료"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    @asynccontextmanager
+    async def batch_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """배치용 세션 (start()로 연 세션이 있으면 재사용, 없으면 배치 동안만 사용)"""
+        if self.session is not None:
+            yield self.session
+            return
+        async with await self.create_session() as session:
+            yield session
+
+    async def throttle(self, url: str):
+        """요청 전 공유 rate limiter에서 토큰 획득"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(url)
     
     async def create_session(self) -> aiohttp.ClientSession:
-        """최적화된 HTTP 세션 생성"""
+        """최적화된 HTTP 세션 생성 (transport가 httpx면 같은 인터페이스의 HttpxSession)"""
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        if self.transport == TRANSPORT_HTTPX:
+            # HTTP/2는 호스트당 연결 하나에 요청을 다중화하므로 limit_per_host 제한 없음
+            return HttpxSession(timeout_sec=10, connect_timeout=3, read_timeout=7,
+                                max_connections=100, max_keepalive=30, headers=headers)
+
         connector = aiohttp.TCPConnector(
             limit=100,
             limit_per_host=30,
@@ -30,9 +80,9 @@ class BSCrawler:
         return aiohttp.ClientSession(
             connector=connector,
             timeout=timeout,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            # 요청별 단계 시간 (trace_request_ctx로 PhaseTimer 전달)
+            trace_configs=[create_trace_config()],
+            headers=headers
         )
     
     async def extract_table_info(self, soup: BeautifulSoup) -> Dict:
@@ -68,46 +118,9 @@ class BSCrawler:
 
         return table_info
     
-    def extract_swagger_json(self, soup: BeautifulSoup) -> Optional[Dict]:
-        """Swagger JSON 추출 (케이스 3)"""
-        swagger_json = None
-        scripts = soup.find_all('script')
-        
-        patterns = [
-            (r'var\s+swaggerJson\s*=\s*(\{.*?\})\s*;', re.DOTALL),
-            (r'var\s+swaggerJson\s*=\s*`([^`]+)`', re.DOTALL),
-            (r'var\s+swaggerJson\s*=\s*"([^"]+)"', 0),
-            (r'window\.swaggerJson\s*=\s*(\{.*?\})', re.DOTALL)
-        ]
-        
-        for script in scripts:
-            if not script.string:
-                continue
-                
-            content = script.string
-            
-            for pattern, flags in patterns:
-                try:
-                    if flags:
-                        match = re.search(pattern, content, flags)
-                    else:
-                        match = re.search(pattern, content)
-                    
-                    if match:
-                        json_str = match.group(1)
-                        # 이스케이프 처리
-                        json_str = json_str.replace('\\"', '"')
-                        json_str = json_str.replace('\\n', '')
-                        json_str = json_str.replace('\\r', '')
-                        json_str = json_str.replace('\\t', '')
-                        
-                        swagger_json = json.loads(json_str)
-                        if swagger_json and isinstance(swagger_json, dict):
-                            return swagger_json
-                except (json.JSONDecodeError, AttributeError):
-                    continue
-        
-        return None
+    def extract_swagger_json(self, html: str) -> Optional[Dict]:
+        """Swagger JSON 추출 (케이스 3) - HTML 원문 선형 탐색, DOM 불필요"""
+        return extract_swagger_json_from_html(html)
 
     def extract_general_api_info(self, soup: BeautifulSoup) -> Dict:
         """일반 API 정보 추출"""
@@ -155,6 +168,61 @@ class BSCrawler:
 
         return general_api_info
     
+    async def fetch_api_detail(self, session: aiohttp.ClientSession, detail_url: str,
+                               referer: str, item: Dict) -> Dict:
+        """상세기능 1건 POST 요청 및 응답 조각 파싱"""
+        form = {k: ('' if v is None else v) for k, v in item.items()}
+        try:
+            await self.throttle(detail_url)
+            async with session.post(detail_url, data=form, headers={'Referer': referer}) as response:
+                if response.status != 200:
+                    return {'ok': False, 'error': f'HTTP {response.status}'}
+                html = await response.text()
+            return {'ok': True, 'data': GeneralApiProcessor.parse_detail_fragment(html, referer)}
+        except asyncio.TimeoutError:
+            return {'ok': False, 'error': '타임아웃'}
+        except Exception as e:
+            return {'ok': False, 'error': str(e)}
+
+    async def extract_general_api_info_static(self, session: aiohttp.ClientSession,
+                                              url: str, soup: BeautifulSoup) -> Optional[Dict]:
+        """일반 API 정보 정적 추출 (브라우저 없이 selectApiDetailFunction.do 직접 호출)
+
+        PlaywrightCrawler.extract_general_api_info_pw와 같은 api_details / endpoints 구조 반환
+        """
+        request_params = GeneralApiProcessor.extract_request_params(soup)
+        if not request_params:
+            return None
+
+        detail_url = urljoin(url, DETAIL_FUNCTION_PATH)
+        limiter = asyncio.Semaphore(self.DETAIL_CONCURRENCY)
+
+        async def fetch(item: Dict) -> Dict:
+            async with limiter:
+                return await self.fetch_api_detail(session, detail_url, url, item)
+
+        # 요청 순서 유지 (gather는 입력 순서대로 결과 반환)
+        detail_results = await asyncio.gather(*[fetch(item) for item in request_params])
+        api_details, endpoints = GeneralApiProcessor.build_api_details(detail_results)
+        if not endpoints:
+            return None
+
+        general_api_info = {
+            'api_details': api_details,
+            'endpoints': endpoints
+        }
+
+        # 상세기능 설명
+        detail_div = soup.find('div', id='open-api-detail-result')
+        if detail_div:
+            desc_elem = detail_div.find('h4', class_='tit')
+            if desc_elem:
+                general_api_info['detail_info'] = {
+                    'descriptions': clean_text(desc_elem.get_text())
+                }
+
+        return general_api_info
+
     async def extract_api_info(self, session: aiohttp.ClientSession, url: str) -> Dict:
         """메인 추출 함수"""
         result = {
@@ -165,88 +233,121 @@ class BSCrawler:
             'url': url,
             'method': 'beautifulsoup'
         }
+        timer = PhaseTimer()
+        result['timings'] = timer.phases
         print("정적", url)
         try:
+            wait_start = time.perf_counter()
             async with self.semaphore:
-                async with session.get(url) as response:
+                await self.throttle(url)
+                timer.add('queue_wait', time.perf_counter() - wait_start)
+                async with session.get(url, trace_request_ctx=timer) as response:
                     if response.status != 200:
                         result['errors'].append(f'HTTP {response.status}')
                         return result
                     
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+                    with timer.phase('download'):
+                        html = await response.text()
 
-                    # API ID 추출
-                    api_id = ApiIdExtractor.extract_api_id(url)
-                    result['api_id'] = api_id
-                    
-                    # 1. 테이블 정보 추출 (모든 케이스 공통)
-                    table_info = await self.extract_table_info(soup)
-                    
-                    if not table_info:
-                        result['errors'].append('테이블 정보 없음')
-                        return result
-                    
-                    # 2. LINK 타입 체크 (케이스 2)
-                    api_type_field = table_info.get('API 유형', '').upper()
-                    if 'LINK' in api_type_field:
-                        result['data'] = {
-                            'api_id': api_id,
-                            'crawled_url': url,
-                            'crawled_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'info': table_info,
-                            'api_type': 'link',
-                            'skip_reason': 'LINK 타입 API는 테이블 정보만 수집'
-                        }
-                        result['success'] = True
-                        return result
-                    
-                    # 3. Swagger JSON 체크 (케이스 3)
-                    swagger_json = self.extract_swagger_json(soup)
-                    if swagger_json:
-                        result['data'] = SwaggerProcessor.process_swagger_data(
-                            swagger_json, api_id, url, table_info, api_type='swagger'
-                        )
-                        result['success'] = True
-                        return result
-                    
-                    # 4. 일반 API 정보 추출 (케이스 1)
-                    general_api_info = self.extract_general_api_info(soup)
-                    if general_api_info:
-                        # general_api_info를 api_info, endpoints, general_json으로 분리
-                        api_info = {}
-                        general_json = {}
-                        endpoints = []
-
-                        # post_request_values를 general_json으로 이동하고 response_data의 tables 키 제거
-                        if 'post_request_values' in general_api_info:
-                            post_request_values = general_api_info['post_request_values']
-                            for item in post_request_values:
-                                if 'response_data' in item and item['response_data'] and 'tables' in item['response_data']:
-                                    # tables 키 제거하고 배열 내용을 response_data로 직접 할당
-                                    item['response_data'] = item['response_data']['tables']
-                            general_json['post_request_values'] = post_request_values
-
-                        # 나머지 필드들을 api_info로 이동
-                        for key, value in general_api_info.items():
-                            if key != 'post_request_values':
-                                api_info[key] = value
-
-                        result['data'] = {
-                            'api_id': api_id,
-                            'crawled_url': url,
-                            'crawled_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'info': table_info,
-                            'api_info': api_info,
-                            'endpoints': endpoints,
-                            'general_json': general_json,
-                            'api_type': 'general'
-                        }
-                        result['success'] = True
-                        return result
-                    
-                    # 정보 부족 - 동적 렌더링 필요 가능성
-                    result['errors'].append('정적 추출 실패 - 동적 렌더링 필요')
+            # 응답과 동시성 슬롯을 먼저 반환하고 파싱/상세기능 POST 실행 (상세 요청 동안 슬롯/연결을 붙잡지 않음)
+            with timer.phase('parse'):
+                soup = BeautifulSoup(html, 'html.parser')
+
+            # API ID 추출
+            api_id = ApiIdExtractor.extract_api_id(url)
+            result['api_id'] = api_id
+            
+            # 1. 테이블 정보 추출 (모든 케이스 공통)
+            with timer.phase('parse'):
+                table_info = await self.extract_table_info(soup)
+            
+            if not table_info:
+                result['errors'].append('테이블 정보 없음')
+                return result
+            
+            # 2. LINK 타입 체크 (케이스 2)
+            api_type_field = table_info.get('API 유형', '').upper()
+            if 'LINK' in api_type_field:
+                result['data'] = {
+                    'api_id': api_id,
+                    'crawled_url': url,
+                    'crawled_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'info': table_info,
+                    'api_type': 'link',
+                    'skip_reason': 'LINK 타입 API는 테이블 정보만 수집'
+                }
+                result['success'] = True
+                return result
+            
+            # 3. Swagger JSON 체크 (케이스 3)
+            with timer.phase('parse'):
+                swagger_json = self.extract_swagger_json(html)
+                if swagger_json:
+                    result['data'] = SwaggerProcessor.process_swagger_data(
+                        swagger_json, api_id, url, table_info, api_type='swagger'
+                    )
+            if swagger_json:
+                result['success'] = True
+                return result
+            
+            # 4. 일반 API 상세기능 정적 추출 (Playwright 없이 POST 직접 호출)
+            with timer.phase('detail'):
+                general_api_info = await self.extract_general_api_info_static(session, url, soup)
+            if general_api_info:
+                endpoints = general_api_info.pop('endpoints', [])
+                api_details = general_api_info.pop('api_details', [])
+
+                result['data'] = {
+                    'api_id': api_id,
+                    'crawled_url': url,
+                    'crawled_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'info': table_info,
+                    'general_api_info': general_api_info,
+                    'api_details': api_details,
+                    'endpoints': endpoints,
+                    'api_type': 'general'
+                }
+                result['success'] = True
+                return result
+
+            # 5. 일반 API 정보 추출 (케이스 1)
+            with timer.phase('parse'):
+                general_api_info = self.extract_general_api_info(soup)
+            if general_api_info:
+                # general_api_info를 api_info, endpoints, general_json으로 분리
+                api_info = {}
+                general_json = {}
+                endpoints = []
+
+                # post_request_values를 general_json으로 이동하고 response_data의 tables 키 제거
+                if 'post_request_values' in general_api_info:
+                    post_request_values = general_api_info['post_request_values']
+                    for item in post_request_values:
+                        if 'response_data' in item and item['response_data'] and 'tables' in item['response_data']:
+                            # tables 키 제거하고 배열 내용을 response_data로 직접 할당
+                            item['response_data'] = item['response_data']['tables']
+                    general_json['post_request_values'] = post_request_values
+
+                # 나머지 필드들을 api_info로 이동
+                for key, value in general_api_info.items():
+                    if key != 'post_request_values':
+                        api_info[key] = value
+
+                result['data'] = {
+                    'api_id': api_id,
+                    'crawled_url': url,
+                    'crawled_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'info': table_info,
+                    'api_info': api_info,
+                    'endpoints': endpoints,
+                    'general_json': general_json,
+                    'api_type': 'general'
+                }
+                result['success'] = True
+                return result
+            
+            # 정보 부족 - 동적 렌더링 필요 가능성
+            result['errors'].append('정적 추출 실패 - 동적 렌더링 필요')
                     
         except asyncio.TimeoutError:
             result['errors'].append('타임아웃')
@@ -259,6 +360,7 @@ class BSCrawler:
         """URL이 LINK 타입인지 빠르게 확인"""
         try:
             async with self.semaphore:
+                await self.throttle(url)
                 async with session.get(url) as response:
                     if response.status != 200:
                         return False
@@ -283,7 +385,7 @@ class BSCrawler:
 
     async def classify_urls_by_type(self, urls: List[str]) -> Tuple[List[str], List[str]]:
         """URL을 LINK 타입과 나머지로 분류"""
-        async with await self.create_session() as session:
+        async with self.batch_session() as session:
             tasks = [(url, self.check_link_type(session, url)) for url in urls]
             checks = await asyncio.gather(*[task[1] for task in tasks])
 
@@ -298,10 +400,31 @@ class BSCrawler:
 
         return link_urls, other_urls
 
-    async def crawl_batch(self, urls: List[str]) -> Tuple[List[Dict], List[str]]:
-        """배치 크롤링"""
-        async with await self.create_session() as session:
-            tasks = [self.extract_api_info(session, url) for url in urls]
+    async def extract_and_finalize(self, session: aiohttp.ClientSession, url: str,
+                                   on_result: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """단일 URL 추출 후 정제, 성공 시 즉시 on_result 콜백 호출"""
+        start = time.perf_counter()
+        result = await self.extract_api_info(session, url)
+        timer = PhaseTimer(result.setdefault('timings', {}))
+        if result['success']:
+            # 추출 시점에 정제되지 않은 나머지 필드만 정제
+            with timer.phase('clean'):
+                result['data'] = clean_all_text(result['data'], in_place=True, skip_subtrees=PRECLEANED_KEYS)
+        timer.add('total', time.perf_counter() - start)
+        if result['success'] and on_result:
+            on_result(result)
+        return result
+
+    async def crawl_batch(self, urls: List[str],
+                          on_result: Optional[Callable[[Dict], None]] = None) -> Tuple[List[Dict], List[str]]:
+        """배치 크롤링
+
+        Args:
+            urls: 크롤링할 URL 리스트
+            on_result: 성공 결과가 나올 때마다 호출되는 콜백 (완료 순서)
+        """
+        async with self.batch_session() as session:
+            tasks = [self.extract_and_finalize(session, url, on_result) for url in urls]
             results = await asyncio.gather(*tasks)
 
         # 성공/실패 분리
@@ -310,8 +433,6 @@ class BSCrawler:
 
         for result in results:
             if result['success']:
-                # 데이터 정제
-                result['data'] = clean_all_text(result['data'])
                 success_results.append(result)
             else:
                 failed_urls.append(result['url'])
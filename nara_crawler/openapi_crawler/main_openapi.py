@@ -13,24 +13,80 @@ import argparse
 import os
 import json
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import time
 
 from bs_crawler import BSCrawler
 from playwright_crawler import PlaywrightCrawler
 from util.parser import DataExporter
+from util.result_writer import OUTPUT_MODES, AsyncResultWriter
+from util.manifest import CrawlManifest
+from util.rate_limiter import RateLimiter, parse_class_rates
+from util.timing import summarize_timings
+from util.routing_history import RoutingHistory
+from util.dead_letter import DeadLetterQueue
+from util.http_client import TRANSPORT_AIOHTTP, TRANSPORTS, require_httpx
+from util.spec_store import ENDPOINT_CACHE, SpecStore
+from util.api_index import ApiIndex
 from util.scanner.metadata_openapi import OpenAPIMetadataScanner
 
 class HybridCrawler:
-    def __init__(self, output_dir: str, formats: List[str], max_workers: int = 40):
+    # 속도 제한 상태 출력 주기 (초)
+    RATE_MONITOR_INTERVAL = 30
+
+    def __init__(self, output_dir: str, formats: List[str], max_workers: int = 40,
+                 pw_processes: int = 1, manifest: Optional[CrawlManifest] = None,
+                 catalog_dates: Optional[Dict[str, str]] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 routing_history: Optional[RoutingHistory] = None,
+                 dead_letter: Optional[DeadLetterQueue] = None,
+                 retry_rounds: int = 3, retry_backoff: float = 10.0,
+                 transport: str = TRANSPORT_AIOHTTP,
+                 spec_store: Optional[SpecStore] = None,
+                 api_index: Optional[ApiIndex] = None,
+                 output_mode: str = 'tree'):
         self.output_dir = output_dir
         self.formats = formats
+        # 저장 방식 (tree: 문서별 JSON/XML 파일, packed: 유형/기관별 JSONL 세그먼트)
+        self.output_mode = output_mode
         self.max_workers = max_workers
-        
+        # Playwright 프로세스 수 (1: 단일 프로세스, 0: CPU/메모리 기준 자동, N: N개 샤드)
+        self.pw_processes = pw_processes
+        # 증분 크롤링 매니페스트와 문서번호별 카탈로그 update_date
+        self.manifest = manifest
+        self.catalog_dates = catalog_dates or {}
+        
+        # 문서별 성공 크롤러 이력 (smart 전략 라우팅, 모든 전략에서 기록)
+        self.routing_history = routing_history or RoutingHistory(
+            os.path.join(DataExporter.DATA_DIR, 'routing_history.json')
+        )
+
+        # 최종 실패 URL 보관소 (모든 전략에서 갱신, retry 전략의 재시도 대상)
+        self.dead_letter = dead_letter or DeadLetterQueue(
+            os.path.join(DataExporter.DATA_DIR, 'dead_letter.json')
+        )
+        # retry 전략의 재시도 라운드 수와 첫 백오프(초, 라운드마다 2배)
+        self.retry_rounds = max(1, retry_rounds)
+        self.retry_backoff = retry_backoff
+
+        # Swagger 명세 중복 제거 저장소 (None이면 결과마다 swagger_json 전체 저장)
+        self.spec_store = spec_store
+
+        # 파라미터/응답 필드/경로 역색인 (None이면 색인하지 않음, 저장 직후 문서별 갱신)
+        self.api_index = api_index
+
+        # 스캐너/BS/PW가 공유하는 호스트별 속도 제한
+        self.rate_limiter = rate_limiter or RateLimiter()
+
         # BS는 더 많은 동시 작업 가능
-        self.bs_crawler = BSCrawler(max_workers=max_workers * 2)
+        self.bs_crawler = BSCrawler(max_workers=max_workers * 2, rate_limiter=self.rate_limiter,
+                                    transport=transport)
         # Playwright는 리소스 제한
-        self.pw_crawler = PlaywrightCrawler(max_workers=max(max_workers // 2, 5))
+        self.pw_crawler = PlaywrightCrawler(max_workers=max(max_workers // 2, 5),
+                                            rate_limiter=self.rate_limiter)
+
+        # 결과 저장기 (run 실행 중에만 생성, 크롤링과 저장을 겹쳐 실행)
+        self.writer: Optional[AsyncResultWriter] = None
         
         # 통계 정보
         self.stats = {
@@ -42,34 +98,41 @@ class HybridCrawler:
             'url_timings': {}
         }
     
-    def save_results(self, results: List[Dict]) -> Dict:
-        """결과 저장"""
-        saved_info = {
-            'total_saved': 0,
-            'failed_saves': 0,
-            'saved_files': []
-        }
-        
-        os.makedirs(self.output_dir, exist_ok=True)
-        
-        for result in results:
-            if result.get('success') and result.get('data'):
-                api_id = result.get('api_id', 'unknown')
-                saved_files, save_errors = DataExporter.save_crawling_result(
-                    result['data'], 
-                    self.output_dir, 
-                    api_id, 
-                    self.formats
-                )
-                
-                if saved_files:
-                    saved_info['total_saved'] += 1
-                    saved_info['saved_files'].extend(saved_files)
-                else:
-                    saved_info['failed_saves'] += 1
-        
-        return saved_info
+    def record_saved(self, data: Dict, saved_files: List[str]):
+        """저장 완료 문서를 매니페스트와 역색인에 기록 (저장 스레드에서 호출)"""
+        if self.manifest is not None:
+            api_id = str(data.get('api_id', ''))
+            self.manifest.record(data, saved_files, update_date=self.catalog_dates.get(api_id, ''))
+        if self.api_index is not None:
+            self.api_index.add_saved(data, saved_files)
+
+    def print_rate_status(self):
+        """호스트별 현재 요청 속도와 대기 요청 수 출력"""
+        for host, info in self.rate_limiter.snapshot().items():
+            classes = ', '.join(
+                f"{name} {c['rate']}/s" for name, c in sorted(info['classes'].items())
+            )
+            print(f"   🚦 {host}: {info['rate']}/s (대기 {info['queue_depth']}건, 누적 {info['total']}건) [{classes}]")
+
+    async def monitor_rate(self):
+        """크롤링 중 주기적으로 속도 제한 상태 출력"""
+        while True:
+            await asyncio.sleep(self.RATE_MONITOR_INTERVAL)
+            self.print_rate_status()
+
+    def handle_result(self, result: Dict):
+        """URL별 결과 콜백 - 라우팅 이력 기록 후 저장기가 실행 중이면 바로 저장 큐에 전달"""
+        self.routing_history.record(result)
+        if self.writer is not None:
+            self.writer.submit(result)
     
+    async def crawl_dynamic(self, urls: List[str]) -> List[Dict]:
+        """Playwright 크롤링 (pw_processes 설정에 따라 단일/멀티 프로세스, start()로 띄운 브라우저가 있으면 재사용)"""
+        if self.pw_processes == 1 or self.pw_crawler.pool is not None:
+            return await self.pw_crawler.crawl_batch(urls, on_result=self.handle_result)
+        return await self.pw_crawler.crawl_batch_sharded(urls, processes=self.pw_processes,
+                                                         on_result=self.handle_result)
+
     async def crawl_with_fallback(self, urls: List[str]) -> List[Dict]:
         """
         BeautifulSoup 우선 시도, 실패시 Playwright로 fallback
@@ -83,7 +146,7 @@ class HybridCrawler:
         
         # 1단계: BeautifulSoup으로 시도
         print("\n🚀 1단계: BeautifulSoup 크롤링...")
-        bs_results, failed_urls = await self.bs_crawler.crawl_batch(urls)
+        bs_results, failed_urls = await self.bs_crawler.crawl_batch(urls, on_result=self.handle_result)
         
         # BS 결과 처리
         for result in bs_results:
@@ -91,7 +154,8 @@ class HybridCrawler:
             self.stats['bs_success'] += 1
             self.stats['url_timings'][result['url']] = {
                 'method': 'beautifulsoup',
-                'success': True
+                'success': True,
+                'timings': result.get('timings', {})
             }
         
         print(f"   ✅ BeautifulSoup 성공: {len(bs_results)}개")
@@ -100,7 +164,7 @@ class HybridCrawler:
         # 2단계: 실패한 URL을 Playwright로 재시도
         if failed_urls:
             print(f"\n🔄 2단계: Playwright로 {len(failed_urls)}개 재시도...")
-            pw_results = await self.pw_crawler.crawl_batch(failed_urls)
+            pw_results = await self.crawl_dynamic(failed_urls)
             
             for result in pw_results:
                 all_results.append(result)
@@ -111,7 +175,8 @@ class HybridCrawler:
                 
                 self.stats['url_timings'][result['url']] = {
                     'method': 'playwright',
-                    'success': result['success']
+                    'success': result['success'],
+                    'timings': result.get('timings', {})
                 }
             
             print(f"   ✅ Playwright 성공: {self.stats['pw_success']}개")
@@ -125,42 +190,26 @@ class HybridCrawler:
     
     async def smart_crawl(self, urls: List[str]) -> List[Dict]:
         """
-        URL 패턴 분석으로 스마트 크롤링
-        동적 콘텐츠가 예상되는 URL은 바로 Playwright 사용
+        크롤링 이력 기반 스마트 크롤링
+        - 이전에 BS로 성공한 문서 → BeautifulSoup (실패 시 Playwright)
+        - 이전에 Playwright가 필요했던 문서 → 바로 Playwright (reprobe_interval회마다 BS 재시도)
+        - 이력이 없는 문서 → BeautifulSoup 우선 후 Playwright
         """
-        # URL 패턴으로 분류
-        static_urls = []
-        dynamic_urls = []
-        
-        # 동적 콘텐츠 힌트 패턴
-        dynamic_patterns = [
-            'swagger-ui',
-            'api-docs',
-            'interactive',
-            'dynamic',
-            '/v2/api',
-            '/v3/api'
-        ]
-        
-        for url in urls:
-            # URL 패턴 체크
-            is_dynamic = any(pattern in url.lower() for pattern in dynamic_patterns)
-            
-            if is_dynamic:
-                dynamic_urls.append(url)
-            else:
-                static_urls.append(url)
-        
-        print(f"\n📊 스마트 크롤링 분석:")
-        print(f"   - 정적 예상 (BS): {len(static_urls)}개")
-        print(f"   - 동적 예상 (PW): {len(dynamic_urls)}개")
-        
+        static_urls, dynamic_urls, unknown_urls, reprobe_urls = self.routing_history.split(urls)
+
+        print(f"\n📊 스마트 크롤링 분석 (라우팅 이력):")
+        print(f"   - 정적 (BS): {len(static_urls)}개 (재확인 {len(reprobe_urls)}개 포함)")
+        print(f"   - 동적 (PW 직행): {len(dynamic_urls)}개")
+        print(f"   - 이력 없음 (BS 우선): {len(unknown_urls)}개")
+
         all_results = []
-        
-        # BeautifulSoup 배치
-        if static_urls:
+        start_time = time.time()
+
+        # BeautifulSoup 배치 (이력상 정적 + 이력 없음)
+        bs_targets = static_urls + unknown_urls
+        if bs_targets:
             print("\n🚀 정적 콘텐츠 크롤링 (BeautifulSoup)...")
-            bs_results, failed_urls = await self.bs_crawler.crawl_batch(static_urls)
+            bs_results, failed_urls = await self.bs_crawler.crawl_batch(bs_targets, on_result=self.handle_result)
             all_results.extend(bs_results)
             
             # 실패한 것은 dynamic_urls에 추가
@@ -168,11 +217,12 @@ class HybridCrawler:
             
             for result in bs_results:
                 self.stats['bs_success'] += 1
+            self.stats['bs_failed'] += len(failed_urls)
         
         # Playwright 배치
         if dynamic_urls:
             print(f"\n🔄 동적 콘텐츠 크롤링 (Playwright): {len(dynamic_urls)}개...")
-            pw_results = await self.pw_crawler.crawl_batch(dynamic_urls)
+            pw_results = await self.crawl_dynamic(dynamic_urls)
             all_results.extend(pw_results)
 
             for result in pw_results:
@@ -181,19 +231,77 @@ class HybridCrawler:
                 else:
                     self.stats['pw_failed'] += 1
 
+        self.stats['total_time'] = time.time() - start_time
+
         return all_results
 
+    async def retry_crawl(self, urls: List[str]) -> List[Dict]:
+        """
+        실패 URL 재시도 크롤링
+        - 세션과 브라우저/컨텍스트 풀을 한 번만 띄워 모든 라운드에서 재사용
+        - 라운드마다 smart_crawl로 재시도하고, 실패한 URL만 다음 라운드로 넘김
+        - 라운드 사이 대기 시간은 retry_backoff초부터 2배씩 증가
+        - 메소드별 성공/실패는 URL별 최종 결과로 집계하고, 라운드별 시도 수는 retry_rounds에 따로 기록
+        """
+        latest: Dict[str, Dict] = {}
+        pending = list(urls)
+        start_time = time.time()
+        method_keys = ('bs_success', 'bs_failed', 'pw_success', 'pw_failed')
+        method_base = {key: self.stats[key] for key in method_keys}
+        self.stats['retry_rounds'] = []
+
+        await self.bs_crawler.start()
+        try:
+            if self.pw_processes == 1:
+                await self.pw_crawler.start()
+
+            for round_num in range(1, self.retry_rounds + 1):
+                if round_num > 1:
+                    delay = self.retry_backoff * 2 ** (round_num - 2)
+                    print(f"\n⏳ {delay:.0f}초 후 재시도합니다...")
+                    await asyncio.sleep(delay)
+
+                print(f"\n🔁 재시도 라운드 {round_num}/{self.retry_rounds}: {len(pending)}개")
+                results = await self.smart_crawl(pending)
+                for result in results:
+                    latest[result['url']] = result
+
+                attempted = len(pending)
+                pending = [result['url'] for result in results if not result.get('success')]
+                self.stats['retry_rounds'].append({
+                    'round': round_num,
+                    'attempted': attempted,
+                    'success': attempted - len(pending),
+                    'failed': len(pending)
+                })
+                if not pending:
+                    break
+        finally:
+            await self.pw_crawler.close()
+            await self.bs_crawler.close()
+
+        # 라운드마다 누적된 메소드별 수를 버리고 URL별 최종 결과(마지막으로 처리한 메소드 기준)로 다시 집계
+        self.stats.update(method_base)
+        for result in latest.values():
+            prefix = 'bs' if result.get('method') == 'beautifulsoup' else 'pw'
+            self.stats[f"{prefix}_{'success' if result.get('success') else 'failed'}"] += 1
+
+        self.stats['total_time'] = time.time() - start_time
+        return list(latest.values())
+
     async def optimized_crawl(self, urls: List[str]) -> List[Dict]:
         """
-        최적화된 크롤링: LINK는 정적, 나머지는 동적
+        최적화된 크롤링: LINK는 정적, 나머지는 정적 우선 후 동적
         1. 모든 URL을 빠르게 스캔하여 LINK 타입 분류
         2. LINK 타입 → BeautifulSoup으로 크롤링
-        3. 나머지(Swagger, General) → Playwright로 크롤링
+        3. 나머지(Swagger, General) → BeautifulSoup 정적 경로 (swaggerJson, 상세기능 POST)
+        4. 정적 경로 실패 → Playwright로 크롤링
         """
         print(f"\n📊 크롤링 시작: 총 {len(urls)}개 URL")
         print(f"   - 1단계: LINK 타입 분류")
         print(f"   - 2단계: LINK → 정적 크롤링 (BS)")
-        print(f"   - 3단계: Swagger/General → 동적 크롤링 (PW)")
+        print(f"   - 3단계: Swagger/General → 정적 크롤링 (BS)")
+        print(f"   - 4단계: 정적 실패 → 동적 크롤링 (PW)")
 
         all_results = []
         start_time = time.time()
@@ -205,10 +313,13 @@ class HybridCrawler:
         print(f"   - LINK 타입: {len(link_urls)}개")
         print(f"   - Swagger/General: {len(other_urls)}개")
 
+        # Playwright로 보낼 URL
+        dynamic_urls = []
+
         # 2단계: LINK 타입은 BeautifulSoup으로 크롤링
         if link_urls:
             print(f"\n🚀 2단계: LINK 타입 크롤링 (BeautifulSoup): {len(link_urls)}개...")
-            bs_results, failed_urls = await self.bs_crawler.crawl_batch(link_urls)
+            bs_results, failed_urls = await self.bs_crawler.crawl_batch(link_urls, on_result=self.handle_result)
             all_results.extend(bs_results)
 
             for result in bs_results:
@@ -217,12 +328,25 @@ class HybridCrawler:
             # LINK인데 실패한 것도 동적으로 재시도
             if failed_urls:
                 print(f"   ⚠️  LINK 타입 실패: {len(failed_urls)}개 → Playwright로 재시도")
-                other_urls.extend(failed_urls)
+                dynamic_urls.extend(failed_urls)
 
-        # 3단계: 나머지는 Playwright로 크롤링
+        # 3단계: Swagger/General은 정적 경로 우선 시도 (브라우저 불필요)
         if other_urls:
-            print(f"\n🔄 3단계: Swagger/General 크롤링 (Playwright): {len(other_urls)}개...")
-            pw_results = await self.pw_crawler.crawl_batch(other_urls)
+            print(f"\n🚀 3단계: Swagger/General 크롤링 (BeautifulSoup): {len(other_urls)}개...")
+            bs_results, failed_urls = await self.bs_crawler.crawl_batch(other_urls, on_result=self.handle_result)
+            all_results.extend(bs_results)
+            dynamic_urls.extend(failed_urls)
+
+            for result in bs_results:
+                self.stats['bs_success'] += 1
+
+            print(f"   ✅ 정적 추출 성공: {len(bs_results)}개")
+            print(f"   ⚠️  정적 추출 실패: {len(failed_urls)}개 → Playwright로 재시도")
+
+        # 4단계: 정적 경로 실패분은 Playwright로 크롤링
+        if dynamic_urls:
+            print(f"\n🔄 4단계: Swagger/General 크롤링 (Playwright): {len(dynamic_urls)}개...")
+            pw_results = await self.crawl_dynamic(dynamic_urls)
             all_results.extend(pw_results)
 
             for result in pw_results:
@@ -282,8 +406,22 @@ class HybridCrawler:
                 'avg_time_per_url': round(self.stats['total_time'] / len(results), 2) if results else 0
             },
             'method_performance': method_performance,
+            # retry 전략의 라운드별 시도/성공/실패 수 (다른 전략은 빈 목록)
+            'retry_rounds': self.stats.get('retry_rounds', []),
             'api_types_found': api_types,
             'save_summary': saved_info,
+            'rate_limiter': self.rate_limiter.snapshot(),
+            # 단계별 p50/p95/p99와 가장 느린 URL
+            'timing_summary': summarize_timings(results),
+            # 실패 URL 보관소 오류 분류별 URL 수 (--retry-failed 대상)
+            'dead_letter': self.dead_letter.summary(),
+            # 명세 파일 기록/재사용 수와 엔드포인트 추출 캐시 적중 수
+            'spec_store': {
+                **(self.spec_store.stats if self.spec_store is not None else {}),
+                'endpoint_cache': dict(ENDPOINT_CACHE.stats)
+            },
+            # 역색인에 반영한 문서 수
+            'api_index': dict(self.api_index.stats) if self.api_index is not None else {},
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'failed_urls': [
                 r['url'] for r in results 
@@ -304,7 +442,8 @@ class HybridCrawler:
 
         Args:
             urls: 크롤링할 URL 리스트
-            strategy: 'optimized' (LINK 정적, 나머지 동적) or 'fallback' (BS 우선) or 'smart' (패턴 분석)
+            strategy: 'optimized' (LINK 정적, 나머지 동적) or 'fallback' (BS 우선) or 'smart' (라우팅 이력)
+                      or 'retry' (실패 URL 재시도)
         """
         print(f"\n{'='*60}")
         print(f"🤖 하이브리드 크롤러 시작")
@@ -312,19 +451,49 @@ class HybridCrawler:
         print(f"   URL 수: {len(urls)}")
         print(f"   출력 디렉토리: {self.output_dir}")
         print(f"   파일 형식: {', '.join(self.formats)}")
+        print(f"   저장 방식: {self.output_mode}")
+        print(f"   HTTP 전송: {self.bs_crawler.transport}")
         print(f"{'='*60}")
 
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # 결과 저장기 시작 (URL별 결과가 나오는 즉시 백그라운드 스레드에서 저장)
+        self.writer = AsyncResultWriter(
+            self.formats,
+            on_saved=self.record_saved if self.manifest is not None or self.api_index is not None else None,
+            spec_store=self.spec_store,
+            output_mode=self.output_mode
+        )
+        self.writer.start()
+
+        monitor = asyncio.create_task(self.monitor_rate()) if self.rate_limiter.enabled else None
+
         # 크롤링 실행
-        if strategy == 'optimized':
-            results = await self.optimized_crawl(urls)
-        elif strategy == 'smart':
-            results = await self.smart_crawl(urls)
-        else:  # fallback
-            results = await self.crawl_with_fallback(urls)
-        
-        # 결과 저장
-        print("\n💾 결과 저장 중...")
-        saved_info = self.save_results(results)
+        try:
+            if strategy == 'optimized':
+                results = await self.optimized_crawl(urls)
+            elif strategy == 'smart':
+                results = await self.smart_crawl(urls)
+            elif strategy == 'retry':
+                results = await self.retry_crawl(urls)
+            else:  # fallback
+                results = await self.crawl_with_fallback(urls)
+        finally:
+            if monitor is not None:
+                monitor.cancel()
+            # 남은 결과 저장 마무리
+            print("\n💾 결과 저장 마무리 중...")
+            saved_info = await self.writer.close()
+            self.writer = None
+            if self.manifest is not None:
+                self.manifest.close()
+            if self.api_index is not None:
+                self.api_index.close()
+            self.routing_history.save()
+
+        # 실패 URL 보관소 갱신 (성공은 제거, 실패는 시도 횟수 증가)
+        self.dead_letter.update(results)
+        self.dead_letter.save()
         
         # 요약 리포트 생성
         summary = self.generate_summary_report(results, saved_info)
@@ -364,6 +533,11 @@ class HybridCrawler:
         print(f"      - 성공: {mp['playwright']['success']}개")
         print(f"      - 실패: {mp['playwright']['failed']}개")
         print(f"      - 성공률: {mp['playwright']['success_rate']}")
+
+        if summary.get('retry_rounds'):
+            print(f"\n🔁 재시도 라운드:")
+            for r in summary['retry_rounds']:
+                print(f"   - {r['round']}회차: 시도 {r['attempted']}개, 성공 {r['success']}개, 실패 {r['failed']}개")
         
         if summary['api_types_found']:
             print(f"\n📦 API 타입별 분포:")
@@ -375,6 +549,24 @@ class HybridCrawler:
         print(f"   - 저장 성공: {ss['total_saved']}개")
         print(f"   - 저장 실패: {ss['failed_saves']}개")
         print(f"   - 생성 파일: {len(ss['saved_files'])}개")
+
+        ts = summary.get('timing_summary') or {}
+        if ts.get('phases'):
+            print(f"\n⏱️  단계별 소요 시간 (초, p50 / p95 / p99):")
+            for phase, p in ts['phases'].items():
+                print(f"   - {phase:<10} {p['p50']:>7.3f} / {p['p95']:>7.3f} / {p['p99']:>7.3f}  (합계 {p['total']:.1f}, {p['count']}건)")
+            print(f"\n🐢 가장 느린 URL:")
+            for item in ts['slowest_urls'][:5]:
+                top_phase = max(
+                    ((k, v) for k, v in item['timings'].items() if k != 'total'),
+                    key=lambda kv: kv[1], default=('-', 0)
+                )
+                print(f"   - {item['total']:.2f}초 [{item['method']}] {item['url']} (최대 단계: {top_phase[0]} {top_phase[1]:.2f}초)")
+
+        if summary.get('rate_limiter'):
+            print(f"\n🚦 호스트별 요청 수:")
+            for host, info in summary['rate_limiter'].items():
+                print(f"   - {host}: {info['total']}건")
         
         if summary['failed_urls']:
             print(f"\n⚠️ 실패 URL: {len(summary['failed_urls'])}개")
@@ -385,6 +577,20 @@ class HybridCrawler:
                 for url in summary['failed_urls'][:5]:
                     print(f"   - {url}")
                 print(f"   ... 외 {len(summary['failed_urls'])-5}개")
+
+        sp = summary.get('spec_store') or {}
+        if 'written' in sp:
+            print(f"\n📚 명세 저장소: 신규 {sp['written']}개, 재사용 {sp['reused']}개 "
+                  f"(엔드포인트 캐시 적중 {sp['endpoint_cache']['hits']}회)")
+
+        if summary.get('api_index'):
+            print(f"\n🔎 API 역색인: {summary['api_index']['indexed']}개 문서 갱신 "
+                  f"(python -m util.api_index query param <이름>)")
+
+        if summary.get('dead_letter'):
+            dl = summary['dead_letter']
+            print(f"\n📮 실패 URL 보관소: {sum(dl.values())}개 ("
+                  + ', '.join(f"{k} {v}" for k, v in sorted(dl.items())) + ") - --retry-failed로 재시도")
         
         print(f"\n✅ 요약 파일 저장: {self.output_dir}/crawling_summary.json")
         print(f"{'='*60}\n")
@@ -400,13 +606,15 @@ def generate_urls(start_num: int, end_num: int) -> List[str]:
     base_url = "https://www.data.go.kr/data/{}/openapi.do"
     return [base_url.format(num) for num in range(start_num, end_num + 1)]
 
-def check_metadata_and_get_valid_numbers(start_num: int, end_num: int) -> List[int]:
-    """메타데이터 스캔으로 유효 번호 확인"""
+def check_metadata_and_get_valid_numbers(start_num: int, end_num: int,
+                                         rate_limiter: Optional[RateLimiter] = None) -> Tuple[List[int], Dict[int, Dict]]:
+    """메타데이터 스캔으로 유효 번호 확인 (번호별 메타데이터 details 함께 반환)"""
     print(f"\n🔍 메타데이터 스캔 시작: {start_num} ~ {end_num}")
     scanner = OpenAPIMetadataScanner(
         start_num=start_num, 
         end_num=end_num, 
-        max_workers=150
+        max_workers=150,
+        rate_limiter=rate_limiter
     )
     results = scanner.scan_range()
     scanner.save_results()
@@ -414,7 +622,7 @@ def check_metadata_and_get_valid_numbers(start_num: int, end_num: int) -> List[i
     
     valid_numbers = results['data_numbers']
     print(f"\n✅ 메타데이터 스캔 완료! 유효 번호: {len(valid_numbers)}개")
-    return valid_numbers
+    return valid_numbers, results['details']
 
 async def main():
     parser = argparse.ArgumentParser(
@@ -428,7 +636,7 @@ async def main():
   # Fallback 전략 (모든 URL을 BS 우선 시도)
   python main_openapi.py -s 1000 -e 1100 --strategy fallback
 
-  # Smart 전략 (URL 패턴 분석)
+  # Smart 전략 (이전 실행의 성공 크롤러 이력으로 라우팅)
   python main_openapi.py -s 1000 -e 1100 --strategy smart
 
   # 메타데이터 스캔 건너뛰기
@@ -436,58 +644,191 @@ async def main():
 
   # 특정 형식만 저장
   python main_openapi.py -s 1000 -e 1100 --formats json xml
+
+  # 분석용 Parquet 테이블(apis/endpoints/parameters/responses) 저장 (pyarrow 필요)
+  python main_openapi.py -s 1000 -e 1100 --formats json parquet
+
+  # Playwright 단계를 여러 프로세스로 분산 (0: 자동)
+  python main_openapi.py -s 1000 -e 1100 --pw-processes 0
+
+  # 증분 크롤링 (카탈로그 수정일이 바뀐 문서만)
+  python main_openapi.py -s 1000 -e 1100 --incremental
+
+  # 호스트당 초당 20건, 상세기능 POST는 초당 5건으로 제한 (스캐너/BS/PW 합산)
+  python main_openapi.py -s 1000 -e 1100 --rate 20 --class-rate detail=5
+
+  # BS 요청을 httpx(HTTP/2 다중화)로 전송 (httpx[http2] 필요)
+  python main_openapi.py -s 1000 -e 1100 --transport httpx
+
+  # 같은 Swagger 명세는 data/specs/{해시}.json에 한 번만 저장하고 결과에는 해시 참조만 기록
+  python main_openapi.py -s 1000 -e 1100 --spec-store
+
+  # 저장 직후 파라미터/응답 필드/경로 역색인 갱신 (data/api_index.sqlite)
+  python main_openapi.py -s 1000 -e 1100 --api-index
+  python -m util.api_index query param bidNtceNo
+
+  # 문서별 파일 대신 유형/기관별 JSONL 세그먼트에 저장 (data/packed), 필요 시 기존 구조로 내보내기
+  python main_openapi.py -s 1000 -e 1100 --output-mode packed
+  python -m util.packed_store export --formats json xml
+
+  # 이전 실행에서 실패한 URL만 재시도 (메타데이터 스캔 없음, 최대 3라운드)
+  python main_openapi.py --retry-failed --retry-rounds 3 --retry-backoff 10
         """
     )
 
-    parser.add_argument('-s', '--start', type=int, required=True,
-                       help='시작 문서 번호')
-    parser.add_argument('-e', '--end', type=int, required=True,
-                       help='끝 문서 번호')
+    parser.add_argument('-s', '--start', type=int,
+                       help='시작 문서 번호 (--retry-failed가 아니면 필수)')
+    parser.add_argument('-e', '--end', type=int,
+                       help='끝 문서 번호 (--retry-failed가 아니면 필수)')
     parser.add_argument('-o', '--output-dir',
                        default='./data',
                        help='출력 디렉토리 (기본값: ./data)')
     parser.add_argument('--formats', nargs='+',
                        default=['json', 'xml', 'csv'],
-                       choices=['json', 'xml', 'csv'],
-                       help='저장할 파일 형식 (기본값: 모든 형식)')
+                       choices=['json', 'xml', 'csv', 'parquet'],
+                       help='저장할 파일 형식 (기본값: json xml csv, parquet은 pyarrow 필요)')
+    parser.add_argument('--output-mode', choices=OUTPUT_MODES, default='tree',
+                       help='저장 방식 (tree: 문서별 JSON/XML 파일, packed: 유형/기관별 JSONL 세그먼트 + 오프셋 색인)')
     parser.add_argument('-w', '--workers', type=int, default=30,
                        help='동시 작업자 수 (기본값: 30)')
     parser.add_argument('--skip-metadata', action='store_true',
                        help='메타데이터 스캔 건너뛰기')
     parser.add_argument('--strategy', choices=['optimized', 'fallback', 'smart'],
                        default='optimized',
-                       help='크롤링 전략 (optimized: LINK정적/나머지동적, fallback: BS우선, smart: 패턴분석)')
+                       help='크롤링 전략 (optimized: LINK정적/나머지동적, fallback: BS우선, smart: 라우팅 이력)')
+    parser.add_argument('--pw-processes', type=int, default=1,
+                       help='Playwright 프로세스 수 (기본값: 1, 0이면 CPU/메모리 기준 자동)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='매니페스트 기준 카탈로그 수정일이 바뀐 문서만 크롤링')
+    parser.add_argument('--manifest',
+                       default=os.path.join(DataExporter.DATA_DIR, 'crawl_manifest.jsonl'),
+                       help='증분 크롤링 매니페스트 경로 (기본값: ./data/crawl_manifest.jsonl)')
+    parser.add_argument('--routing-history',
+                       default=os.path.join(DataExporter.DATA_DIR, 'routing_history.json'),
+                       help='문서별 성공 크롤러 이력 경로 (기본값: ./data/routing_history.json)')
+    parser.add_argument('--reprobe-interval', type=int, default=5,
+                       help='smart 전략에서 Playwright 직행 문서를 BS로 다시 확인하는 실행 주기 (기본값: 5)')
+    parser.add_argument('--rate', type=float, default=0,
+                       help='호스트당 초당 요청 수 (스캐너/BS/PW 합산, 기본값: 0 = 제한 없음)')
+    parser.add_argument('--class-rate', action='append', default=[], metavar='CLASS=RATE',
+                       help='엔드포인트 클래스별 초당 요청 수 (catalog, page, detail, asset / 반복 지정 가능)')
+    parser.add_argument('--transport', choices=TRANSPORTS, default=TRANSPORT_AIOHTTP,
+                       help='BS HTTP 전송 방식 (aiohttp: HTTP/1.1 기본, httpx: HTTP/2 다중화, httpx[http2] 필요)')
+    parser.add_argument('--spec-store', action='store_true',
+                       help='Swagger 명세를 data/specs/{해시}.json에 한 번만 저장하고 결과에는 참조만 기록')
+    parser.add_argument('--api-index', action='store_true',
+                       help='저장한 결과를 data/api_index.sqlite 역색인에 바로 반영 (python -m util.api_index로 조회)')
+    parser.add_argument('--retry-failed', action='store_true',
+                       help='실패 URL 보관소의 URL만 재시도 (메타데이터 스캔 생략)')
+    parser.add_argument('--dead-letter',
+                       default=os.path.join(DataExporter.DATA_DIR, 'dead_letter.json'),
+                       help='실패 URL 보관소 경로 (기본값: ./data/dead_letter.json)')
+    parser.add_argument('--retry-rounds', type=int, default=3,
+                       help='재시도 라운드 수 (기본값: 3)')
+    parser.add_argument('--retry-backoff', type=float, default=10,
+                       help='재시도 라운드 사이 첫 대기 시간(초), 라운드마다 2배 (기본값: 10)')
+    parser.add_argument('--max-attempts', type=int, default=5,
+                       help='이 횟수 이상 실패한 URL은 재시도하지 않음 (기본값: 5, 0이면 제한 없음)')
     
     args = parser.parse_args()
     
     # 유효성 검사
-    if args.start > args.end:
+    if not args.retry_failed and (args.start is None or args.end is None):
+        parser.error('-s/--start와 -e/--end가 필요합니다. (--retry-failed 제외)')
+
+    if not args.retry_failed and args.start > args.end:
         print("❌ 오류: 시작 번호가 끝 번호보다 클 수 없습니다.")
         return
     
     if args.workers < 5 or args.workers > 40:
         print(f"⚠️ 경고: 작업자 수를 5-40 사이로 조정합니다. (입력값: {args.workers})")
         args.workers = max(5, min(40, args.workers))
+
+    if 'parquet' in args.formats:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("❌ 오류: parquet 형식은 pyarrow가 필요합니다. (pip install pyarrow)")
+            return
     
+    if args.transport != TRANSPORT_AIOHTTP:
+        try:
+            require_httpx()
+        except ImportError as e:
+            print(f"❌ 오류: {e}")
+            return
+
+    try:
+        rate_limiter = RateLimiter(host_rate=args.rate, class_rates=parse_class_rates(args.class_rate))
+    except ValueError as e:
+        print(f"❌ 오류: {e}")
+        return
+
+    manifest = CrawlManifest(args.manifest)
+    dead_letter = DeadLetterQueue(args.dead_letter)
+    catalog_dates = {}
+    strategy = args.strategy
+
     # URL 생성
-    if args.skip_metadata:
+    if args.retry_failed:
+        urls = dead_letter.pending_urls(args.max_attempts)
+        print(f"\n🔁 실패 URL 재시도: {len(urls)}개 (보관 {len(dead_letter.entries)}개, "
+              f"최대 시도 {args.max_attempts or '제한 없음'})")
+        for error_class, count in sorted(dead_letter.summary().items()):
+            print(f"   - {error_class}: {count}개")
+        if not urls:
+            print("✅ 재시도할 URL이 없습니다. 종료합니다.")
+            return
+        strategy = 'retry'
+    elif args.skip_metadata:
         print("⚠️ 메타데이터 스캔을 건너뛰고 모든 번호를 크롤링합니다.")
+        if args.incremental:
+            print("⚠️ 메타데이터 없이 증분 크롤링을 할 수 없어 전체 크롤링합니다.")
         urls = generate_urls(args.start, args.end)
     else:
-        valid_numbers = check_metadata_and_get_valid_numbers(args.start, args.end)
+        valid_numbers, details = check_metadata_and_get_valid_numbers(args.start, args.end, rate_limiter)
         if not valid_numbers:
             print("❌ 유효한 번호가 없습니다. 종료합니다.")
             return
+        catalog_dates = {
+            str(num): (details.get(num) or {}).get('update_date', '')
+            for num in valid_numbers
+        }
+
+        if args.incremental:
+            changed_numbers = manifest.filter_changed(valid_numbers, details)
+            print(f"\n🔁 증분 크롤링: 변경/신규 {len(changed_numbers)}개, "
+                  f"변경 없음 {len(valid_numbers) - len(changed_numbers)}개 건너뜀")
+            if not changed_numbers:
+                print("✅ 변경된 문서가 없습니다. 종료합니다.")
+                return
+            valid_numbers = changed_numbers
+
         urls = generate_urls_from_numbers(valid_numbers)
     
+    # 명세 저장소를 쓸 때만 명세 해시 계산과 엔드포인트 캐시 사용 (샤드 프로세스에도 전달)
+    ENDPOINT_CACHE.enabled = args.spec_store
+
     # 크롤러 실행
     crawler = HybridCrawler(
         output_dir=args.output_dir,
         formats=args.formats,
-        max_workers=args.workers
+        max_workers=args.workers,
+        pw_processes=args.pw_processes,
+        manifest=manifest,
+        catalog_dates=catalog_dates,
+        rate_limiter=rate_limiter,
+        routing_history=RoutingHistory(args.routing_history, reprobe_interval=max(1, args.reprobe_interval)),
+        dead_letter=dead_letter,
+        retry_rounds=args.retry_rounds,
+        retry_backoff=args.retry_backoff,
+        transport=args.transport,
+        spec_store=SpecStore(DataExporter.spec_dir()) if args.spec_store else None,
+        api_index=ApiIndex(DataExporter.api_index_path()) if args.api_index else None,
+        output_mode=args.output_mode
     )
     
-    await crawler.run(urls, strategy=args.strategy)
+    await crawler.run(urls, strategy=strategy)
 
 if __name__ == '__main__':
     asyncio.run(main())
\ No newline at end of file
@@ -3,19 +3,106 @@ Playwright 기반 동적 콘텐츠 크롤러
 """
 
 import asyncio
-from playwright.async_api import async_playwright, Page, Browser
-import re
-import json
+import multiprocessing
+import os
+import queue
+import time
+from collections import Counter
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Route
 from datetime import datetime
-from typing import Dict, List, Optional
-from util.text_cleaner import clean_text, clean_all_text
-from util.common import SwaggerProcessor, ApiIdExtractor
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from util.text_cleaner import PRECLEANED_KEYS, clean_text, clean_all_text
+from util.common import SwaggerProcessor, GeneralApiProcessor, ApiIdExtractor, DETAIL_FUNCTION_PATH
 from util.table_extractor import extract_table_info_pw
+from util.swagger_extractor import extract_swagger_json_from_html
+from util.browser_pool import BrowserContextPool
+from util.resource_blocker import ResourceBlockProfile
+from util.rate_limiter import RateLimiter
+from util.timing import PhaseTimer
+from util.spec_store import ENDPOINT_CACHE
+
+# 페이지 타입별 준비 완료 조건 (가장 먼저 충족되는 조건이 승리)
+READY_FUNCTION_SWAGGER = "() => typeof swaggerJson !== 'undefined' && swaggerJson !== null"
+READY_SELECTOR_GENERAL = '#open-api-detail-result'
+# LINK 타입은 테이블 정보만 수집하므로 'API 유형' 행이 LINK면 바로 준비 완료
+READY_FUNCTION_LINK = '''() => Array.from(document.querySelectorAll('table.dataset-table th')).some(
+    th => th.textContent.trim() === 'API 유형' && /LINK/i.test((th.nextElementSibling || {}).textContent || ''))'''
+# 데이터셋 테이블은 모든 페이지의 정적 HTML에 있으므로 경쟁에 넣지 않고, 시한 내 아무 조건도 충족되지 않았을 때만 확인
+READY_SELECTOR_TABLE = 'table.dataset-table'
+
+# 샤드 프로세스 수 자동 결정용 메모리 추정치 (MB)
+BROWSER_BASE_MEMORY_MB = 400
+CONTEXT_MEMORY_MB = 120
 
 class PlaywrightCrawler:
-    def __init__(self, max_workers: int = 10):
+    # 준비 조건 전체 대기 시한 (ms)
+    READY_TIMEOUT_MS = 5000
+    # 일반 API 상세 영역 추가 대기 시한 (ms)
+    DETAIL_WAIT_MS = 1000
+    # 일반 API 페이지에서 스크립트로 그려지는 요청변수 표 대기 시한 (ms, 상세기능 POST 결과가 없을 때만)
+    PARAM_TABLE_WAIT_MS = 5000
+    # 페이지당 상세기능 POST 동시 요청 수
+    DETAIL_CONCURRENCY = 6
+    # evaluate 한 번에 처리할 상세기능 수 (evaluate가 실패해도 이 묶음의 결과만 잃음)
+    DETAIL_CHUNK_SIZE = 12
+
+    def __init__(self, max_workers: int = 10, context_max_uses: int = 50,
+                 block_profile: Optional[ResourceBlockProfile] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         self.max_workers = max_workers
         self.semaphore = asyncio.Semaphore(max_workers)
+        # 컨텍스트 재사용 횟수 (초과 시 컨텍스트 재생성)
+        self.context_max_uses = context_max_uses
+        self.context_options = {
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'viewport': {'width': 1920, 'height': 1080}
+        }
+        # 리소스 차단 프로필 (None이면 기본 프로필 사용)
+        self.block_profile = block_profile or ResourceBlockProfile()
+        # 공유 rate limiter (goto, 페이지 내 fetch 등 모든 요청이 라우팅 단계에서 토큰 획득)
+        self.rate_limiter = rate_limiter
+        # start()로 띄운 브라우저와 컨텍스트 풀 (없으면 배치마다 새로 띄움)
+        self._playwright = None
+        self.browser: Optional[Browser] = None
+        self.pool: Optional[BrowserContextPool] = None
+
+    async def wait_for_ready(self, page: Page, timeout: Optional[int] = None) -> Optional[str]:
+        """페이지 타입별 준비 조건을 경쟁시켜 가장 먼저 충족된 타입 반환
+
+        Returns:
+            'swagger' | 'general' | 'link', 시한 내 아무 조건도 충족되지 않으면
+            데이터셋 테이블이 있을 때 'table', 없으면 None
+        """
+        timeout = timeout or self.READY_TIMEOUT_MS
+        waiters = {
+            asyncio.ensure_future(
+                page.wait_for_function(READY_FUNCTION_SWAGGER, timeout=timeout)
+            ): 'swagger',
+            asyncio.ensure_future(
+                page.wait_for_selector(READY_SELECTOR_GENERAL, state='attached', timeout=timeout)
+            ): 'general',
+            asyncio.ensure_future(
+                page.wait_for_function(READY_FUNCTION_LINK, timeout=timeout)
+            ): 'link',
+        }
+
+        ready = None
+        pending = set(waiters)
+        try:
+            while pending and ready is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        ready = waiters[task]
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if ready is None and await page.query_selector(READY_SELECTOR_TABLE):
+            ready = 'table'
+        return ready
 
     async def extract_swagger_json_pw(self, page: Page) -> Optional[Dict]:
         """Playwright로 Swagger JSON 추출 (동적 렌더링 후)"""
@@ -41,36 +128,19 @@ class PlaywrightCrawler:
         if swagger_json and isinstance(swagger_json, dict):
             return swagger_json
         
-        # 2. 백틱(`)으로 둘러싸인 JSON 문자열만 정확히 추출
-        scripts = await page.query_selector_all('script')
-        for script in scripts:
-            try:
-                content = await script.inner_text()
-                if not content:
-                    continue
-                
-                # var swaggerJson = `{...}` 패턴만 정확히 매칭
-                pattern = r'var\s+swaggerJson\s*=\s*`(\{[\s\S]*?\})`'
-                match = re.search(pattern, content)
-                
-                if match:
-                    try:
-                        json_str = match.group(1)
-                        # JSON 문자열 정리 (개행 문자 등 처리)
-                        json_str = re.sub(r'\s+', ' ', json_str)
-                        swagger_json = json.loads(json_str)
-                        if swagger_json:
-                            return swagger_json
-                    except json.JSONDecodeError as e:
-                        print(f"JSON 파싱 오류: {e}")
-                        continue
-            except:
-                continue
+        # 2. 페이지 HTML 원문에서 swaggerJson 대입문 직접 디코딩 (script 태그별 왕복 없이 1회 조회)
+        swagger_json = extract_swagger_json_from_html(await page.content())
+        if swagger_json:
+            return swagger_json
         
         return None
 
-    async def extract_general_api_info_pw(self, page: Page) -> Dict:
-        """동적 렌더링된 일반 API 정보 추출"""
+    async def extract_general_api_info_pw(self, page: Page, ready: Optional[str] = None) -> Dict:
+        """동적 렌더링된 일반 API 정보 추출
+
+        Args:
+            ready: wait_for_ready 결과 ('general'이면 요청변수 표를 PARAM_TABLE_WAIT_MS까지 대기)
+        """
         general_api_info = {}
 
         try:
@@ -112,198 +182,192 @@ class PlaywrightCrawler:
                 }''')
 
                 if post_request_params and len(post_request_params) > 0:
-                    # 응답 데이터만 저장할 배열
-                    response_data_list = []
-                    endpoints_list = []
-
-                    # 각 항목에 대해 POST 요청 수행
-                    for item in post_request_params:
-                        try:
-                            # HTML을 즉시 JSON으로 파싱
-                            response_data = await page.evaluate('''async (dataObj) => {
-                                try {
-                                    const response = await fetch('https://www.data.go.kr/tcs/dss/selectApiDetailFunction.do', {
-                                        method: 'POST',
-                                        headers: {
-                                            'Content-Type': 'application/x-www-form-urlencoded',
-                                        },
-                                        body: new URLSearchParams({
-                                            oprtinSeqNo: dataObj.oprtinSeqNo,
-                                            publicDataDetailPk: dataObj.publicDataDetailPk,
-                                            publicDataPk: dataObj.publicDataPk
-                                        }).toString()
+                    # 상세기능 POST 요청을 페이지 내부에서 동시 실행 (페이지당 동시 요청 수 제한)
+                    # DETAIL_CHUNK_SIZE개씩 나누어 evaluate하고, 결과 배열 순서는 post_request_params 순서와 동일
+                    detail_pool_js = '''async ({items, concurrency, url}) => {
+                    // 상세기능 HTML 조각을 JSON으로 파싱
+                    const parseDetail = (html) => {
+                        // DOM 파서를 사용하여 HTML을 파싱
+                        const parser = new DOMParser();
+                        const doc = parser.parseFromString(html, 'text/html');
+                        const apiDetailDiv = doc.getElementById('open-api-detail-result');
+
+                        if (apiDetailDiv) {
+                            // 테이블을 JSON으로 파싱
+                            const tables = apiDetailDiv.querySelectorAll('table');
+                            const parsedData = {
+                                endpoint: {
+                                    "요청변수(Request Parameter)": null,
+                                    "출력결과(Response Element)": null
+                                }
+                            };
+
+                            // 각 테이블 파싱
+                            tables.forEach((table, tableIndex) => {
+                                const tableData = [];
+
+                                // 1. 헤더 추출 (저장하지 않지만 매핑을 위해 파싱)
+                                const headers = [];
+                                const headerRow = table.querySelector('tr');
+                                if (headerRow) {
+                                    const headerCells = headerRow.querySelectorAll('th');
+                                    headerCells.forEach(th => {
+                                        headers.push(th.textContent.trim());
                                     });
+                                }
 
-                                    if (response.ok) {
-                                        const html = await response.text();
-
-                                        // DOM 파서를 사용하여 HTML을 파싱
-                                        const parser = new DOMParser();
-                                        const doc = parser.parseFromString(html, 'text/html');
-                                        const apiDetailDiv = doc.getElementById('open-api-detail-result');
-
-                                        if (apiDetailDiv) {
-                                            // 테이블을 JSON으로 파싱
-                                            const tables = apiDetailDiv.querySelectorAll('table');
-                                            const parsedData = {
-                                                endpoint: {
-                                                    "요청변수(Request Parameter)": null,
-                                                    "출력결과(Response Element)": null
-                                                }
-                                            };
-
-                                            // 각 테이블 파싱
-                                            tables.forEach((table, tableIndex) => {
-                                                const tableData = [];
-
-                                                // 1. 헤더 추출 (저장하지 않지만 매핑을 위해 파싱)
-                                                const headers = [];
-                                                const headerRow = table.querySelector('tr');
-                                                if (headerRow) {
-                                                    const headerCells = headerRow.querySelectorAll('th');
-                                                    headerCells.forEach(th => {
-                                                        headers.push(th.textContent.trim());
-                                                    });
-                                                }
-
-                                                // 2. 데이터 행 추출 (두 번째 tr부터)
-                                                const dataRows = table.querySelectorAll('tr');
-                                                for (let i = 1; i < dataRows.length; i++) {  // 첫 행(헤더) 제외
-                                                    const row = dataRows[i];
-                                                    const cells = row.querySelectorAll('td');
-
-                                                    if (cells.length > 0) {
-                                                        const rowData = {};
-
-                                                        // 각 셀을 해당 헤더와 매핑
-                                                        cells.forEach((cell, cellIndex) => {
-                                                            const headerName = headers[cellIndex] || `column_${cellIndex}`;
-                                                            let cellValue = cell.textContent.trim();
-
-                                                            // 전화번호 특별 처리
-                                                            if (headerName.includes('전화번호')) {
-                                                                const telElem = cell.querySelector('#telNoDiv, #telNo');
-                                                                if (telElem) {
-                                                                    cellValue = telElem.textContent.trim();
-                                                                }
-                                                            }
-
-                                                            // 링크 처리
-                                                            if (!cellValue || cellValue === '') {
-                                                                const link = cell.querySelector('a');
-                                                                if (link) {
-                                                                    cellValue = link.textContent.trim();
-                                                                    rowData[`${headerName}_link`] = link.href;
-                                                                }
-                                                            }
-
-                                                            rowData[headerName] = cellValue;
-                                                        });
-
-                                                        // 빈 행이 아닌 경우만 추가
-                                                        if (Object.keys(rowData).length > 0) {
-                                                            tableData.push(rowData);
-                                                        }
-                                                    }
+                                // 2. 데이터 행 추출 (두 번째 tr부터)
+                                const dataRows = table.querySelectorAll('tr');
+                                for (let i = 1; i < dataRows.length; i++) {  // 첫 행(헤더) 제외
+                                    const row = dataRows[i];
+                                    const cells = row.querySelectorAll('td');
+
+                                    if (cells.length > 0) {
+                                        const rowData = {};
+
+                                        // 각 셀을 해당 헤더와 매핑
+                                        cells.forEach((cell, cellIndex) => {
+                                            const headerName = headers[cellIndex] || `column_${cellIndex}`;
+                                            let cellValue = cell.textContent.trim();
+
+                                            // 전화번호 특별 처리
+                                            if (headerName.includes('전화번호')) {
+                                                const telElem = cell.querySelector('#telNoDiv, #telNo');
+                                                if (telElem) {
+                                                    cellValue = telElem.textContent.trim();
                                                 }
+                                            }
 
-                                                // 테이블에 데이터가 있는 경우 첫 번째/두 번째 구분하여 저장
-                                                if (tableData.length > 0) {
-                                                    if (tableIndex === 0) {
-                                                        parsedData.endpoint["요청변수(Request Parameter)"] = tableData;
-                                                    } else if (tableIndex === 1) {
-                                                        parsedData.endpoint["출력결과(Response Element)"] = tableData;
-                                                    }
-                                                }
-                                            });
-
-                                            // div.box-gray > ul.dot-list 파싱
-                                            const boxGray = apiDetailDiv.querySelector('div.box-gray');
-                                            if (boxGray) {
-                                                const dotList = boxGray.querySelector('ul.dot-list');
-                                                if (dotList) {
-                                                    const endpointData = {};
-                                                    const listItems = dotList.querySelectorAll('li');
-
-                                                    listItems.forEach(li => {
-                                                        const strongTag = li.querySelector('strong');
-                                                        if (strongTag) {
-                                                            const key = strongTag.textContent.trim();
-                                                            // strong 태그를 제거한 나머지 텍스트가 값
-                                                            const value = li.textContent.replace(strongTag.textContent, '').trim();
-                                                            endpointData[key] = value;
-                                                        }
-                                                    });
-
-                                                    // endpoint 기본 정보를 기존 endpoint 객체에 병합
-                                                    if (Object.keys(endpointData).length > 0) {
-                                                        Object.assign(parsedData.endpoint, endpointData);
-                                                    }
+                                            // 링크 처리
+                                            if (!cellValue || cellValue === '') {
+                                                const link = cell.querySelector('a');
+                                                if (link) {
+                                                    cellValue = link.textContent.trim();
+                                                    rowData[`${headerName}_link`] = link.href;
                                                 }
                                             }
 
-                                            return parsedData;
-                                        } else {
-                                            console.log('open-api-detail-result를 찾지 못함');
-                                            return null;
+                                            rowData[headerName] = cellValue;
+                                        });
+
+                                        // 빈 행이 아닌 경우만 추가
+                                        if (Object.keys(rowData).length > 0) {
+                                            tableData.push(rowData);
                                         }
-                                    } else {
-                                        console.error('응답 실패:', response.status);
-                                        return null;
                                     }
-                                } catch (e) {
-                                    console.error('Fetch 에러:', e);
-                                    return null;
                                 }
-                            }''', item)
-
-                            # api_details 항목 구성: descriptions에 endpoint 정보와 테이블 포함
-                            if response_data:
-                                # extract_general_api_info_pw 메서드 내의 해당 부분을 다음과 같이 수정
-                                if response_data.get('endpoint'):
-                                    # endpoint 데이터 분리: 기본 정보와 테이블 데이터
-                                    endpoint_basic_info = {}
-                                    endpoint_table_data = {}
-                                    
-                                    table_keys = ["요청변수(Request Parameter)", "출력결과(Response Element)"]
-                                    
-                                    for key, value in response_data['endpoint'].items():
-                                        if key in table_keys:
-                                            # 테이블 데이터는 별도로 보관 (api_details에는 포함)
-                                            endpoint_table_data[key] = value
-                                        else:
-                                            # 기본 정보는 endpoints에 저장
-                                            endpoint_basic_info[key] = value
-                                    
-                                    # api_details에는 전체 정보 유지 (테이블 데이터 포함)
-                                    api_detail_item = {
-                                        'descriptions': {
-                                            **endpoint_basic_info,  # 기본 정보
-                                            **endpoint_table_data   # 테이블 데이터
+
+                                // 테이블에 데이터가 있는 경우 첫 번째/두 번째 구분하여 저장
+                                if (tableData.length > 0) {
+                                    if (tableIndex === 0) {
+                                        parsedData.endpoint["요청변수(Request Parameter)"] = tableData;
+                                    } else if (tableIndex === 1) {
+                                        parsedData.endpoint["출력결과(Response Element)"] = tableData;
+                                    }
+                                }
+                            });
+
+                            // div.box-gray > ul.dot-list 파싱
+                            const boxGray = apiDetailDiv.querySelector('div.box-gray');
+                            if (boxGray) {
+                                const dotList = boxGray.querySelector('ul.dot-list');
+                                if (dotList) {
+                                    const endpointData = {};
+                                    const listItems = dotList.querySelectorAll('li');
+
+                                    listItems.forEach(li => {
+                                        const strongTag = li.querySelector('strong');
+                                        if (strongTag) {
+                                            const key = strongTag.textContent.trim();
+                                            // strong 태그를 제거한 나머지 텍스트가 값
+                                            const value = li.textContent.replace(strongTag.textContent, '').trim();
+                                            endpointData[key] = value;
                                         }
+                                    });
+
+                                    // endpoint 기본 정보를 기존 endpoint 객체에 병합
+                                    if (Object.keys(endpointData).length > 0) {
+                                        Object.assign(parsedData.endpoint, endpointData);
                                     }
-                                    response_data_list.append(api_detail_item)
-                                    
-                                    # endpoints에는 기본 정보만 저장
-                                    endpoints_list.append(endpoint_basic_info)
-                                # endpoint가 없는 경우 전체 응답 저장
-                                else:
-                                    response_data_list.append(response_data)
-                            else:
-                                response_data_list.append({'error': 'POST 요청 실패'})
+                                }
+                            }
+
+                            return parsedData;
+                        } else {
+                            console.log('open-api-detail-result를 찾지 못함');
+                            return null;
+                        }
+                    };
+
+                    const fetchDetail = async (dataObj) => {
+                        const response = await fetch(url, {
+                            method: 'POST',
+                            headers: {
+                                'Content-Type': 'application/x-www-form-urlencoded',
+                            },
+                            body: new URLSearchParams({
+                                oprtinSeqNo: dataObj.oprtinSeqNo,
+                                publicDataDetailPk: dataObj.publicDataDetailPk,
+                                publicDataPk: dataObj.publicDataPk
+                            }).toString()
+                        });
+
+                        if (!response.ok) {
+                            throw new Error(`HTTP ${response.status}`);
+                        }
+                        return parseDetail(await response.text());
+                    };
+
+                    // 워커 풀: concurrency개의 워커가 다음 항목을 가져가 처리
+                    const results = new Array(items.length);
+                    let next = 0;
+                    const worker = async () => {
+                        while (next < items.length) {
+                            const index = next++;
+                            try {
+                                results[index] = {ok: true, data: await fetchDetail(items[index])};
+                            } catch (e) {
+                                results[index] = {ok: false, error: String(e && e.message ? e.message : e)};
+                            }
+                        }
+                    };
+
+                    const workers = [];
+                    for (let i = 0; i < Math.min(concurrency, items.length); i++) {
+                        workers.push(worker());
+                    }
+                    await Promise.all(workers);
+                    return results;
+                }'''
+
+                    detail_results = []
+                    for start in range(0, len(post_request_params), self.DETAIL_CHUNK_SIZE):
+                        chunk = post_request_params[start:start + self.DETAIL_CHUNK_SIZE]
+                        try:
+                            chunk_results = await page.evaluate(detail_pool_js, {
+                                'items': chunk,
+                                'concurrency': self.DETAIL_CONCURRENCY,
+                                'url': DETAIL_FUNCTION_PATH
+                            })
                         except Exception as e:
-                            print(f"POST 요청 실패 (oprtinSeqNo={item.get('oprtinSeqNo')}): {e}")
-                            response_data_list.append({'error': str(e)})
+                            # 컨텍스트 종료/내비게이션 등으로 evaluate 자체가 실패하면 이 묶음만 실패 처리
+                            chunk_results = [{'ok': False, 'error': f'상세기능 조회 실패: {e}'} for _ in chunk]
+                        detail_results.extend(chunk_results)
+
+                    for item, detail in zip(post_request_params, detail_results):
+                        if not detail.get('ok'):
+                            print(f"POST 요청 실패 (oprtinSeqNo={item.get('oprtinSeqNo')}): {detail.get('error')}")
 
                     # 응답 데이터만 저장 (POST 요청 파라미터는 제외)
-                    general_api_info['api_details'] = response_data_list
-                    general_api_info['endpoints'] = endpoints_list
+                    api_details, endpoints = GeneralApiProcessor.build_api_details(detail_results)
+                    general_api_info['api_details'] = api_details
+                    general_api_info['endpoints'] = endpoints
             except Exception as e:
                 print(f"POST 요청 값 추출 중 오류: {e}")
 
-            # 상세기능 (동적 로드될 수 있음)
+            # 상세기능 (동적 로드될 수 있음 - 짧은 시한 내에서만 대기)
             try:
-                await page.wait_for_selector('#open-api-detail-result', timeout=5000, state='attached')
+                await page.wait_for_selector('#open-api-detail-result', timeout=self.DETAIL_WAIT_MS, state='attached')
                 detail_div = await page.query_selector('#open-api-detail-result')
                 if detail_div:
                     desc_elem = await detail_div.query_selector('h4.tit')
@@ -315,12 +379,14 @@ class PlaywrightCrawler:
             except:
                 pass
 
-            # AJAX로 로드되는 요청/응답 파라미터 대기
-            try:
-                await page.wait_for_selector('#request-parameter-table', timeout=5000)
-            except:
-                pass
-            
+            # 요청변수 표는 스크립트로 그려질 수 있음 (상세기능 POST 결과가 없을 때만 시한 내 대기)
+            if not general_api_info.get('api_details'):
+                wait_ms = self.PARAM_TABLE_WAIT_MS if ready == 'general' else self.DETAIL_WAIT_MS
+                try:
+                    await page.wait_for_selector('#request-parameter-table', timeout=wait_ms, state='attached')
+                except Exception:
+                    pass
+
             # 요청변수
             request_params = await page.evaluate('''() => {
                 const table = document.querySelector('#request-parameter-table');
@@ -343,7 +409,7 @@ class PlaywrightCrawler:
             }''')
             
             if request_params:
-                general_api_info['request_parameters'] = request_params
+                general_api_info['request_parameters'] = clean_all_text(request_params, in_place=True)
             
             # 출력결과
             response_params = await page.evaluate('''() => {
@@ -366,7 +432,7 @@ class PlaywrightCrawler:
             }''')
             
             if response_params:
-                general_api_info['response_parameters'] = response_params
+                general_api_info['response_parameters'] = clean_all_text(response_params, in_place=True)
 
             # API 기본 정보 (테이블 외 추가 정보)
             api_basic_info = await page.evaluate('''() => {
@@ -394,66 +460,81 @@ class PlaywrightCrawler:
             }''')
             
             if api_basic_info:
-                general_api_info['basic_info'] = api_basic_info
+                general_api_info['basic_info'] = clean_all_text(api_basic_info, in_place=True)
 
         except Exception as e:
             print(f"일반 API 정보 추출 중 오류: {e}")
 
         return general_api_info
 
-    async def detect_api_type(self, page: Page, table_info: Dict) -> str:
-        """API 타입 감지"""
+    async def detect_api_type(self, page: Page, table_info: Dict,
+                              ready: Optional[str] = None) -> Tuple[str, Optional[Dict]]:
+        """API 타입 감지
+
+        감지에 사용한 추출 결과를 함께 반환하여 페이지당 각 추출기가 한 번만 실행되도록 함
+        ready는 wait_for_ready 결과 (일반 API 추출의 추가 대기 여부 결정)
+
+        Returns:
+            (api_type, payload) - swagger면 swagger_json, general이면 general_api_info, 그 외 None
+        """
         api_type_field = table_info.get('API 유형', '').upper()
         
         # LINK 타입 체크
         if 'LINK' in api_type_field:
-            return 'link'
+            return 'link', None
         
         # Swagger 체크
         swagger_json = await self.extract_swagger_json_pw(page)
         if swagger_json:
-            return 'swagger'
+            return 'swagger', swagger_json
         
         # 일반 API 체크
-        general_api_info = await self.extract_general_api_info_pw(page)
+        general_api_info = await self.extract_general_api_info_pw(page, ready)
         if (general_api_info.get('request_parameters') or 
             general_api_info.get('response_parameters') or
             general_api_info.get('detail_info')):
-            return 'general'
+            return 'general', general_api_info
         
-        return 'unknown'
+        return 'unknown', None
 
-    async def extract_api_info_pw(self, page: Page, url: str) -> Dict:
-        """Playwright 메인 추출 함수"""
+    async def extract_api_info_pw(self, page: Page, url: str,
+                                  timer: Optional[PhaseTimer] = None) -> Dict:
+        """Playwright 메인 추출 함수 (timer에 goto/ready/evaluate/parse 단계 시간 기록)"""
+        timer = timer or PhaseTimer()
         result = {
             'success': False,
             'data': None,
             'errors': [],
             'api_id': None,
             'url': url,
-            'method': 'playwright'
+            'method': 'playwright',
+            'timings': timer.phases
         }
         print("동적", url)
         try:
-            # 페이지 로드
-            await page.goto(url, wait_until='networkidle', timeout=20000)
+            # 페이지 로드 (DOM 파싱 완료까지만 대기)
+            with timer.phase('goto'):
+                await page.goto(url, wait_until='domcontentloaded', timeout=20000)
 
-            # 동적 콘텐츠 로드 대기
-            await page.wait_for_timeout(3000)
+            # 페이지 타입별 준비 조건 대기 (swaggerJson / 상세 영역 / LINK 유형)
+            with timer.phase('ready'):
+                ready = await self.wait_for_ready(page)
 
             # API ID 추출
             api_id = ApiIdExtractor.extract_api_id(url)
             result['api_id'] = api_id
             
             # 테이블 정보 추출
-            table_info = await extract_table_info_pw(page)
+            with timer.phase('evaluate'):
+                table_info = await extract_table_info_pw(page)
             
             if not table_info:
                 result['errors'].append('테이블 정보 없음')
                 return result
 
-            # API 타입 감지 및 처리
-            api_type = await self.detect_api_type(page, table_info)
+            # API 타입 감지 및 처리 (swaggerJson 조회, 상세기능 페이지 내 fetch 포함)
+            with timer.phase('evaluate'):
+                api_type, payload = await self.detect_api_type(page, table_info, ready)
             
             if api_type == 'link':
                 result['data'] = {
@@ -468,16 +549,17 @@ class PlaywrightCrawler:
                 return result
             
             elif api_type == 'swagger':
-                swagger_json = await self.extract_swagger_json_pw(page)
+                swagger_json = payload
                 if swagger_json:
-                    result['data'] = SwaggerProcessor.process_swagger_data(
-                        swagger_json, api_id, url, table_info, api_type='swagger'
-                    )
+                    with timer.phase('parse'):
+                        result['data'] = SwaggerProcessor.process_swagger_data(
+                            swagger_json, api_id, url, table_info, api_type='swagger'
+                        )
                     result['success'] = True
                     return result
             
             elif api_type == 'general':
-                general_api_info = await self.extract_general_api_info_pw(page)
+                general_api_info = payload
                 if general_api_info:
                     # endpoints와 api_details를 general_api_info에서 추출
                     endpoints = general_api_info.pop('endpoints', [])
@@ -503,56 +585,293 @@ class PlaywrightCrawler:
         
         return result
     
-    async def crawl_single(self, browser: Browser, url: str) -> Dict:
-        """단일 URL 크롤링"""
+    async def crawl_single(self, pool: BrowserContextPool, url: str) -> Dict:
+        """단일 URL 크롤링 (풀의 컨텍스트 재사용)"""
+        timer = PhaseTimer()
+        wait_start = time.perf_counter()
         async with self.semaphore:
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                viewport={'width': 1920, 'height': 1080}
-            )
-            page = await context.new_page()
-            
+            slot = await pool.acquire()
+            timer.add('queue_wait', time.perf_counter() - wait_start)
+            broken = True
+
             try:
-                result = await self.extract_api_info_pw(page, url)
+                result = await self.extract_api_info_pw(slot.page, url, timer)
+                broken = False
             finally:
-                await context.close()
+                await pool.release(slot, broken=broken)
             
             return result
     
-    async def crawl_batch(self, urls: List[str]) -> List[Dict]:
-        """배치 크롤링"""
+    def finalize_result(self, result, url: str) -> Dict:
+        """예외 처리 및 데이터 정제"""
+        if isinstance(result, Exception):
+            return {
+                'success': False,
+                'data': None,
+                'errors': [f'크롤링 중 예외 발생: {str(result)}'],
+                'url': url,
+                'method': 'playwright'
+            }
+        if result.get('success'):
+            # 추출 시점에 정제되지 않은 나머지 필드만 정제
+            with PhaseTimer(result.setdefault('timings', {})).phase('clean'):
+                result['data'] = clean_all_text(result['data'], in_place=True, skip_subtrees=PRECLEANED_KEYS)
+        return result
+
+    async def crawl_and_finalize(self, pool: BrowserContextPool, url: str,
+                                 on_result: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """단일 URL 크롤링 후 정제, 완료 즉시 on_result 콜백 호출"""
+        start = time.perf_counter()
+        try:
+            result = await self.crawl_single(pool, url)
+        except Exception as e:
+            result = e
+        result = self.finalize_result(result, url)
+        PhaseTimer(result.setdefault('timings', {})).add('total', time.perf_counter() - start)
+        if on_result:
+            on_result(result)
+        return result
+
+    async def route_request(self, route: Route, block_resources: bool):
+        """컨텍스트 라우팅: 차단 프로필 적용 후 허용된 요청은 rate limiter를 거쳐 진행"""
+        if block_resources:
+            if self.block_profile.should_block(route.request):
+                self.block_profile.record_blocked(route.request)
+                await route.abort()
+                return
+            self.block_profile.stats['allowed'] += 1
+        await self.rate_limiter.acquire(route.request.url)
+        await route.continue_()
+
+    def context_setup(self, block_resources: bool) -> Optional[Callable]:
+        """새 컨텍스트에 설치할 라우팅 (차단/속도 제한이 모두 없으면 None)"""
+        # 속도 제한이 꺼져 있으면 요청마다 Python 라우팅 왕복을 거치지 않도록 차단 프로필만 설치
+        if self.rate_limiter is None or not self.rate_limiter.enabled:
+            return self.block_profile.install if block_resources else None
+
+        async def install(context: BrowserContext):
+            await context.route('**/*', lambda route: self.route_request(route, block_resources))
+        return install
+
+    async def launch_browser(self, p) -> Browser:
+        """Chromium 실행"""
+        return await p.chromium.launch(
+            headless=True,
+            args=[
+                '--disable-blink-features=AutomationControlled',
+                '--no-sandbox',
+                '--disable-dev-shm-usage'
+            ]
+        )
+
+    def create_pool(self, browser: Browser, block_resources: bool) -> BrowserContextPool:
+        """컨텍스트 풀 생성 (풀 크기는 세마포어(max_workers)와 동일)"""
+        return BrowserContextPool(
+            browser,
+            size=self.max_workers,
+            max_uses=self.context_max_uses,
+            context_options=self.context_options,
+            on_new_context=self.context_setup(block_resources)
+        )
+
+    async def start(self, block_resources: bool = True):
+        """여러 배치에서 재사용할 브라우저와 컨텍스트 풀 시작"""
+        if self.pool is not None:
+            return
+        self._playwright = await async_playwright().start()
+        self.browser = await self.launch_browser(self._playwright)
+        self.pool = self.create_pool(self.browser, block_resources)
+
+    async def close(self):
+        """start()로 띄운 브라우저와 컨텍스트 풀 종료"""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+        if self.browser is not None:
+            await self.browser.close()
+            self.browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def crawl_batch(self, urls: List[str], block_resources: bool = True,
+                          on_result: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """배치 크롤링 (start()로 띄운 브라우저가 있으면 재사용)
+
+        Args:
+            urls: 크롤링할 URL 리스트
+            block_resources: True면 block_profile로 불필요한 리소스 차단 (start() 사용 시 start 인자가 적용됨)
+            on_result: URL별 결과가 나올 때마다 호출되는 콜백 (완료 순서)
+        """
+        if self.pool is not None:
+            tasks = [self.crawl_and_finalize(self.pool, url, on_result) for url in urls]
+            return await asyncio.gather(*tasks)
+
         results = []
         
         async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage'
-                ]
-            )
+            browser = await self.launch_browser(p)
+            pool = self.create_pool(browser, block_resources)
             
-            tasks = [self.crawl_single(browser, url) for url in urls]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [self.crawl_and_finalize(pool, url, on_result) for url in urls]
+            results = await asyncio.gather(*tasks)
             
+            await pool.close()
             await browser.close()
         
-        # 예외 처리 및 데이터 정제
-        processed_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                processed_results.append({
-                    'success': False,
-                    'data': None,
-                    'errors': [f'크롤링 중 예외 발생: {str(result)}'],
-                    'url': 'unknown',
-                    'method': 'playwright'
-                })
-            elif result.get('success'):
-                result['data'] = clean_all_text(result['data'])
-                processed_results.append(result)
-            else:
-                processed_results.append(result)
-        
-        return processed_results
\ No newline at end of file
+        return results
+
+    def auto_process_count(self, url_count: int) -> int:
+        """CPU 코어 수와 가용 메모리로 샤드 프로세스 수 결정 (psutil이 없으면 CPU 코어 수만 사용)"""
+        cpu_count = os.cpu_count() or 1
+        try:
+            import psutil
+        except ImportError:
+            psutil = None
+
+        memory_bound = cpu_count
+        if psutil is not None:
+            # 컨텍스트 총량(max_workers)은 프로세스 수와 무관하므로 먼저 제외하고,
+            # 남은 메모리로 띄울 수 있는 브라우저 프로세스 수를 계산
+            available_mb = psutil.virtual_memory().available // (1024 * 1024)
+            remaining_mb = available_mb - CONTEXT_MEMORY_MB * self.max_workers
+            memory_bound = max(1, int(remaining_mb // BROWSER_BASE_MEMORY_MB))
+        return max(1, min(cpu_count, memory_bound, url_count, self.max_workers))
+
+    async def iter_batch_sharded(self, urls: List[str], processes: int = 0,
+                                 block_resources: bool = True) -> AsyncIterator[Dict]:
+        """URL을 여러 프로세스로 나누어 크롤링하고 결과를 완료 순서대로 스트리밍
+
+        Args:
+            urls: 크롤링할 URL 리스트
+            processes: 프로세스 수 (0이면 CPU/메모리 기준 자동 결정)
+            block_resources: True면 각 프로세스에서 리소스 차단 프로필 사용
+        """
+        if not urls:
+            return
+
+        if processes <= 0:
+            processes = self.auto_process_count(len(urls))
+        processes = max(1, min(processes, len(urls)))
+        # 전체 동시 작업 수는 유지하고 프로세스별로 나눔
+        workers_per_process = max(1, -(-self.max_workers // processes))
+
+        print(f"   🧩 Playwright 샤딩: {processes}개 프로세스 × {workers_per_process}개 작업")
+
+        ctx = multiprocessing.get_context('spawn')
+        result_queue = ctx.Queue()
+        shards = [urls[i::processes] for i in range(processes)]
+        workers = []
+        for index, shard in enumerate(shards):
+            proc = ctx.Process(
+                target=_shard_worker,
+                args=(index, shard, workers_per_process, self.context_max_uses,
+                      self.block_profile, block_resources, result_queue,
+                      self.rate_limiter.settings(processes) if self.rate_limiter else None,
+                      ENDPOINT_CACHE.enabled),
+                daemon=True
+            )
+            proc.start()
+            workers.append(proc)
+
+        loop = asyncio.get_running_loop()
+        # 샤드별 미수신 URL (같은 URL이 여러 번 들어올 수 있으므로 개수로 추적)
+        pending = {index: Counter(shard) for index, shard in enumerate(shards)}
+        finished = set()
+
+        def fail_pending(index: int, reason: str):
+            """결과를 받지 못한 샤드 URL을 실패 결과로 변환"""
+            failures = [self.finalize_result(RuntimeError(reason), url)
+                        for url in pending[index].elements()]
+            pending[index].clear()
+            finished.add(index)
+            return failures
+        # 종료가 확인된 뒤 연속으로 비어 있던 폴링 횟수 (샤드별)
+        empty_polls_after_exit: Dict[int, int] = {}
+
+        try:
+            while len(finished) < processes:
+                try:
+                    message = await loop.run_in_executor(None, result_queue.get, True, 1.0)
+                except queue.Empty:
+                    # 종료 신호 없이 끝난 프로세스는 남은 URL을 실패 처리
+                    # 종료된 프로세스가 보낸 메시지는 이미 파이프에 있으므로, 종료 확인 후
+                    # 한 번 더 빈 폴링(1초)을 거쳐 모두 받은 뒤에 판단 (Queue.empty()는 신뢰할 수 없음)
+                    for index, proc in enumerate(workers):
+                        if index in finished or proc.exitcode is None:
+                            continue
+                        empty_polls_after_exit[index] = empty_polls_after_exit.get(index, 0) + 1
+                        if empty_polls_after_exit[index] < 2:
+                            continue
+                        for failure in fail_pending(index, f'샤드 프로세스 비정상 종료 (exit={proc.exitcode})'):
+                            yield failure
+                    continue
+
+                index, result = message
+                if index in finished:
+                    continue
+                # 종료 신호: None은 정상 종료, 문자열은 샤드 내부 오류 (남은 URL은 실패 처리)
+                if result is None or isinstance(result, str):
+                    reason = f'샤드 프로세스 오류: {result}' if result else '샤드 프로세스 결과 누락'
+                    for failure in fail_pending(index, reason):
+                        yield failure
+                    continue
+                url = result.get('url')
+                if pending[index][url] > 0:
+                    pending[index][url] -= 1
+                yield result
+        finally:
+            for proc in workers:
+                proc.join(timeout=5)
+                if proc.is_alive():
+                    proc.terminate()
+
+    async def crawl_batch_sharded(self, urls: List[str], processes: int = 0,
+                                  block_resources: bool = True,
+                                  on_result: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """멀티 프로세스 배치 크롤링 (crawl_batch와 같은 결과 리스트 반환)"""
+        results = []
+        async for result in self.iter_batch_sharded(urls, processes, block_resources):
+            if on_result:
+                on_result(result)
+            results.append(result)
+        return results
+
+
+def _shard_worker(index: int, urls: List[str], max_workers: int, context_max_uses: int,
+                  block_profile: ResourceBlockProfile, block_resources: bool, result_queue,
+                  rate_settings: Optional[Dict] = None, endpoint_cache: bool = False):
+    """샤드 워커 프로세스: 자체 브라우저와 컨텍스트 풀로 크롤링하고 결과를 부모로 전송
+
+    rate_settings는 전체 속도를 프로세스 수로 나눈 값 (프로세스 간 합산 속도 유지)
+    endpoint_cache는 부모의 엔드포인트 캐시 사용 여부 (spawn 프로세스는 모듈 상태를 물려받지 않음)
+    """
+    ENDPOINT_CACHE.enabled = endpoint_cache
+    crawler = PlaywrightCrawler(
+        max_workers=max_workers,
+        context_max_uses=context_max_uses,
+        block_profile=block_profile,
+        rate_limiter=RateLimiter(**rate_settings) if rate_settings else None
+    )
+    try:
+        asyncio.run(_crawl_shard(crawler, urls, block_resources,
+                                 lambda result: result_queue.put((index, result))))
+    except BaseException as e:
+        # 오류 종료 신호 (브라우저 실행 실패 등): 부모가 남은 URL을 실패 처리
+        result_queue.put((index, f'{type(e).__name__}: {e}'))
+        raise
+    # 정상 종료 신호
+    result_queue.put((index, None))
+
+
+async def _crawl_shard(crawler: PlaywrightCrawler, urls: List[str], block_resources: bool,
+                       send: Callable[[Dict], None]):
+    """샤드 URL 크롤링 (결과는 나오는 즉시 전송하고 보관하지 않음)"""
+    await crawler.start(block_resources)
+    try:
+        async def crawl_one(url: str):
+            send(await crawler.crawl_and_finalize(crawler.pool, url))
+
+        await asyncio.gather(*[crawl_one(url) for url in urls])
+    finally:
+        await crawler.close()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# util 패키지를 import할 수 있도록 openapi_crawler 디렉토리를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
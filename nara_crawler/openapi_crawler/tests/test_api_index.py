@@ -0,0 +1,77 @@
+"""API 역색인 디렉토리 색인 테스트 (tree 파일과 packed 세그먼트)"""
+
+import copy
+import json
+import os
+
+from util.api_index import ApiIndex, PACKED_DIR_NAME
+from util.common import SwaggerProcessor
+from util.packed_store import PackedStore
+
+
+SPEC = {
+    'swagger': '2.0',
+    'host': 'apis.data.go.kr',
+    'basePath': '/1230000/BidService',
+    'info': {'title': '입찰공고정보'},
+    'paths': {
+        '/getBidList': {
+            'get': {
+                'summary': '입찰공고 목록',
+                'parameters': [{'name': 'bidNtceNo', 'in': 'query', 'type': 'string'}],
+                'responses': {'200': {'description': '성공'}}
+            }
+        }
+    }
+}
+
+
+def _result(api_id: str) -> dict:
+    return SwaggerProcessor.process_swagger_data(copy.deepcopy(SPEC), api_id, f'url-{api_id}', {'제공기관': '조달청'})
+
+
+def _write_tree(data_dir, api_id: str):
+    base_dir = os.path.join(str(data_dir), '03. Swagger API', '조달청')
+    os.makedirs(base_dir, exist_ok=True)
+    with open(os.path.join(base_dir, f'{api_id}_20240101.json'), 'w', encoding='utf-8') as f:
+        json.dump(_result(api_id), f, ensure_ascii=False)
+
+
+def _write_packed(data_dir, *api_ids: str):
+    store = PackedStore(os.path.join(str(data_dir), PACKED_DIR_NAME), tree_dir=str(data_dir))
+    base_dir = os.path.join(str(data_dir), '03. Swagger API', '조달청')
+    for api_id in api_ids:
+        store.append(_result(api_id), base_dir, f'{api_id}_20240101')
+    store.close()
+
+
+def test_build_indexes_tree_files_and_packed_segments(tmp_path):
+    _write_tree(tmp_path, '100')
+    _write_packed(tmp_path, '200', '300')
+    index = ApiIndex(str(tmp_path / 'index.sqlite'))
+
+    stats = index.build(str(tmp_path))
+
+    assert stats['indexed'] == 3
+    assert index.api_ids('param', 'bidntceno') == ['100', '200', '300']
+    index.close()
+
+
+def test_build_skips_unchanged_packed_entries_and_prunes_removed(tmp_path):
+    _write_packed(tmp_path, '200', '300')
+    index = ApiIndex(str(tmp_path / 'index.sqlite'))
+    index.build(str(tmp_path))
+    index.close()
+
+    again = ApiIndex(str(tmp_path / 'index.sqlite'))
+    assert again.build(str(tmp_path))['skipped'] == 2
+
+    for segment in PackedStore(os.path.join(str(tmp_path), PACKED_DIR_NAME)).segments():
+        os.remove(segment)
+        os.remove(segment + '.idx')
+    _write_packed(tmp_path, '300')
+    stats = again.build(str(tmp_path))
+
+    assert stats['removed'] == 1
+    assert again.api_ids('param', 'bidNtceNo') == ['300']
+    again.close()
@@ -0,0 +1,61 @@
+"""실패 URL 보관소 테스트"""
+
+import pytest
+
+from util.dead_letter import DeadLetterQueue, classify_error
+
+
+def _url(doc_id: str) -> str:
+    return f'https://www.data.go.kr/data/{doc_id}/openapi.do'
+
+
+def _failure(doc_id: str, *errors: str) -> dict:
+    return {'success': False, 'url': _url(doc_id), 'errors': list(errors), 'method': 'playwright'}
+
+
+@pytest.mark.parametrize('errors, expected', [
+    (['타임아웃'], 'timeout'),
+    (['HTTP 404'], 'http_4xx'),
+    (['HTTP 503'], 'http_5xx'),
+    (['테이블 정보 없음'], 'no_table'),
+    (['정적 추출 실패 - 동적 렌더링 필요'], 'extract'),
+    (['크롤링 중 예외 발생: 샤드 프로세스 비정상 종료 (exit=-9)'], 'process_crash'),
+    (['크롤링 실패: boom'], 'exception'),
+    ([], 'unknown'),
+])
+def test_classify_error(errors, expected):
+    assert classify_error(errors) == expected
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / 'dead_letter.json')
+    queue = DeadLetterQueue(path)
+    queue.update([_failure('100', 'HTTP 500'), _failure('200', '타임아웃')])
+    queue.update([_failure('100', *[f'HTTP 50{i}' for i in range(7)])])
+    queue.save()
+
+    loaded = DeadLetterQueue(path)
+
+    assert loaded.entries == queue.entries
+    entry = loaded.entries[_url('100')]
+    assert entry['api_id'] == '100'
+    assert entry['attempts'] == 2
+    assert entry['errors'] == [f'HTTP 50{i}' for i in range(2, 7)]
+    assert loaded.summary() == {'http_5xx': 1, 'timeout': 1}
+
+
+def test_success_resolves_and_max_attempts_filters(tmp_path):
+    queue = DeadLetterQueue(str(tmp_path / 'dead_letter.json'))
+    queue.update([_failure('100', 'HTTP 500'), _failure('200', 'HTTP 500'), _failure('300', 'HTTP 500')])
+    queue.update([_failure('100', 'HTTP 500'), _failure('100', 'HTTP 500')])
+    queue.update([{'success': True, 'url': _url('300')}])
+
+    assert queue.pending_urls() == [_url('100'), _url('200')]
+    assert queue.pending_urls(max_attempts=3) == [_url('200')]
+
+
+def test_corrupt_file_starts_empty(tmp_path):
+    path = tmp_path / 'dead_letter.json'
+    path.write_text('[1, 2', encoding='utf-8')
+
+    assert DeadLetterQueue(str(path)).entries == {}
@@ -0,0 +1,72 @@
+"""일반 API 상세기능 응답 조각 파싱 테스트 (benchmark/fixtures/detail_fragment.html 사용)"""
+
+import os
+
+from util.common import GeneralApiProcessor
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmark', 'fixtures')
+BASE_URL = 'https://www.data.go.kr/data/15129394/openapi.do'
+REQUEST_KEY = GeneralApiProcessor.REQUEST_TABLE_KEY
+RESPONSE_KEY = GeneralApiProcessor.RESPONSE_TABLE_KEY
+
+
+def _fragment(operation: str = 'getCntrctInfoList', name: str = '계약현황 목록 조회') -> str:
+    with open(os.path.join(FIXTURE_DIR, 'detail_fragment.html'), 'r', encoding='utf-8') as f:
+        html = f.read()
+    return html.replace('{{OPERATION}}', operation).replace('{{OPERATION_NAME}}', name)
+
+
+def test_parse_detail_fragment_tables_and_basic_info():
+    endpoint = GeneralApiProcessor.parse_detail_fragment(_fragment(), BASE_URL)['endpoint']
+
+    assert endpoint['요청주소'] == 'http://apis.data.go.kr/1230000/CntrctInfoService/getCntrctInfoList'
+    assert endpoint['서비스URL'] == 'http://apis.data.go.kr/1230000/CntrctInfoService'
+    assert endpoint['활용승인 절차'].startswith('개발단계 : 자동승인')
+
+    request_rows = endpoint[REQUEST_KEY]
+    assert len(request_rows) == 8
+    assert request_rows[1] == {
+        '항목명(영문)': 'pageNo', '항목명(국문)': '페이지 번호', '항목크기': '4',
+        '항목구분': '1', '샘플데이터': '1', '항목설명': '페이지 번호'
+    }
+    assert len(endpoint[RESPONSE_KEY]) == 13
+    assert endpoint[RESPONSE_KEY][-1]['항목명(영문)'] == 'corpList'
+
+
+def test_parse_detail_fragment_resolves_empty_cell_links():
+    endpoint = GeneralApiProcessor.parse_detail_fragment(_fragment('getOp'), BASE_URL)['endpoint']
+
+    manual = endpoint[REQUEST_KEY][-1]
+    assert manual['항목설명'] == ''
+    assert manual['항목설명_link'] == 'https://www.data.go.kr/cmm/cmm/fileDownload.do?atchFileId=FILE_getOp'
+
+
+def test_parse_detail_fragment_without_result_div():
+    assert GeneralApiProcessor.parse_detail_fragment('<div class="error">세션 만료</div>') is None
+
+
+def test_build_api_details_keeps_order_and_splits_tables():
+    detail_results = [
+        {'ok': True, 'data': GeneralApiProcessor.parse_detail_fragment(_fragment('opA'), BASE_URL)},
+        {'ok': False, 'error': '  HTTP   500 '},
+        {'ok': True, 'data': None},
+        {'ok': True, 'data': GeneralApiProcessor.parse_detail_fragment(_fragment('opB'), BASE_URL)}
+    ]
+    api_details, endpoints = GeneralApiProcessor.build_api_details(detail_results)
+
+    assert len(api_details) == 4
+    assert api_details[1] == {'error': 'HTTP 500'}
+    assert api_details[2] == {'error': 'POST 요청 실패'}
+    assert [e['요청주소'].rsplit('/', 1)[1] for e in endpoints] == ['opA', 'opB']
+    # endpoints에는 기본 정보만, api_details에는 테이블까지 포함
+    assert REQUEST_KEY not in endpoints[0]
+    assert api_details[0]['descriptions'][REQUEST_KEY][0]['항목명(영문)'] == 'ServiceKey'
+    assert api_details[0]['descriptions']['요청주소'] == endpoints[0]['요청주소']
+
+
+def test_build_api_details_keeps_response_without_endpoint():
+    api_details, endpoints = GeneralApiProcessor.build_api_details([{'ok': True, 'data': {'message': ' 없음 '}}])
+
+    assert api_details == [{'message': '없음'}]
+    assert endpoints == []
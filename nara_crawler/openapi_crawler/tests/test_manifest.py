@@ -0,0 +1,75 @@
+"""증분 크롤링 매니페스트 테스트"""
+
+import json
+import os
+
+from util.manifest import CrawlManifest, content_hash
+
+
+def _save(directory, name: str) -> str:
+    path = os.path.join(str(directory), name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{}')
+    return path
+
+
+def _data(api_id: str = '100', modified: str = '2024-01-01') -> dict:
+    return {'api_id': api_id, 'api_type': 'swagger', 'info': {'수정일': modified}, 'crawled_time': '2024-01-02 00:00:00'}
+
+
+def test_content_hash_ignores_crawled_time():
+    assert content_hash(_data()) == content_hash({**_data(), 'crawled_time': '2030-01-01 00:00:00'})
+    assert content_hash(_data()) != content_hash(_data(modified='2024-02-01'))
+
+
+def test_filter_changed_skips_only_unchanged_documents_with_files(tmp_path):
+    manifest = CrawlManifest(str(tmp_path / 'manifest.jsonl'))
+    manifest.record(_data('100'), [_save(tmp_path, '100_20240101.json')], update_date='2024-01-01')
+    manifest.record(_data('200'), [_save(tmp_path, '200_20240101.json')], update_date='2024-01-01')
+    manifest.record(_data('300'), [_save(tmp_path, '300_20240101.json')], update_date='2024-01-01')
+    os.remove(tmp_path / '300_20240101.json')
+
+    details = {
+        100: {'update_date': '2024-01-01'},
+        200: {'update_date': '2024-03-01'},
+        300: {'update_date': '2024-01-01'},
+        400: {'update_date': '2024-01-01'},
+        500: {}
+    }
+    manifest.record(_data('500'), [_save(tmp_path, '500_20240101.json')])
+
+    # 100: 그대로, 200: 카탈로그 수정일 변경, 300: 파일 없음, 400: 신규, 500: 수정일 정보 없음
+    assert manifest.filter_changed([100, 200, 300, 400, 500], details) == [200, 300, 400, 500]
+
+
+def test_record_removes_stale_files_of_same_document_only(tmp_path):
+    manifest = CrawlManifest(str(tmp_path / 'manifest.jsonl'))
+    old_json = _save(tmp_path, '100_20240101.json')
+    old_xml = _save(tmp_path, '100_20240101.xml')
+    shared_csv = _save(tmp_path, 'all_result_table.csv')
+    manifest.record(_data(), [old_json, old_xml, shared_csv], update_date='2024-01-01')
+
+    new_json = _save(tmp_path, '100_20240301.json')
+    manifest.record(_data(modified='2024-03-01'), [new_json, shared_csv], update_date='2024-03-01')
+
+    assert not os.path.exists(old_json)
+    assert not os.path.exists(old_xml)
+    assert os.path.exists(shared_csv)
+    assert manifest.get(100)['paths'] == sorted([new_json, shared_csv])
+
+
+def test_close_compacts_and_reload_ignores_corrupt_lines(tmp_path):
+    path = str(tmp_path / 'manifest.jsonl')
+    manifest = CrawlManifest(path)
+    for update_date in ('2024-01-01', '2024-02-01', '2024-03-01'):
+        manifest.record(_data(), [], update_date=update_date)
+    manifest.close()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        assert [json.loads(line)['update_date'] for line in f] == ['2024-03-01']
+
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{손상된 줄\n')
+    reloaded = CrawlManifest(path)
+    assert list(reloaded.entries) == ['100']
+    assert reloaded.get(100)['update_date'] == '2024-03-01'
@@ -0,0 +1,98 @@
+"""packed 출력 모드 세그먼트/오프셋 색인 테스트"""
+
+import json
+import os
+
+from util.packed_store import INDEX_SUFFIX, PackedStore
+
+
+def _data(api_id: str, title: str = '입찰공고') -> dict:
+    return {'api_id': api_id, 'api_type': 'general', 'info': {'제공기관': '조달청', '설명': title}}
+
+
+def _store(tmp_path, **kwargs) -> PackedStore:
+    return PackedStore(str(tmp_path / 'packed'), tree_dir=str(tmp_path), **kwargs)
+
+
+def _base_dir(tmp_path, org: str = '조달청') -> str:
+    return os.path.join(str(tmp_path), '01. 일반 API', org)
+
+
+def _index_lines(segment: str) -> list:
+    with open(segment + INDEX_SUFFIX, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_index_offsets_point_at_segment_lines(tmp_path):
+    store = _store(tmp_path)
+    segment = store.append(_data('100', '한글 제목'), _base_dir(tmp_path), '100_20240101')
+    store.append(_data('200'), _base_dir(tmp_path), '200_20240101')
+    store.close()
+
+    assert segment == os.path.join(str(tmp_path), 'packed', '01. 일반 API', '조달청.jsonl')
+    with open(segment, 'rb') as f:
+        raw = f.read()
+    entries = _index_lines(segment)
+    assert [e['offset'] for e in entries] == [0, entries[0]['length']]
+    assert sum(e['length'] for e in entries) == len(raw)
+    for entry in entries:
+        line = raw[entry['offset']:entry['offset'] + entry['length']]
+        assert line.endswith(b'\n')
+        assert json.loads(line)['api_id'] == entry['api_id']
+
+
+def test_offsets_continue_after_reopen_and_latest_entry_wins(tmp_path):
+    first = _store(tmp_path)
+    first.append(_data('100', '이전'), _base_dir(tmp_path), '100_20240101')
+    first.close()
+
+    second = _store(tmp_path, max_open=1)
+    second.append(_data('200'), _base_dir(tmp_path, '국토교통부'), '200_20240101')
+    second.append(_data('100', '최신'), _base_dir(tmp_path), '100_20240301')
+    second.close()
+
+    reader = _store(tmp_path)
+    assert reader.get('100')['info']['설명'] == '최신'
+    assert reader.entries()['100']['prefix'] == '100_20240301'
+    assert reader.get('200')['api_id'] == '200'
+    assert reader.summary()['documents'] == 2
+    assert reader.summary()['records'] == 3
+
+
+def test_index_entries_past_segment_end_are_ignored(tmp_path):
+    store = _store(tmp_path)
+    segment = store.append(_data('100'), _base_dir(tmp_path), '100_20240101')
+    store.close()
+    with open(segment + INDEX_SUFFIX, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'api_id': '999', 'prefix': 'x', 'offset': 10 ** 6, 'length': 10, 'ts': 0}) + '\n')
+        f.write('{깨진 줄\n')
+
+    assert set(_store(tmp_path).entries()) == {'100'}
+
+
+def test_compact_rewrites_offsets_for_live_entries(tmp_path):
+    store = _store(tmp_path)
+    for title in ('1차', '2차', '3차'):
+        store.append(_data('100', title), _base_dir(tmp_path), '100_20240101')
+    store.append(_data('200'), _base_dir(tmp_path), '200_20240101')
+
+    counts = store.compact()
+
+    assert counts == {'segments': 1, 'removed_records': 2}
+    segment = store.segments()[0]
+    entries = _index_lines(segment)
+    assert [e['offset'] for e in entries] == [0, entries[0]['length']]
+    assert os.path.getsize(segment) == sum(e['length'] for e in entries)
+    assert store.get('100')['info']['설명'] == '3차'
+    assert store.get('200')['api_id'] == '200'
+
+
+def test_export_tree_restores_directory_layout(tmp_path):
+    store = _store(tmp_path)
+    store.append(_data('100'), _base_dir(tmp_path), '100_20240101')
+    store.close()
+
+    out_dir = tmp_path / 'export'
+    assert store.export_tree(str(out_dir), ['json']) == {'exported': 1, 'failed': 0}
+    with open(out_dir / '01. 일반 API' / '조달청' / '100_20240101.json', 'r', encoding='utf-8') as f:
+        assert json.load(f)['api_id'] == '100'
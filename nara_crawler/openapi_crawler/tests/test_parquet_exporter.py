@@ -0,0 +1,60 @@
+"""Parquet 내보내기 flush 테스트 (pyarrow가 없으면 건너뜀)"""
+
+import os
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from util.parquet_exporter import ParquetExporter  # noqa: E402
+
+
+DATA = {
+    'api_id': '100',
+    'api_type': 'swagger',
+    'info': {'제공기관': '조달청'},
+    'api_info': {'title': '입찰공고정보'},
+    'endpoints': [{
+        'method': 'GET',
+        'path': '/getBidList',
+        'parameters': [{'name': 'bidNtceNo', 'in': 'query', 'type': 'string'}],
+        'responses': [{'status_code': '200', 'description': '성공'}]
+    }]
+}
+
+
+def _parquet_files(root):
+    return sorted(
+        os.path.join(dir_path, name)
+        for dir_path, _, names in os.walk(root) for name in names if name.endswith('.parquet')
+    )
+
+
+def test_failed_flush_keeps_whole_batch_and_removes_partial_files(tmp_path, monkeypatch):
+    exporter = ParquetExporter(str(tmp_path), flush_every=100)
+    exporter.add(DATA)
+    write_table = exporter._write_table
+    calls = []
+
+    def fail_on_second_table(table, arrow_table, written):
+        calls.append(table)
+        if len(calls) == 2:
+            raise OSError('디스크 가득 참')
+        write_table(table, arrow_table, written)
+
+    monkeypatch.setattr(exporter, '_write_table', fail_on_second_table)
+    with pytest.raises(OSError):
+        exporter.flush()
+
+    assert _parquet_files(str(tmp_path)) == []
+    assert exporter.written_files == []
+    assert all(exporter._rows[table] for table in ('apis', 'endpoints'))
+
+    monkeypatch.setattr(exporter, '_write_table', write_table)
+    exporter.flush()
+
+    assert sorted(exporter.written_files) == _parquet_files(str(tmp_path))
+    assert {os.path.relpath(path, str(tmp_path)).split(os.sep)[0] for path in exporter.written_files} == {
+        'apis', 'endpoints', 'parameters', 'responses'
+    }
+    assert not any(exporter._rows.values())
@@ -0,0 +1,108 @@
+"""호스트별 토큰 버킷 Rate Limiter 테스트 (가짜 시계 사용)"""
+
+import pytest
+
+from util import rate_limiter as rate_limiter_module
+from util.common import DETAIL_FUNCTION_PATH
+from util.rate_limiter import RateLimiter, TokenBucket, classify_endpoint, parse_class_rates
+
+
+PAGE_URL = 'https://www.data.go.kr/data/15000001/openapi.do'
+DETAIL_URL = f'https://www.data.go.kr{DETAIL_FUNCTION_PATH}'
+ASSET_URL = 'https://www.data.go.kr/js/common.js'
+
+
+class FakeClock:
+    """time 모듈 대체 (monotonic은 수동 진행, sleep은 기록 후 시계를 진행)"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, 'time', fake)
+    return fake
+
+
+def test_token_bucket_reserve_queues_in_fifo_order(clock):
+    bucket = TokenBucket(rate=2)
+
+    # 용량(2)만큼은 바로, 이후 예약은 0.5초 간격으로 대기
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    clock.now += 1.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    bucket = TokenBucket(rate=1, burst=3)
+    for _ in range(3):
+        bucket.reserve()
+
+    clock.now += 100
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.0, 1.0]
+
+
+def test_zero_rate_never_waits(clock):
+    bucket = TokenBucket(rate=0)
+
+    assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+
+def test_acquire_sync_sleeps_for_reserved_delay(clock):
+    limiter = RateLimiter(host_rate=1)
+    for _ in range(3):
+        limiter.acquire_sync(PAGE_URL)
+
+    assert clock.sleeps == [pytest.approx(1.0)] * 2
+    host = limiter.snapshot()['www.data.go.kr']
+    assert host['total'] == 3
+    assert host['queue_depth'] == 0
+
+
+def test_class_rate_applies_on_top_of_host_rate_and_assets_skip_host_bucket(clock):
+    limiter = RateLimiter(host_rate=10, class_rates={'detail': 1})
+
+    assert limiter.reserve(DETAIL_URL)[0] == 0.0
+    assert limiter.reserve(DETAIL_URL)[0] == pytest.approx(1.0)
+    assert limiter.reserve(PAGE_URL)[0] == 0.0
+    for _ in range(20):
+        assert limiter.reserve(ASSET_URL)[0] == 0.0
+
+
+def test_settings_split_rates_across_processes():
+    limiter = RateLimiter(host_rate=8, class_rates={'detail': 4}, burst=6, window_sec=5)
+
+    assert limiter.settings(4) == {
+        'host_rate': 2.0, 'class_rates': {'detail': 1.0}, 'burst': 1.5, 'window_sec': 5
+    }
+    assert limiter.settings(0) == limiter.settings(1)
+    assert RateLimiter().settings(3)['burst'] is None
+    assert RateLimiter(**limiter.settings(2)).enabled
+
+
+def test_enabled_and_classification():
+    assert not RateLimiter().enabled
+    assert RateLimiter(class_rates={'page': 1}).enabled
+    assert classify_endpoint('https://www.data.go.kr/catalog/15000001/openapi.json') == 'catalog'
+    assert classify_endpoint(PAGE_URL) == 'page'
+    assert classify_endpoint(DETAIL_URL) == 'detail'
+    assert classify_endpoint(ASSET_URL) == 'asset'
+
+
+def test_parse_class_rates_rejects_unknown_class():
+    assert parse_class_rates(['detail=5', 'page=2.5']) == {'detail': 5.0, 'page': 2.5}
+    with pytest.raises(ValueError):
+        parse_class_rates(['unknown=1'])
+    with pytest.raises(ValueError):
+        parse_class_rates(['detail'])
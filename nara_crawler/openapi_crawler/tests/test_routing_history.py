@@ -0,0 +1,80 @@
+"""크롤링 방식 라우팅 이력 테스트"""
+
+from util.routing_history import ROUTE_DYNAMIC, ROUTE_STATIC, ROUTE_UNKNOWN, RoutingHistory
+
+
+def _url(doc_id: str) -> str:
+    return f'https://www.data.go.kr/data/{doc_id}/openapi.do'
+
+
+def _result(doc_id: str, method: str, success: bool = True) -> dict:
+    return {
+        'success': success,
+        'api_id': doc_id,
+        'url': _url(doc_id),
+        'method': method,
+        'data': {'api_type': 'general'} if success else None
+    }
+
+
+def test_routes_by_last_successful_crawler(tmp_path):
+    history = RoutingHistory(str(tmp_path / 'routing.json'))
+    history.record(_result('100', 'beautifulsoup'))
+    history.record(_result('200', 'playwright'))
+    history.record(_result('300', 'playwright', success=False))
+
+    assert history.route(_url('100')) == ROUTE_STATIC
+    assert history.route(_url('200')) == ROUTE_DYNAMIC
+    assert history.route(_url('300')) == ROUTE_UNKNOWN
+
+
+def test_dynamic_documents_are_reprobed_every_interval(tmp_path):
+    history = RoutingHistory(str(tmp_path / 'routing.json'), reprobe_interval=3)
+    history.record(_result('200', 'playwright'))
+    url = _url('200')
+
+    routes = []
+    for _ in range(8):
+        static_urls, dynamic_urls, _, reprobe_urls = history.split([url])
+        routes.append('reprobe' if reprobe_urls else ('dynamic' if dynamic_urls else 'static'))
+        assert reprobe_urls == [] or static_urls == reprobe_urls
+        # 재확인에서 BS가 실패해 Playwright가 다시 성공한 경우
+        history.record(_result('200', 'playwright'))
+
+    assert routes == ['dynamic', 'dynamic', 'dynamic', 'reprobe', 'dynamic', 'dynamic', 'dynamic', 'reprobe']
+
+
+def test_static_success_after_reprobe_stops_direct_playwright(tmp_path):
+    history = RoutingHistory(str(tmp_path / 'routing.json'), reprobe_interval=1)
+    history.record(_result('200', 'playwright'))
+    history.split([_url('200')])
+
+    _, _, _, reprobe_urls = history.split([_url('200')])
+    assert reprobe_urls == [_url('200')]
+    history.record(_result('200', 'beautifulsoup'))
+
+    static_urls, dynamic_urls, unknown_urls, reprobe_urls = history.split([_url('200'), _url('999')])
+    assert (static_urls, dynamic_urls, unknown_urls, reprobe_urls) == ([_url('200')], [], [_url('999')], [])
+
+
+def test_save_and_reload_keeps_probe_counter(tmp_path):
+    path = str(tmp_path / 'routing.json')
+    history = RoutingHistory(path, reprobe_interval=2)
+    history.record(_result('200', 'playwright'))
+    history.split([_url('200')])
+    history.save()
+
+    reloaded = RoutingHistory(path, reprobe_interval=2)
+    assert reloaded.entries['200']['runs_since_probe'] == 1
+    assert reloaded.summary() == {'playwright': 1}
+    _, dynamic_urls, _, _ = reloaded.split([_url('200')])
+    assert dynamic_urls == [_url('200')]
+    _, _, _, reprobe_urls = reloaded.split([_url('200')])
+    assert reprobe_urls == [_url('200')]
+
+
+def test_corrupt_file_starts_empty(tmp_path):
+    path = tmp_path / 'routing.json'
+    path.write_text('{깨진 파일', encoding='utf-8')
+
+    assert RoutingHistory(str(path)).entries == {}
@@ -0,0 +1,109 @@
+"""명세 해시, 엔드포인트 캐시, 명세 저장소 테스트"""
+
+import copy
+
+import pytest
+
+from util.common import SwaggerProcessor
+from util.spec_store import ENDPOINT_CACHE, SPEC_REF_KEY, EndpointCache, SpecStore, spec_hash
+from util.text_cleaner import PRECLEANED_KEYS, clean_all_text
+
+
+SPEC = {
+    'swagger': '2.0',
+    'host': 'apis.data.go.kr',
+    'basePath': '/1230000/ItemService',
+    'info': {'title': '품목정보', 'description': '  품목  조회  '},
+    'paths': {
+        '/getItemList': {
+            'get': {
+                'summary': '품목 목록',
+                'description': '<b>품목</b>   목록 조회',
+                'parameters': [{'name': 'pageNo', 'in': 'query', 'type': 'integer', 'description': ' 페이지 '}],
+                'responses': {'200': {'description': ' 성공 '}}
+            }
+        }
+    }
+}
+
+
+@pytest.fixture
+def endpoint_cache():
+    """공용 캐시를 켠 상태로 테스트하고 원래 상태로 되돌림"""
+    enabled = ENDPOINT_CACHE.enabled
+    ENDPOINT_CACHE.enabled = True
+    yield ENDPOINT_CACHE
+    ENDPOINT_CACHE.enabled = enabled
+
+
+def test_spec_hash_ignores_key_order():
+    reordered = dict(reversed(list(SPEC.items())))
+
+    assert spec_hash(reordered) == spec_hash(SPEC)
+    assert spec_hash({**SPEC, 'host': 'other'}) != spec_hash(SPEC)
+
+
+def test_endpoint_cache_evicts_least_recently_used():
+    cache = EndpointCache(maxsize=2)
+    calls = []
+
+    def compute(key):
+        return lambda: calls.append(key) or [{'path': key}]
+
+    cache.get_or_compute('a', compute('a'))
+    cache.get_or_compute('b', compute('b'))
+    cache.get_or_compute('a', compute('a'))
+    cache.get_or_compute('c', compute('c'))
+    cache.get_or_compute('a', compute('a'))
+    cache.get_or_compute('b', compute('b'))
+
+    assert calls == ['a', 'b', 'c', 'b']
+    assert cache.stats == {'hits': 2, 'misses': 4}
+
+
+def test_endpoint_cache_returns_new_list_with_shared_dicts():
+    cache = EndpointCache()
+    first = cache.get_or_compute('k', lambda: [{'path': '/a'}])
+    second = cache.get_or_compute('k', lambda: [{'path': '/b'}])
+
+    assert first is not second
+    assert first[0] is second[0]
+    first.append({'path': '/extra'})
+    assert len(cache.get_or_compute('k', lambda: [])) == 1
+
+
+def test_disabled_cache_skips_hash():
+    assert ENDPOINT_CACHE.enabled is False
+    result = SwaggerProcessor.process_swagger_data(copy.deepcopy(SPEC), '1', 'url', {})
+
+    assert 'swagger_hash' not in result
+    assert result['endpoints'][0]['path'] == '/getItemList'
+
+
+def test_finalize_cleaning_leaves_shared_endpoints_untouched(endpoint_cache):
+    first = SwaggerProcessor.process_swagger_data(copy.deepcopy(SPEC), '1', 'url-1', {})
+    second = SwaggerProcessor.process_swagger_data(copy.deepcopy(SPEC), '2', 'url-2', {})
+    assert first['swagger_hash'] == second['swagger_hash'] == spec_hash(SPEC)
+    assert first['endpoints'][0] is second['endpoints'][0]
+    snapshot = copy.deepcopy(second['endpoints'])
+
+    # 크롤러 마무리 정제와 같은 호출 (endpoints는 PRECLEANED_KEYS로 건너뜀)
+    assert 'endpoints' in PRECLEANED_KEYS
+    clean_all_text(first, in_place=True, skip_subtrees=PRECLEANED_KEYS)
+
+    assert second['endpoints'] == snapshot
+
+
+def test_spec_store_externalize_and_inline_round_trip(tmp_path):
+    store = SpecStore(str(tmp_path / 'specs'))
+    data = {'api_id': '1', 'swagger_json': SPEC, 'api_type': 'swagger'}
+
+    externalized = store.externalize(data)
+    again = store.externalize({'api_id': '2', 'swagger_json': copy.deepcopy(SPEC)})
+
+    assert 'swagger_json' not in externalized
+    assert externalized[SPEC_REF_KEY]['hash'] == spec_hash(SPEC)
+    assert externalized[SPEC_REF_KEY]['path'] == f'specs/{spec_hash(SPEC)}.json'
+    assert store.stats == {'written': 1, 'reused': 1}
+    assert again[SPEC_REF_KEY] == externalized[SPEC_REF_KEY]
+    assert store.inline(externalized) == data
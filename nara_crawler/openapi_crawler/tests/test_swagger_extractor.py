@@ -0,0 +1,49 @@
+"""HTML 원문 swaggerJson 추출 테스트"""
+
+from util.swagger_extractor import _find_closing_quote, extract_swagger_json_from_html
+
+
+def _page(script: str) -> str:
+    return f'<html><body><script type="text/javascript">{script}</script></body></html>'
+
+
+def test_object_literal_with_terminator_inside_string():
+    html = _page('var swaggerJson = {"info": {"title": "끝};문자열"}, "paths": {}};\nvar other = {};')
+
+    assert extract_swagger_json_from_html(html) == {'info': {'title': '끝};문자열'}, 'paths': {}}
+
+
+def test_object_literal_with_backtick_inside_string():
+    html = _page('window.swaggerJson = {"info": {"description": "`code` 예시"}};')
+
+    assert extract_swagger_json_from_html(html) == {'info': {'description': '`code` 예시'}}
+
+
+def test_template_literal_with_escaped_backtick():
+    html = _page('const swaggerJson = `{"info": {"description": "\\`code\\` };"}}`;')
+
+    assert extract_swagger_json_from_html(html) == {'info': {'description': '`code` };'}}
+
+
+def test_single_quoted_string_with_terminator_and_escaped_quote():
+    html = _page("var swaggerJson = '{\"info\": {\"title\": \"it\\'s };\"}}';")
+
+    assert extract_swagger_json_from_html(html) == {'info': {'title': "it's };"}}
+
+
+def test_json_parse_string():
+    html = _page('var swaggerJson = JSON.parse("{\\"paths\\": {\\"/a\\": {}}}");')
+
+    assert extract_swagger_json_from_html(html) == {'paths': {'/a': {}}}
+
+
+def test_missing_assignment_returns_none():
+    assert extract_swagger_json_from_html(_page('var spec = {"paths": {}};')) is None
+    assert extract_swagger_json_from_html('') is None
+
+
+def test_closing_quote_skips_only_odd_backslash_runs():
+    assert _find_closing_quote(r"`a\`b`", 0, '`') == 5
+    assert _find_closing_quote(r"`a\\`b`", 0, '`') == 4
+    assert _find_closing_quote(r"'a\\\'b'", 0, "'") == 7
+    assert _find_closing_quote("`unterminated", 0, '`') is None
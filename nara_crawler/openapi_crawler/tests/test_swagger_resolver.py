@@ -0,0 +1,111 @@
+"""SwaggerResolver $ref 해석/병합 동작 테스트"""
+
+from util.swagger_resolver import SwaggerResolver
+
+
+def _by_name(fields):
+    return {field['name']: field for field in fields}
+
+
+def test_self_reference_is_marked_circular():
+    spec = {
+        'swagger': '2.0',
+        'definitions': {
+            'Node': {
+                'type': 'object',
+                'properties': {
+                    'id': {'type': 'string'},
+                    'parent': {'$ref': '#/definitions/Node'},
+                    'children': {'type': 'array', 'items': {'$ref': '#/definitions/Node'}}
+                }
+            }
+        }
+    }
+    fields = _by_name(SwaggerResolver(spec).schema_fields({'$ref': '#/definitions/Node'}))
+
+    assert set(fields) == {'id', 'parent', 'children'}
+    assert fields['parent']['circular'] is True
+    assert fields['parent']['ref'] == 'Node'
+    assert fields['children']['circular'] is True
+    assert fields['id']['circular'] is False
+
+
+def test_all_of_merges_properties():
+    spec = {
+        'swagger': '2.0',
+        'definitions': {
+            'Base': {
+                'type': 'object',
+                'required': ['id'],
+                'properties': {'id': {'type': 'string'}, 'name': {'type': 'string'}}
+            },
+            'Item': {
+                'allOf': [
+                    {'$ref': '#/definitions/Base'},
+                    {'type': 'object', 'properties': {'price': {'type': 'integer'}, 'name': {'type': 'string'}}}
+                ]
+            }
+        }
+    }
+    fields = SwaggerResolver(spec).schema_fields({'$ref': '#/definitions/Item'})
+
+    assert [field['name'] for field in fields] == ['id', 'name', 'price']
+    assert _by_name(fields)['id']['required'] is True
+    assert _by_name(fields)['price']['type'] == 'integer'
+
+
+def test_operation_parameter_overrides_path_parameter():
+    spec = {
+        'swagger': '2.0',
+        'parameters': {
+            'PageNo': {'name': 'pageNo', 'in': 'query', 'type': 'integer', 'description': '공통 페이지 번호'}
+        }
+    }
+    path_params = [
+        {'$ref': '#/parameters/PageNo'},
+        {'name': 'serviceKey', 'in': 'query', 'type': 'string', 'required': True}
+    ]
+    operation_params = [
+        {'name': 'pageNo', 'in': 'query', 'type': 'string', 'description': '오퍼레이션 페이지 번호'},
+        {'name': 'pageNo', 'in': 'header', 'type': 'string'}
+    ]
+    params = SwaggerResolver(spec).parameters(operation_params, path_params)
+
+    keyed = {(param['name'], param['in']): param for param in params}
+    assert len(params) == 3
+    assert keyed[('pageNo', 'query')]['description'] == '오퍼레이션 페이지 번호'
+    assert keyed[('pageNo', 'query')]['type'] == 'string'
+    assert keyed[('serviceKey', 'query')]['required'] is True
+    assert ('pageNo', 'header') in keyed
+
+
+def test_openapi3_request_body_becomes_body_parameter():
+    spec = {
+        'openapi': '3.0.1',
+        'components': {
+            'schemas': {
+                'Order': {
+                    'type': 'object',
+                    'required': ['orderNo'],
+                    'properties': {'orderNo': {'type': 'string'}, 'qty': {'type': 'integer', 'format': 'int32'}}
+                }
+            },
+            'requestBodies': {
+                'OrderBody': {
+                    'description': '주문 정보',
+                    'required': True,
+                    'content': {'application/json': {'schema': {'$ref': '#/components/schemas/Order'}}}
+                }
+            }
+        }
+    }
+    params = SwaggerResolver(spec).parameters([], None, {'$ref': '#/components/requestBodies/OrderBody'})
+
+    assert len(params) == 1
+    body = params[0]
+    assert body['in'] == 'body'
+    assert body['required'] is True
+    assert body['description'] == '주문 정보'
+    fields = _by_name(body['fields'])
+    assert fields['orderNo']['required'] is True
+    assert fields['qty']['format'] == 'int32'
@@ -0,0 +1,422 @@
+"""
+크롤링 결과 역색인 (SQLite)
+파라미터명, 응답 필드명, 경로 토큰 → API ID/엔드포인트 역색인으로
+"bidNtceNo를 받는 API", "presmptPrce를 반환하는 엔드포인트" 같은 질의를 파일 grep 없이 처리
+- 결과 정규화는 Parquet 내보내기와 같은 flatten_result 사용 (Swagger/일반 API 공통)
+- 용어는 소문자로 정규화, 점 경로 필드(response.body.items[].bidNtceNo)는 마지막 이름으로 색인
+- 증분 갱신: 저장기 on_saved 훅으로 문서별 교체, 디렉토리 색인은 파일 수정 시각이 바뀐 것만 다시 읽음
+- packed 출력 모드 세그먼트(data/packed)도 PackedStore 색인으로 함께 읽음 (색인 항목 ts를 수정 시각으로 사용)
+
+실행 (openapi_crawler 디렉토리에서):
+    python -m util.api_index build
+    python -m util.api_index query param bidNtceNo
+    python -m util.api_index query response presmpt --prefix
+    python -m util.api_index stats
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from util.packed_store import PackedStore
+from util.parquet_exporter import flatten_result
+
+
+# 색인 용어 종류
+TERM_KINDS = ('param', 'response', 'path')
+
+# 일반 API 엔드포인트 경로로 사용할 기본 정보 키
+GENERAL_PATH_KEY = '요청주소'
+
+# 저장 디렉토리 구조: data/{유형}/{기관}/{문서번호}_{수정일}.json
+RESULT_FILE_PATTERN = os.path.join('*', '*', '*.json')
+
+# packed 출력 모드 세그먼트 루트 (data/packed, DataExporter.packed_dir와 같은 위치)
+PACKED_DIR_NAME = 'packed'
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS apis (
+    api_id TEXT PRIMARY KEY,
+    api_type TEXT,
+    org TEXT,
+    title TEXT,
+    source TEXT,
+    mtime_ns INTEGER
+);
+CREATE TABLE IF NOT EXISTS endpoints (
+    api_id TEXT,
+    endpoint_index INTEGER,
+    method TEXT,
+    path TEXT,
+    PRIMARY KEY (api_id, endpoint_index)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS terms (
+    term_id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    term TEXT NOT NULL,
+    UNIQUE (kind, term)
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term_id INTEGER,
+    api_id TEXT,
+    endpoint_index INTEGER,
+    field TEXT,
+    PRIMARY KEY (term_id, api_id, endpoint_index, field)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_api ON postings (api_id);
+'''
+
+# 경로 구분자와 camelCase 경계
+_PATH_SPLIT_RE = re.compile(r'[/{}.\-_:?=&]+')
+_CAMEL_RE = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+
+
+def normalize_term(term: str) -> str:
+    """질의/색인 공통 정규화 (소문자, 앞뒤 공백 제거)"""
+    return str(term or '').strip().lower()
+
+
+def field_leaf(name: str) -> str:
+    """점 경로 필드의 마지막 이름 (response.body.items[].bidNtceNo → bidNtceNo)"""
+    return name.rsplit('.', 1)[-1].replace('[]', '')
+
+
+def path_tokens(path: str) -> Set[str]:
+    """경로 토큰 (세그먼트 전체와 camelCase 단어, 소문자)"""
+    tokens = set()
+    for segment in _PATH_SPLIT_RE.split(path or ''):
+        if not segment:
+            continue
+        tokens.add(segment.lower())
+        words = _CAMEL_RE.findall(segment)
+        if len(words) > 1:
+            tokens.update(word.lower() for word in words)
+    return tokens
+
+
+def extract_postings(data: Dict) -> Tuple[List[Tuple[int, str, str]], List[Tuple[str, str, int, str]]]:
+    """
+    결과 하나의 엔드포인트와 색인 항목
+
+    Returns:
+        (endpoints [(endpoint_index, method, path)], postings [(kind, term, endpoint_index, field)])
+    """
+    rows = flatten_result(data)
+    endpoints = []
+    postings = set()
+
+    for row in rows['endpoints']:
+        index = row['endpoint_index']
+        path = row['path']
+        if not path and row['attributes']:
+            # 일반 API는 요청주소 URL의 경로를 엔드포인트 경로로 사용
+            try:
+                basic_info = json.loads(row['attributes'])
+            except ValueError:
+                basic_info = {}
+            path = urlparse(str(basic_info.get(GENERAL_PATH_KEY, '') or '')).path
+        endpoints.append((index, row['method'], path))
+        for token in path_tokens(path):
+            postings.add(('path', token, index, path))
+
+    for kind, table in (('param', 'parameters'), ('response', 'responses')):
+        for row in rows[table]:
+            name = row['name']
+            term = normalize_term(field_leaf(name))
+            if term:
+                postings.add((kind, term, row['endpoint_index'], name))
+
+    return endpoints, sorted(postings)
+
+
+class ApiIndex:
+    """API 역색인 (저장 스레드와 CLI에서 사용, 스레드 안전)"""
+
+    def __init__(self, path: str, commit_every: int = 200):
+        self.path = path
+        self.commit_every = commit_every
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._term_ids: Dict[Tuple[str, str], int] = {}
+        self.stats = {'indexed': 0, 'skipped': 0, 'removed': 0}
+
+    # ------------------------------------------------------------------
+    # 색인 갱신
+    # ------------------------------------------------------------------
+    def add(self, data: Dict, source: str = '', mtime_ns: int = 0):
+        """결과 하나 색인 (같은 API ID의 기존 항목은 교체)"""
+        api_id = str(data.get('api_id', ''))
+        if not api_id:
+            return
+        endpoints, postings = extract_postings(data)
+        info = data.get('info') or {}
+        api_info = data.get('api_info') or {}
+
+        with self._lock:
+            self._delete(api_id)
+            self._conn.execute(
+                'INSERT INTO apis VALUES (?, ?, ?, ?, ?, ?)',
+                (api_id, data.get('api_type', ''), info.get('제공기관', ''),
+                 str(api_info.get('title', '') or ''), source, mtime_ns)
+            )
+            self._conn.executemany(
+                'INSERT INTO endpoints VALUES (?, ?, ?, ?)',
+                [(api_id, index, method, path) for index, method, path in endpoints]
+            )
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO postings VALUES (?, ?, ?, ?)',
+                [(self._term_id(kind, term), api_id, index, field) for kind, term, index, field in postings]
+            )
+            self.stats['indexed'] += 1
+            self._pending += 1
+            if self._pending >= self.commit_every:
+                self._commit()
+
+    def add_saved(self, data: Dict, saved_files: List[str]):
+        """저장기 on_saved 훅 (저장된 JSON 파일을 출처로 기록)"""
+        source = next((path for path in saved_files if path.endswith('.json')), '')
+        mtime_ns = os.stat(source).st_mtime_ns if source and os.path.isfile(source) else 0
+        self.add(data, source=source, mtime_ns=mtime_ns)
+
+    def remove(self, api_id: str):
+        """API 하나의 색인 제거"""
+        with self._lock:
+            self._delete(str(api_id))
+            self.stats['removed'] += 1
+            self._pending += 1
+
+    def build(self, data_dir: str, prune: bool = True) -> Dict[str, int]:
+        """
+        저장 디렉토리 색인 (수정 시각이 같은 파일/세그먼트 항목은 건너뜀)
+
+        tree 모드 파일(data/{유형}/{기관}/*.json)과 packed 모드 세그먼트(data/packed) 모두 색인,
+        packed 항목의 출처는 '{세그먼트 경로}#{문서번호}'
+
+        Args:
+            data_dir: 크롤링 결과 루트 (./data)
+            prune: 파일/세그먼트 항목이 사라진 API 색인 제거
+        """
+        known = {
+            source: (api_id, mtime_ns)
+            for api_id, source, mtime_ns in self._conn.execute('SELECT api_id, source, mtime_ns FROM apis')
+        }
+
+        # (수정 시각, 문서번호, 출처, packed 색인 항목)
+        candidates: List[Tuple[int, str, str, Optional[Dict]]] = []
+        for path in glob.glob(os.path.join(data_dir, RESULT_FILE_PATTERN)):
+            try:
+                candidates.append((os.stat(path).st_mtime_ns, os.path.basename(path).split('_', 1)[0], path, None))
+            except OSError:
+                continue
+
+        packed = PackedStore(os.path.join(data_dir, PACKED_DIR_NAME), tree_dir=data_dir)
+        for api_id, entry in packed.entries().items():
+            candidates.append((int(entry.get('ts', 0) * 1e9), api_id, f"{entry['segment']}#{api_id}", entry))
+
+        # 같은 문서의 여러 수정일 파일({문서번호}_{수정일}.json)과 세그먼트 항목 중 가장 최근 것만 색인
+        latest: Dict[str, Tuple[int, str, str, Optional[Dict]]] = {}
+        for candidate in sorted(candidates, key=lambda c: (c[0], c[2])):
+            latest[candidate[1]] = candidate
+
+        seen = {source for _, _, source, _ in candidates}
+        for mtime_ns, _, source, entry in sorted(latest.values(), key=lambda c: (c[0], c[2])):
+            if known.get(source, (None, None))[1] == mtime_ns:
+                self.stats['skipped'] += 1
+                continue
+            try:
+                if entry is not None:
+                    data = packed.read_entry(entry)
+                else:
+                    with open(source, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if isinstance(data, dict) and data.get('api_id') and data.get('api_type'):
+                self.add(data, source=source, mtime_ns=mtime_ns)
+
+        if prune:
+            for source, (api_id, _) in known.items():
+                if source and source not in seen and self._source_of(api_id) == source:
+                    self.remove(api_id)
+
+        self.commit()
+        return dict(self.stats)
+
+    def _source_of(self, api_id: str) -> Optional[str]:
+        row = self._conn.execute('SELECT source FROM apis WHERE api_id = ?', (api_id,)).fetchone()
+        return row[0] if row else None
+
+    def _delete(self, api_id: str):
+        self._conn.execute('DELETE FROM postings WHERE api_id = ?', (api_id,))
+        self._conn.execute('DELETE FROM endpoints WHERE api_id = ?', (api_id,))
+        self._conn.execute('DELETE FROM apis WHERE api_id = ?', (api_id,))
+
+    def _term_id(self, kind: str, term: str) -> int:
+        """용어 ID (없으면 추가, 프로세스 내 캐시)"""
+        key = (kind, term)
+        term_id = self._term_ids.get(key)
+        if term_id is None:
+            self._conn.execute('INSERT OR IGNORE INTO terms (kind, term) VALUES (?, ?)', key)
+            term_id = self._conn.execute(
+                'SELECT term_id FROM terms WHERE kind = ? AND term = ?', key
+            ).fetchone()[0]
+            self._term_ids[key] = term_id
+        return term_id
+
+    def _commit(self):
+        self._conn.commit()
+        self._pending = 0
+
+    def commit(self):
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        """남은 변경 커밋 후 연결 종료"""
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # 질의
+    # ------------------------------------------------------------------
+    def query(self, kind: str, term: str, prefix: bool = False, limit: int = 0) -> List[Dict]:
+        """
+        용어를 포함하는 엔드포인트 목록
+
+        Args:
+            kind: 'param', 'response', 'path'
+            term: 찾을 이름 (대소문자 무시)
+            prefix: True면 접두어 일치
+            limit: 최대 결과 수 (0이면 전체)
+
+        Returns:
+            [{'api_id', 'api_type', 'org', 'title', 'method', 'path', 'endpoint_index', 'fields'}]
+        """
+        if kind not in TERM_KINDS:
+            raise ValueError(f"알 수 없는 용어 종류: {kind} (사용 가능: {', '.join(TERM_KINDS)})")
+        term = normalize_term(term)
+        if prefix:
+            # 'term' < x < 'term\uffff' 범위 검색 (UNIQUE 색인 사용)
+            condition, args = 't.term >= ? AND t.term < ?', (term, term + '\uffff')
+        else:
+            condition, args = 't.term = ?', (term,)
+
+        sql = f'''
+            SELECT p.api_id, a.api_type, a.org, a.title, e.method, e.path, p.endpoint_index,
+                   group_concat(p.field, char(31))
+            FROM terms t
+            JOIN postings p ON p.term_id = t.term_id
+            JOIN apis a ON a.api_id = p.api_id
+            LEFT JOIN endpoints e ON e.api_id = p.api_id AND e.endpoint_index = p.endpoint_index
+            WHERE t.kind = ? AND {condition}
+            GROUP BY p.api_id, p.endpoint_index
+            ORDER BY p.api_id, p.endpoint_index
+        '''
+        if limit > 0:
+            sql += f' LIMIT {int(limit)}'
+
+        with self._lock:
+            rows = self._conn.execute(sql, (kind, *args)).fetchall()
+        return [
+            {
+                'api_id': api_id, 'api_type': api_type, 'org': org, 'title': title,
+                'method': method or '', 'path': path or '', 'endpoint_index': index,
+                'fields': sorted(set(fields.split('\x1f'))) if fields else []
+            }
+            for api_id, api_type, org, title, method, path, index, fields in rows
+        ]
+
+    def api_ids(self, kind: str, term: str, prefix: bool = False) -> List[str]:
+        """용어를 포함하는 API ID 목록"""
+        return sorted({row['api_id'] for row in self.query(kind, term, prefix)})
+
+    def summary(self) -> Dict[str, int]:
+        """색인 규모"""
+        with self._lock:
+            counts = {
+                table: self._conn.execute(f'SELECT count(*) FROM {table}').fetchone()[0]
+                for table in ('apis', 'endpoints', 'terms', 'postings')
+            }
+        counts['size_bytes'] = os.path.getsize(self.path) if os.path.isfile(self.path) else 0
+        return counts
+
+
+def _print_rows(rows: Iterable[Dict]):
+    count = 0
+    for row in rows:
+        count += 1
+        endpoint = ' '.join(part for part in (row['method'], row['path']) if part) or f"#{row['endpoint_index']}"
+        print(f"{row['api_id']:<10} {row['api_type']:<8} {endpoint}  [{row['org']}] {row['title']}")
+        print(f"{'':<10} ↳ {', '.join(row['fields'])}")
+    print(f"\n총 {count}개 엔드포인트")
+
+
+def main():
+    from util.parser import DataExporter
+
+    parser = argparse.ArgumentParser(description='크롤링 결과 파라미터/응답 필드/경로 역색인')
+    parser.add_argument('--db', default=DataExporter.api_index_path(),
+                        help='색인 파일 경로 (기본값: ./data/api_index.sqlite)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='저장 디렉토리 색인 (변경된 파일만)')
+    build_parser.add_argument('--data-dir', default=DataExporter.DATA_DIR,
+                              help='크롤링 결과 루트 (기본값: ./data)')
+    build_parser.add_argument('--rebuild', action='store_true', help='기존 색인을 지우고 처음부터 색인')
+
+    query_parser = subparsers.add_parser('query', help='용어로 엔드포인트 조회')
+    query_parser.add_argument('kind', choices=TERM_KINDS, help='param: 요청 파라미터, response: 응답 필드, path: 경로 토큰')
+    query_parser.add_argument('term', help='찾을 이름 (대소문자 무시)')
+    query_parser.add_argument('--prefix', action='store_true', help='접두어 일치')
+    query_parser.add_argument('--limit', type=int, default=0, help='최대 결과 수 (기본값: 0 = 전체)')
+    query_parser.add_argument('--ids', action='store_true', help='API ID만 출력')
+
+    subparsers.add_parser('stats', help='색인 규모 출력')
+
+    args = parser.parse_args()
+
+    if args.command == 'build' and args.rebuild and os.path.isfile(args.db):
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(args.db + suffix):
+                os.remove(args.db + suffix)
+
+    index = ApiIndex(args.db)
+    try:
+        if args.command == 'build':
+            start = time.perf_counter()
+            stats = index.build(args.data_dir)
+            print(f"✅ 색인 완료 ({time.perf_counter() - start:.2f}초): 색인 {stats['indexed']}개, "
+                  f"변경 없음 {stats['skipped']}개, 제거 {stats['removed']}개")
+            print(f"   {index.summary()}")
+        elif args.command == 'query':
+            start = time.perf_counter()
+            if args.ids:
+                api_ids = index.api_ids(args.kind, args.term, args.prefix)
+                print('\n'.join(api_ids))
+                print(f"\n총 {len(api_ids)}개 API ({(time.perf_counter() - start) * 1000:.1f} ms)")
+            else:
+                rows = index.query(args.kind, args.term, args.prefix, args.limit)
+                _print_rows(rows)
+                print(f"   ({(time.perf_counter() - start) * 1000:.1f} ms)")
+        else:
+            for key, value in index.summary().items():
+                print(f"{key}: {value}")
+    finally:
+        index.close()
+
+
+if __name__ == '__main__':
+    main()
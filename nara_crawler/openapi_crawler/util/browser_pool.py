@@ -0,0 +1,117 @@
+"""
+Playwright 브라우저 컨텍스트 풀
+URL마다 컨텍스트/페이지를 새로 만들지 않고 미리 데운 컨텍스트를 재사용
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Page
+
+
+class PooledContext:
+    """풀에서 관리되는 컨텍스트/페이지 한 쌍"""
+
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        self.uses = 0
+
+
+class BrowserContextPool:
+    """재사용 가능한 브라우저 컨텍스트 풀
+
+    - 컨텍스트는 필요할 때 생성되고 최대 size개까지 유지
+    - 반납 시 쿠키/스토리지를 초기화하여 다음 URL에 상태가 새지 않도록 함
+    - max_uses회 사용한 컨텍스트는 닫고 새로 만들어 메모리 증가를 제한
+    """
+
+    def __init__(self, browser: Browser, size: int, max_uses: int = 50,
+                 context_options: Optional[Dict] = None,
+                 on_new_context: Optional[Callable[[BrowserContext], Awaitable[None]]] = None):
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.context_options = context_options or {}
+        self.on_new_context = on_new_context
+
+        # None은 아직 생성되지 않은 빈 자리를 의미
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(None)
+        self._all: List[PooledContext] = []
+        self.stats = {
+            'created': 0,
+            'recycled': 0,
+            'reused': 0
+        }
+
+    async def _create(self) -> PooledContext:
+        """새 컨텍스트와 페이지 생성"""
+        context = await self.browser.new_context(**self.context_options)
+        if self.on_new_context:
+            await self.on_new_context(context)
+        page = await context.new_page()
+        slot = PooledContext(context, page)
+        self._all.append(slot)
+        self.stats['created'] += 1
+        return slot
+
+    async def acquire(self) -> PooledContext:
+        """유휴 컨텍스트를 꺼내거나, 빈 자리(None)이면 새로 생성"""
+        slot = await self._idle.get()
+        if slot is not None:
+            self.stats['reused'] += 1
+            return slot
+
+        try:
+            return await self._create()
+        except Exception:
+            self._idle.put_nowait(None)
+            raise
+
+    async def _reset(self, slot: PooledContext):
+        """다음 사용을 위해 쿠키, 스토리지, 페이지 상태 초기화"""
+        try:
+            await slot.page.evaluate('''() => {
+                try { window.localStorage.clear(); } catch (e) {}
+                try { window.sessionStorage.clear(); } catch (e) {}
+            }''')
+        except Exception:
+            pass
+        await slot.context.clear_cookies()
+        await slot.page.goto('about:blank')
+
+    async def _discard(self, slot: PooledContext):
+        """컨텍스트 폐기"""
+        if slot in self._all:
+            self._all.remove(slot)
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+
+    async def release(self, slot: PooledContext, broken: bool = False):
+        """컨텍스트 반납 (사용 횟수 초과 또는 오류 시 재생성)"""
+        slot.uses += 1
+
+        if not broken and slot.uses < self.max_uses:
+            try:
+                await self._reset(slot)
+                self._idle.put_nowait(slot)
+                return
+            except Exception:
+                pass
+
+        # 재활용: 기존 컨텍스트를 닫고 빈 자리를 다음 acquire에서 채움
+        await self._discard(slot)
+        self.stats['recycled'] += 1
+        self._idle.put_nowait(None)
+
+    async def close(self):
+        """풀의 모든 컨텍스트 종료"""
+        for slot in list(self._all):
+            await self._discard(slot)
+        self._idle = asyncio.Queue()
+        for _ in range(self.size):
+            self._idle.put_nowait(None)
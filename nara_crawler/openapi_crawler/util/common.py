@@ -4,7 +4,17 @@
 """
 import re
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from util.spec_store import ENDPOINT_CACHE, spec_hash
+from util.text_cleaner import clean_all_text, clean_text
+
+
+# 일반 API 상세기능 조회 경로 (페이지 origin 기준 상대 경로)
+DETAIL_FUNCTION_PATH = '/tcs/dss/selectApiDetailFunction.do'
 
 
 class SwaggerProcessor:
@@ -24,7 +34,8 @@ class SwaggerProcessor:
             api_type: API 타입 (기본값: 'swagger')
 
         Returns:
-            표준화된 API 정보 딕셔너리
+            표준화된 API 정보 딕셔너리, api_info/endpoints는 정제된 텍스트, swagger_json은 원본 그대로
+            엔드포인트 캐시가 켜져 있으면 swagger_hash(명세 내용 해시)를 추가하고 같은 명세는 추출 결과를 공유 (읽기 전용)
         """
         from util.parser import NaraParser
         parser = NaraParser(None)
@@ -33,19 +44,206 @@ class SwaggerProcessor:
         base_url = parser.extract_base_url(swagger_json)
         api_info['base_url'] = base_url
         api_info['schemes'] = swagger_json.get('schemes', ['https'])
-        endpoints = parser.extract_endpoints(swagger_json)
+        clean_all_text(api_info, in_place=True)
+
+        def compute_endpoints() -> List[Dict]:
+            return clean_all_text(parser.extract_endpoints(swagger_json), in_place=True)
+
+        # 캐시가 꺼져 있으면 명세 전체를 직렬화하는 해시 계산도 생략
+        digest = None
+        if ENDPOINT_CACHE.enabled:
+            digest = spec_hash(swagger_json)
+            # 정제까지 마친 엔드포인트를 캐시 (같은 명세는 추출/정제 모두 한 번)
+            endpoints = ENDPOINT_CACHE.get_or_compute(digest, compute_endpoints)
+        else:
+            endpoints = compute_endpoints()
 
-        return {
+        result = {
             'api_id': api_id,
             'crawled_url': url,
             'crawled_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'info': table_info,
             'api_info': api_info,
-            'endpoints': endpoints,
-            'swagger_json': swagger_json,
-            'api_type': api_type
+            'endpoints': endpoints
+        }
+        if digest:
+            result['swagger_hash'] = digest
+        result['swagger_json'] = swagger_json
+        result['api_type'] = api_type
+        return result
+
+
+class GeneralApiProcessor:
+    """일반 API(selectApiDetailFunction.do) 상세기능 처리 클래스"""
+
+    REQUEST_TABLE_KEY = "요청변수(Request Parameter)"
+    RESPONSE_TABLE_KEY = "출력결과(Response Element)"
+
+    @staticmethod
+    def extract_request_params(soup: BeautifulSoup) -> List[Dict]:
+        """
+        상세기능 POST 요청에 필요한 값 추출 (정적 HTML의 hidden input과 select 옵션)
+
+        Args:
+            soup: openapi.do 페이지 BeautifulSoup 객체
+
+        Returns:
+            oprtinSeqNo, publicDataDetailPk, publicDataPk 묶음 리스트 (select 옵션 순서)
+        """
+        detail_pk_elem = soup.find(id='publicDataDetailPk')
+        data_pk_elem = soup.find(id='publicDataPk')
+        public_data_detail_pk = detail_pk_elem.get('value') if detail_pk_elem else None
+        public_data_pk = data_pk_elem.get('value') if data_pk_elem else None
+
+        params = []
+        select_elem = soup.find(id='open_api_detail_select')
+        if select_elem:
+            for opt in select_elem.find_all('option'):
+                if opt.get('value'):
+                    params.append({
+                        'oprtinSeqNo': opt['value'],
+                        'publicDataDetailPk': public_data_detail_pk,
+                        'publicDataPk': public_data_pk
+                    })
+        return params
+
+    @staticmethod
+    def parse_detail_fragment(html: str, base_url: str = '') -> Optional[Dict]:
+        """
+        selectApiDetailFunction.do 응답 HTML 조각을 파싱
+        (PlaywrightCrawler의 페이지 내 parseDetail과 동일한 구조 반환)
+
+        Args:
+            html: 응답 HTML
+            base_url: 링크 href를 절대 경로로 변환할 기준 URL
+
+        Returns:
+            {'endpoint': {...}} 또는 #open-api-detail-result가 없으면 None
+        """
+        doc = BeautifulSoup(html, 'html.parser')
+        api_detail_div = doc.find(id='open-api-detail-result')
+        if not api_detail_div:
+            return None
+
+        parsed_data = {
+            'endpoint': {
+                GeneralApiProcessor.REQUEST_TABLE_KEY: None,
+                GeneralApiProcessor.RESPONSE_TABLE_KEY: None
+            }
         }
 
+        for table_index, table in enumerate(api_detail_div.find_all('table')):
+            table_data = []
+
+            # 헤더 추출 (매핑용)
+            headers = []
+            header_row = table.find('tr')
+            if header_row:
+                headers = [th.get_text().strip() for th in header_row.find_all('th')]
+
+            # 데이터 행 추출 (첫 행(헤더) 제외)
+            for row in table.find_all('tr')[1:]:
+                cells = row.find_all('td')
+                if not cells:
+                    continue
+
+                row_data = {}
+                for cell_index, cell in enumerate(cells):
+                    header_name = headers[cell_index] if cell_index < len(headers) and headers[cell_index] else f'column_{cell_index}'
+                    cell_value = cell.get_text().strip()
+
+                    # 전화번호 특별 처리
+                    if '전화번호' in header_name:
+                        tel_elem = cell.select_one('#telNoDiv, #telNo')
+                        if tel_elem:
+                            cell_value = tel_elem.get_text().strip()
+
+                    # 링크 처리
+                    if not cell_value:
+                        link = cell.find('a')
+                        if link:
+                            cell_value = link.get_text().strip()
+                            href = link.get('href')
+                            row_data[f'{header_name}_link'] = urljoin(base_url, href) if href is not None else ''
+
+                    row_data[header_name] = cell_value
+
+                if row_data:
+                    table_data.append(row_data)
+
+            if table_data:
+                if table_index == 0:
+                    parsed_data['endpoint'][GeneralApiProcessor.REQUEST_TABLE_KEY] = table_data
+                elif table_index == 1:
+                    parsed_data['endpoint'][GeneralApiProcessor.RESPONSE_TABLE_KEY] = table_data
+
+        # div.box-gray > ul.dot-list 파싱 (endpoint 기본 정보)
+        box_gray = api_detail_div.select_one('div.box-gray')
+        dot_list = box_gray.select_one('ul.dot-list') if box_gray else None
+        if dot_list:
+            endpoint_data = {}
+            for li in dot_list.find_all('li'):
+                strong_tag = li.find('strong')
+                if strong_tag:
+                    key = strong_tag.get_text().strip()
+                    # strong 태그를 제거한 나머지 텍스트가 값
+                    value = li.get_text().replace(strong_tag.get_text(), '', 1).strip()
+                    endpoint_data[key] = value
+            parsed_data['endpoint'].update(endpoint_data)
+
+        return parsed_data
+
+    @staticmethod
+    def build_api_details(detail_results: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        상세기능 응답 목록을 api_details / endpoints 구조로 변환
+
+        Args:
+            detail_results: 요청 순서대로 정렬된 {'ok': bool, 'data': dict|None, 'error': str} 리스트
+
+        Returns:
+            (api_details, endpoints) - 입력 순서 유지, 텍스트는 정제된 상태
+        """
+        table_keys = (GeneralApiProcessor.REQUEST_TABLE_KEY, GeneralApiProcessor.RESPONSE_TABLE_KEY)
+        api_details = []
+        endpoints = []
+
+        for detail in detail_results:
+            if not detail.get('ok'):
+                api_details.append({'error': clean_text(detail.get('error'))})
+                continue
+
+            response_data = detail.get('data')
+            if not response_data:
+                api_details.append({'error': 'POST 요청 실패'})
+                continue
+            clean_all_text(response_data, in_place=True)
+
+            # endpoint가 없는 경우 전체 응답 저장
+            if not response_data.get('endpoint'):
+                api_details.append(response_data)
+                continue
+
+            # endpoint 데이터 분리: 기본 정보와 테이블 데이터
+            endpoint_basic_info = {}
+            endpoint_table_data = {}
+            for key, value in response_data['endpoint'].items():
+                if key in table_keys:
+                    endpoint_table_data[key] = value
+                else:
+                    endpoint_basic_info[key] = value
+
+            # api_details에는 전체 정보 유지 (테이블 데이터 포함), endpoints에는 기본 정보만
+            api_details.append({
+                'descriptions': {
+                    **endpoint_basic_info,
+                    **endpoint_table_data
+                }
+            })
+            endpoints.append(endpoint_basic_info)
+
+        return api_details, endpoints
+
 
 class ApiIdExtractor:
     """API ID 추출 클래스"""
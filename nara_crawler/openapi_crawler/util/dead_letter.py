@@ -0,0 +1,113 @@
+"""
+실패 URL 보관소 (Dead-letter queue)
+최종 실패한 URL을 오류 분류와 시도 횟수와 함께 JSON 파일에 보관하고, 성공하면 제거
+--retry-failed 모드에서 메타데이터 스캔 없이 보관된 URL만 다시 크롤링
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Dict, List
+
+from util.common import ApiIdExtractor
+
+
+# 오류 메시지 → 오류 분류 (위에서부터 먼저 일치하는 분류 사용)
+ERROR_CLASS_PATTERNS = (
+    ('timeout', re.compile(r'타임아웃|시간 초과|timeout', re.IGNORECASE)),
+    ('http_4xx', re.compile(r'HTTP 4\d\d')),
+    ('http_5xx', re.compile(r'HTTP 5\d\d')),
+    ('no_table', re.compile(r'테이블 정보 없음')),
+    ('extract', re.compile(r'추출 실패|감지')),
+    ('process_crash', re.compile(r'샤드 프로세스')),
+)
+
+
+def classify_error(errors: List[str]) -> str:
+    """오류 메시지 목록의 오류 분류"""
+    message = ' '.join(str(e) for e in errors or [])
+    for error_class, pattern in ERROR_CLASS_PATTERNS:
+        if pattern.search(message):
+            return error_class
+    return 'exception' if message else 'unknown'
+
+
+class DeadLetterQueue:
+    """URL → 실패 정보 보관소 (스레드 안전)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """보관 파일 로드"""
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️ 실패 URL 보관 파일 로드 실패: {e}")
+            self.entries = {}
+
+    def record_failure(self, result: Dict):
+        """실패 결과 기록 (시도 횟수 증가)"""
+        url = result.get('url')
+        if not url:
+            return
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        errors = result.get('errors', [])
+        with self._lock:
+            entry = self.entries.get(url) or {
+                'url': url,
+                'api_id': ApiIdExtractor.extract_api_id(url),
+                'attempts': 0,
+                'first_failed': now
+            }
+            entry['attempts'] += 1
+            entry['error_class'] = classify_error(errors)
+            entry['errors'] = errors[-5:]
+            entry['method'] = result.get('method', '')
+            entry['last_failed'] = now
+            self.entries[url] = entry
+
+    def resolve(self, url: str):
+        """성공한 URL 제거"""
+        with self._lock:
+            self.entries.pop(url, None)
+
+    def update(self, results: List[Dict]):
+        """크롤링 결과 반영 (성공은 제거, 실패는 기록)"""
+        for result in results:
+            if result.get('success'):
+                self.resolve(result.get('url'))
+            else:
+                self.record_failure(result)
+
+    def pending_urls(self, max_attempts: int = 0) -> List[str]:
+        """재시도 대상 URL (max_attempts > 0이면 시도 횟수가 그 미만인 것만)"""
+        return [
+            url for url, entry in self.entries.items()
+            if max_attempts <= 0 or entry.get('attempts', 0) < max_attempts
+        ]
+
+    def summary(self) -> Dict[str, int]:
+        """오류 분류별 URL 수"""
+        counts: Dict[str, int] = {}
+        for entry in self.entries.values():
+            error_class = entry.get('error_class', 'unknown')
+            counts[error_class] = counts.get(error_class, 0) + 1
+        return counts
+
+    def save(self):
+        """임시 파일에 쓴 뒤 교체"""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,124 @@
+"""
+BSCrawler HTTP 전송 계층 선택
+- aiohttp (기본): HTTP/1.1, 호스트당 동시 연결 수를 limit_per_host로 제한
+- httpx (선택): HTTP/2를 지원하는 서버에는 적은 수의 연결에서 요청을 다중화
+  (연결 재생성과 TLS 핸드셰이크 감소, 서버가 HTTP/2를 지원하지 않으면 HTTP/1.1로 동작)
+
+HttpxSession은 BSCrawler가 사용하는 aiohttp.ClientSession 인터페이스 일부만 제공
+(async with session.get/post(...) as response, response.status, await response.text(), close)
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+from util.timing import PhaseTimer
+
+
+TRANSPORT_AIOHTTP = 'aiohttp'
+TRANSPORT_HTTPX = 'httpx'
+TRANSPORTS = (TRANSPORT_AIOHTTP, TRANSPORT_HTTPX)
+
+
+def require_httpx():
+    """httpx(h2 포함) 설치 확인"""
+    try:
+        import httpx  # noqa: F401
+        import h2  # noqa: F401
+    except ImportError as e:
+        raise ImportError("httpx 전송은 httpx[http2]가 필요합니다. (pip install 'httpx[http2]')") from e
+
+
+class HttpxResponse:
+    """aiohttp ClientResponse 대응 응답 (status, text())"""
+
+    def __init__(self, response):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.http_version = response.http_version
+
+    async def text(self) -> str:
+        """본문 전체 읽기 (읽기 시간 초과는 asyncio.TimeoutError로 변환)"""
+        import httpx
+
+        try:
+            await self._response.aread()
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        return self._response.text
+
+
+class _RequestContext:
+    """session.get()/post() 반환값 (async with 전용, 응답 헤더 수신까지를 ttfb로 기록)"""
+
+    def __init__(self, session: 'HttpxSession', method: str, url: str,
+                 data: Optional[Dict] = None, headers: Optional[Dict] = None,
+                 trace_request_ctx: Optional[PhaseTimer] = None):
+        self._session = session
+        self._method = method
+        self._url = url
+        self._data = data
+        self._headers = headers
+        self._timer = trace_request_ctx
+        self._response = None
+
+    async def __aenter__(self) -> HttpxResponse:
+        import httpx
+
+        client = self._session.client
+        start = time.perf_counter()
+        try:
+            request = client.build_request(self._method, self._url, data=self._data, headers=self._headers)
+            self._response = await client.send(request, stream=True)
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+
+        if isinstance(self._timer, PhaseTimer):
+            # 연결 풀 대기, 연결 생성(TLS 포함), 서버 처리 시간이 모두 포함됨
+            self._timer.add('ttfb', time.perf_counter() - start)
+        self._session.record_version(self._response.http_version)
+        return HttpxResponse(self._response)
+
+    async def __aexit__(self, *exc):
+        if self._response is not None:
+            await self._response.aclose()
+        return False
+
+
+class HttpxSession:
+    """httpx.AsyncClient 기반 세션 (aiohttp.ClientSession 대체)"""
+
+    def __init__(self, timeout_sec: float = 10, connect_timeout: float = 3, read_timeout: float = 7,
+                 max_connections: int = 100, max_keepalive: int = 30,
+                 headers: Optional[Dict[str, str]] = None, http2: bool = True):
+        require_httpx()
+        import httpx
+
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(timeout_sec, connect=connect_timeout, read=read_timeout),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive),
+            headers=headers
+        )
+        # 응답 HTTP 버전별 요청 수 (예: {'HTTP/2': 120})
+        self.http_versions: Dict[str, int] = {}
+
+    def record_version(self, http_version: str):
+        self.http_versions[http_version] = self.http_versions.get(http_version, 0) + 1
+
+    def get(self, url: str, **kwargs) -> _RequestContext:
+        return _RequestContext(self, 'GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> _RequestContext:
+        return _RequestContext(self, 'POST', url, **kwargs)
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def __aenter__(self) -> 'HttpxSession':
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
@@ -0,0 +1,141 @@
+"""
+증분 크롤링 매니페스트
+문서번호별 카탈로그 수정일(update_date), 페이지 수정일, 내용 해시, API 타입, 저장 경로를 JSONL로 기록
+- 한 줄에 문서 하나, 같은 문서는 마지막 줄이 유효 (추가 기록만 하고 종료 시 압축)
+- 카탈로그 update_date가 그대로인 문서는 다음 실행에서 건너뜀
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+
+# 내용 해시에서 제외할 키 (실행마다 달라지는 값)
+HASH_EXCLUDED_KEYS = ('crawled_time',)
+
+
+def content_hash(data: Dict) -> str:
+    """크롤링 결과 내용 해시 (크롤링 시간 제외)"""
+    payload = {k: v for k, v in data.items() if k not in HASH_EXCLUDED_KEYS}
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class CrawlManifest:
+    """문서번호 → 마지막 저장 정보 매니페스트 (스레드 안전)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._line_count = 0
+        self._file = None
+        self.load()
+
+    def load(self):
+        """기존 매니페스트 로드 (손상된 줄은 무시)"""
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                self._line_count += 1
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                doc_num = str(entry.get('doc_num', ''))
+                if doc_num:
+                    self.entries[doc_num] = entry
+
+    def get(self, doc_num) -> Optional[Dict]:
+        """문서 기록 조회"""
+        return self.entries.get(str(doc_num))
+
+    def is_unchanged(self, doc_num, update_date: str) -> bool:
+        """카탈로그 update_date가 기록과 같고 저장 파일이 남아 있으면 True"""
+        entry = self.get(doc_num)
+        if not entry or not update_date:
+            return False
+        if entry.get('update_date') != update_date:
+            return False
+        return all(os.path.exists(path) for path in entry.get('paths', []))
+
+    def filter_changed(self, numbers: Iterable[int], details: Dict) -> List[int]:
+        """
+        변경된(또는 새) 문서번호만 남김
+
+        Args:
+            numbers: 유효 문서번호 목록
+            details: 메타데이터 스캐너 결과 details (번호 → {'update_date': ...})
+        """
+        return [
+            num for num in numbers
+            if not self.is_unchanged(num, (details.get(num) or {}).get('update_date', ''))
+        ]
+
+    def record(self, data: Dict, paths: List[str], update_date: str = ''):
+        """
+        저장 완료된 문서 기록 (이전 버전의 개별 파일 중 더 이상 쓰지 않는 파일은 삭제)
+
+        Args:
+            data: 크롤링 결과 data
+            paths: 이번에 저장된 파일 경로
+            update_date: 메타데이터 스캐너의 카탈로그 update_date
+        """
+        doc_num = str(data.get('api_id', ''))
+        if not doc_num:
+            return
+
+        entry = {
+            'doc_num': doc_num,
+            'update_date': update_date,
+            'modified_date': (data.get('info') or {}).get('수정일', ''),
+            'content_hash': content_hash(data),
+            'api_type': data.get('api_type', 'unknown'),
+            'paths': sorted(set(paths)),
+            'recorded_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+        with self._lock:
+            previous = self.entries.get(doc_num)
+            self.entries[doc_num] = entry
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._line_count += 1
+
+        if previous:
+            self._remove_stale_files(doc_num, previous.get('paths', []), entry['paths'])
+
+    @staticmethod
+    def _remove_stale_files(doc_num: str, old_paths: List[str], new_paths: List[str]):
+        """수정일이 바뀌어 이름이 달라진 이전 개별 파일({문서번호}_{수정일}.*) 삭제"""
+        prefix = f"{doc_num}_"
+        for path in set(old_paths) - set(new_paths):
+            if os.path.basename(path).startswith(prefix) and os.path.isfile(path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def close(self):
+        """파일 닫기 (중복 줄이 많으면 문서당 한 줄로 다시 기록)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+            if self._line_count > len(self.entries) * 2:
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    for entry in self.entries.values():
+                        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                os.replace(tmp_path, self.path)
+                self._line_count = len(self.entries)
@@ -0,0 +1,329 @@
+"""
+기관별 묶음 저장소 (packed 출력 모드)
+문서마다 JSON/XML 파일을 만드는 대신 유형/기관별 JSONL 세그먼트에 한 줄씩 추가하고,
+옆에 오프셋 색인을 두어 문서 하나를 바로 읽을 수 있게 함 (수십만 개 작은 파일 → 기관 수만큼의 파일)
+
+    data/packed/03. Swagger API/조달청.jsonl       결과 한 줄에 하나 (추가 기록만)
+    data/packed/03. Swagger API/조달청.jsonl.idx   {'api_id', 'prefix', 'offset', 'length', 'ts'} 한 줄에 하나
+
+- 같은 문서를 다시 저장하면 새 줄을 추가하고 색인의 마지막(ts 최신) 항목이 유효 (compact로 정리)
+- 색인 항목은 세그먼트 기록 이후에 flush하므로, 중단 시 색인에만 있는 항목은 길이 검사로 무시
+- export_tree로 기존 디렉토리 구조(data/{유형}/{기관}/{문서번호}_{수정일}.json/.xml)를 그대로 복원
+
+실행 (openapi_crawler 디렉토리에서):
+    python -m util.packed_store stats
+    python -m util.packed_store get 15000001
+    python -m util.packed_store export --formats json xml
+    python -m util.packed_store compact
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from util.parser import DataExporter
+
+
+SEGMENT_SUFFIX = '.jsonl'
+INDEX_SUFFIX = '.idx'
+
+# packed 모드에서 세그먼트로 대체되는 형식 (csv/parquet은 그대로 기록)
+PACKED_FORMATS = ('json', 'xml')
+
+
+class PackedStore:
+    """유형/기관별 JSONL 세그먼트 + 오프셋 색인 (저장 스레드에서 기록, 스레드 안전)"""
+
+    def __init__(self, root: str, tree_dir: Optional[str] = None, max_open: int = 64):
+        """
+        Args:
+            root: 세그먼트 루트 (data/packed)
+            tree_dir: 디렉토리 구조 기준 경로 (기본값: DataExporter.DATA_DIR)
+            max_open: 동시에 열어 둘 세그먼트 수 (초과 시 오래 쓰지 않은 것부터 닫음)
+        """
+        self.root = root
+        self.tree_dir = tree_dir or DataExporter.DATA_DIR
+        self.max_open = max_open
+        self._handles: 'OrderedDict[str, Tuple]' = OrderedDict()
+        self._offsets: Dict[str, int] = {}
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._lock = threading.Lock()
+        self.stats = {'appended': 0, 'segments': 0}
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def segment_path(self, base_dir: str) -> str:
+        """저장 디렉토리(data/{유형}/{기관})에 대응하는 세그먼트 경로"""
+        rel_dir = os.path.relpath(base_dir, self.tree_dir)
+        return os.path.join(self.root, rel_dir + SEGMENT_SUFFIX)
+
+    def append(self, data: Dict, base_dir: str, file_prefix: str) -> str:
+        """
+        결과 한 줄 추가
+
+        Args:
+            data: 크롤링 결과 data
+            base_dir, file_prefix: DataExporter.resolve_output_path 결과 (export 시 그대로 사용)
+
+        Returns:
+            세그먼트 경로
+        """
+        segment = self.segment_path(base_dir)
+        line = json.dumps(data, ensure_ascii=False).encode('utf-8') + b'\n'
+
+        with self._lock:
+            data_file, index_file = self._open(segment)
+            offset = self._offsets[segment]
+            data_file.write(line)
+            self._offsets[segment] = offset + len(line)
+
+            entry = {
+                'api_id': str(data.get('api_id', '')),
+                'prefix': file_prefix,
+                'offset': offset,
+                'length': len(line),
+                'ts': time.time()
+            }
+            index_file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            if self._entries is not None:
+                self._entries[entry['api_id']] = {**entry, 'segment': segment}
+            self.stats['appended'] += 1
+        return segment
+
+    def _open(self, segment: str):
+        """세그먼트/색인 파일 핸들 (LRU)"""
+        handles = self._handles.get(segment)
+        if handles is not None:
+            self._handles.move_to_end(segment)
+            return handles
+
+        if len(self._handles) >= self.max_open:
+            _, (data_file, index_file) = self._handles.popitem(last=False)
+            self._close_pair(data_file, index_file)
+
+        os.makedirs(os.path.dirname(segment), exist_ok=True)
+        if not os.path.isfile(segment):
+            self.stats['segments'] += 1
+        data_file = open(segment, 'ab')
+        index_file = open(segment + INDEX_SUFFIX, 'a', encoding='utf-8')
+        self._offsets[segment] = data_file.tell()
+        self._handles[segment] = (data_file, index_file)
+        return data_file, index_file
+
+    @staticmethod
+    def _close_pair(data_file, index_file):
+        # 세그먼트를 먼저 기록해야 색인이 가리키는 줄이 항상 존재
+        data_file.close()
+        index_file.close()
+
+    def flush(self):
+        """열린 세그먼트와 색인 flush (세그먼트 먼저)"""
+        with self._lock:
+            for data_file, _ in self._handles.values():
+                data_file.flush()
+            for _, index_file in self._handles.values():
+                index_file.flush()
+
+    def close(self):
+        """모든 핸들 닫기"""
+        with self._lock:
+            while self._handles:
+                _, (data_file, index_file) = self._handles.popitem(last=False)
+                self._close_pair(data_file, index_file)
+            self._offsets.clear()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def segments(self) -> List[str]:
+        """세그먼트 경로 목록"""
+        found = []
+        for dir_path, _, file_names in os.walk(self.root):
+            for file_name in file_names:
+                if file_name.endswith(SEGMENT_SUFFIX):
+                    found.append(os.path.join(dir_path, file_name))
+        return sorted(found)
+
+    def _read_index(self, segment: str) -> Iterator[Dict]:
+        """세그먼트 색인 항목 (세그먼트 크기를 넘는 항목과 손상된 줄은 무시)"""
+        index_path = segment + INDEX_SUFFIX
+        if not os.path.isfile(index_path):
+            return
+        size = os.path.getsize(segment)
+        with open(index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get('offset', 0) + entry.get('length', 0) <= size:
+                    entry['segment'] = segment
+                    yield entry
+
+    def entries(self) -> Dict[str, Dict]:
+        """API ID → 유효(최신) 색인 항목 (처음 한 번 모든 색인을 읽고 이후 기록분은 바로 반영)"""
+        self.flush()
+        with self._lock:
+            if self._entries is None:
+                latest: Dict[str, Dict] = {}
+                for segment in self.segments():
+                    for entry in self._read_index(segment):
+                        current = latest.get(entry['api_id'])
+                        if current is None or entry.get('ts', 0) >= current.get('ts', 0):
+                            latest[entry['api_id']] = entry
+                self._entries = latest
+            return self._entries
+
+    @staticmethod
+    def read_entry(entry: Dict) -> Dict:
+        """색인 항목이 가리키는 결과 한 줄 읽기"""
+        with open(entry['segment'], 'rb') as f:
+            f.seek(entry['offset'])
+            return json.loads(f.read(entry['length']))
+
+    def get(self, api_id) -> Optional[Dict]:
+        """문서번호로 최신 결과 조회"""
+        entry = self.entries().get(str(api_id))
+        return self.read_entry(entry) if entry else None
+
+    def iter_latest(self) -> Iterator[Tuple[Dict, Dict]]:
+        """(색인 항목, 결과) - 세그먼트별로 오프셋 순서대로 읽음"""
+        by_segment: Dict[str, List[Dict]] = {}
+        for entry in self.entries().values():
+            by_segment.setdefault(entry['segment'], []).append(entry)
+        for segment in sorted(by_segment):
+            with open(segment, 'rb') as f:
+                for entry in sorted(by_segment[segment], key=lambda e: e['offset']):
+                    f.seek(entry['offset'])
+                    yield entry, json.loads(f.read(entry['length']))
+
+    def summary(self) -> Dict[str, int]:
+        """세그먼트 수, 유효 문서 수, 전체 줄 수, 크기"""
+        segments = self.segments()
+        lines = 0
+        for segment in segments:
+            with open(segment, 'rb') as f:
+                lines += sum(1 for _ in f)
+        return {
+            'segments': len(segments),
+            'documents': len(self.entries()),
+            'records': lines,
+            'size_bytes': sum(os.path.getsize(s) + os.path.getsize(s + INDEX_SUFFIX)
+                              for s in segments if os.path.isfile(s + INDEX_SUFFIX))
+        }
+
+    # ------------------------------------------------------------------
+    # 내보내기 / 정리
+    # ------------------------------------------------------------------
+    def export_tree(self, out_dir: str, formats: List[str] = ('json', 'xml')) -> Dict[str, int]:
+        """
+        기존 디렉토리 구조로 내보내기 ({out_dir}/{유형}/{기관}/{문서번호}_{수정일}.json/.xml)
+
+        Returns:
+            {'exported': 문서 수, 'failed': 실패 수}
+        """
+        counts = {'exported': 0, 'failed': 0}
+        created_dirs = set()
+        for entry, data in self.iter_latest():
+            rel_dir = os.path.relpath(entry['segment'], self.root)[:-len(SEGMENT_SUFFIX)]
+            base_dir = os.path.join(out_dir, rel_dir)
+            if base_dir not in created_dirs:
+                os.makedirs(base_dir, exist_ok=True)
+                created_dirs.add(base_dir)
+
+            ok = True
+            for format_type in formats:
+                file_path = os.path.join(base_dir, f"{entry['prefix']}.{format_type}")
+                if format_type == 'json':
+                    success, error = DataExporter._save_as_json(data, file_path, make_dirs=False)
+                elif format_type == 'xml':
+                    success, error = DataExporter._save_as_xml(data, file_path, make_dirs=False)
+                else:
+                    continue
+                if not success:
+                    ok = False
+                    print(f"   ❌ {entry['api_id']} 내보내기 실패: {error}")
+            counts['exported' if ok else 'failed'] += 1
+        return counts
+
+    def compact(self) -> Dict[str, int]:
+        """유효 항목만 남기도록 세그먼트 다시 기록 (기록 중이 아닐 때 실행)"""
+        self.close()
+        live: Dict[str, List[Dict]] = {}
+        for entry in self.entries().values():
+            live.setdefault(entry['segment'], []).append(entry)
+
+        counts = {'segments': 0, 'removed_records': 0}
+        for segment in self.segments():
+            entries = sorted(live.get(segment, []), key=lambda e: e['offset'])
+            total = sum(1 for _ in self._read_index(segment))
+            if total == len(entries):
+                continue
+
+            tmp_segment, tmp_index = f'{segment}.tmp', f'{segment}{INDEX_SUFFIX}.tmp'
+            with open(segment, 'rb') as src, open(tmp_segment, 'wb') as dst, \
+                    open(tmp_index, 'w', encoding='utf-8') as index_file:
+                for entry in entries:
+                    src.seek(entry['offset'])
+                    line = src.read(entry['length'])
+                    new_entry = {key: entry[key] for key in ('api_id', 'prefix', 'ts')}
+                    new_entry.update(offset=dst.tell(), length=len(line))
+                    dst.write(line)
+                    index_file.write(json.dumps(new_entry, ensure_ascii=False) + '\n')
+            os.replace(tmp_segment, segment)
+            os.replace(tmp_index, segment + INDEX_SUFFIX)
+            counts['segments'] += 1
+            counts['removed_records'] += total - len(entries)
+
+        self._entries = None
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='packed 출력 모드 세그먼트 조회/내보내기/정리')
+    parser.add_argument('--root', default=DataExporter.packed_dir(),
+                        help='세그먼트 루트 (기본값: ./data/packed)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('stats', help='세그먼트/문서 수와 크기')
+
+    get_parser = subparsers.add_parser('get', help='문서번호로 결과 출력')
+    get_parser.add_argument('api_id', help='문서번호')
+
+    export_parser = subparsers.add_parser('export', help='기존 디렉토리 구조로 내보내기')
+    export_parser.add_argument('--out-dir', default=DataExporter.DATA_DIR,
+                               help='내보낼 루트 (기본값: ./data)')
+    export_parser.add_argument('--formats', nargs='+', default=['json', 'xml'], choices=PACKED_FORMATS,
+                               help='파일 형식 (기본값: json xml)')
+
+    subparsers.add_parser('compact', help='같은 문서의 이전 기록 제거')
+
+    args = parser.parse_args()
+    store = PackedStore(args.root)
+
+    if args.command == 'stats':
+        for key, value in store.summary().items():
+            print(f"{key}: {value}")
+    elif args.command == 'get':
+        data = store.get(args.api_id)
+        if data is None:
+            print(f"❌ {args.api_id} 문서가 없습니다.")
+            return
+        print(json.dumps(data, ensure_ascii=False, indent=2))
+    elif args.command == 'export':
+        start = time.perf_counter()
+        counts = store.export_tree(args.out_dir, args.formats)
+        print(f"✅ 내보내기 완료 ({time.perf_counter() - start:.2f}초): {counts['exported']}개 문서, "
+              f"실패 {counts['failed']}개 → {args.out_dir}")
+    else:
+        counts = store.compact()
+        print(f"✅ 정리 완료: 세그먼트 {counts['segments']}개, 이전 기록 {counts['removed_records']}개 제거")
+
+
+if __name__ == '__main__':
+    main()
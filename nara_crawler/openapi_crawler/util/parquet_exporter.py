@@ -0,0 +1,321 @@
+"""
+Parquet 내보내기
+크롤링 결과를 정규화된 테이블(apis, endpoints, parameters, responses)로 분리하여
+api_type 기준으로 파티셔닝된 Parquet 데이터셋에 저장 (pandas/DuckDB에서 바로 조회)
+
+    data/parquet/apis/api_type=swagger/<uuid>-0.parquet
+    data/parquet/endpoints/api_type=general/<uuid>-0.parquet
+    ...
+
+pyarrow는 선택 의존성: --formats parquet 사용 시에만 필요
+"""
+
+import json
+import os
+from typing import Dict, List
+
+from util.common import GeneralApiProcessor
+
+
+PARQUET_TABLES = ('apis', 'endpoints', 'parameters', 'responses')
+PARTITION_COLUMN = 'api_type'
+
+# 반복 값이 많은 컬럼 (dictionary 인코딩)
+DICTIONARY_COLUMNS = frozenset({
+    'api_type', '제공기관', 'API 유형', '분류체계', '관리부서명', '데이터포맷',
+    '이용허락범위', 'method', 'section', 'type', 'status_code'
+})
+
+# apis 테이블에 포함할 테이블 정보 필드 (all_result_table.csv와 동일)
+API_INFO_FIELDS = [
+    '분류체계', '제공기관', '관리부서명', '관리부서 전화번호', 'API 유형',
+    '데이터포맷', '활용신청', '키워드', '등록일', '수정일', '비용부과유무', '이용허락범위'
+]
+
+# 테이블별 컬럼 순서
+TABLE_COLUMNS = {
+    'apis': ['api_id', 'api_type', 'crawled_url', 'crawled_time', *API_INFO_FIELDS,
+             'title', 'description', 'version', 'base_url', 'endpoint_count'],
+    'endpoints': ['api_id', 'api_type', 'endpoint_index', 'method', 'path', 'description',
+                  'section', 'tags', 'attributes'],
+    'parameters': ['api_id', 'api_type', 'endpoint_index', 'name', 'description',
+                   'required', 'type', 'attributes'],
+    'responses': ['api_id', 'api_type', 'endpoint_index', 'status_code', 'name',
+                  'description', 'type', 'attributes'],
+}
+
+# 일반 API 요청변수/출력결과 표의 헤더
+GENERAL_NAME_KEYS = ('항목명(영문)', '항목명', '변수명')
+GENERAL_DESCRIPTION_KEYS = ('항목설명', '설명', '항목명(국문)')
+GENERAL_REQUIRED_KEY = '항목구분'
+GENERAL_TYPE_KEYS = ('타입', '항목타입')
+GENERAL_REQUIRED_VALUES = ('필', '필수', '1', 'Y', 'y')
+
+
+def _first(row: Dict, keys) -> str:
+    """후보 키 중 처음 값이 있는 항목 반환"""
+    for key in keys:
+        value = row.get(key)
+        if value:
+            return str(value)
+    return ''
+
+
+def _to_str(value) -> str:
+    """스칼라는 문자열로, 리스트/딕셔너리는 JSON 문자열로 변환"""
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def flatten_result(data: Dict) -> Dict[str, List[Dict]]:
+    """
+    크롤링 결과 하나를 테이블별 행 목록으로 변환
+
+    Args:
+        data: BS/PW 크롤러의 result['data']
+
+    Returns:
+        {'apis': [...], 'endpoints': [...], 'parameters': [...], 'responses': [...]}
+    """
+    api_id = str(data.get('api_id', ''))
+    api_type = data.get('api_type', 'unknown') or 'unknown'
+    info = data.get('info', {}) or {}
+    api_info = data.get('api_info', {}) or {}
+    rows = {table: [] for table in PARQUET_TABLES}
+
+    key = {'api_id': api_id, 'api_type': api_type}
+
+    if api_type == 'general':
+        _flatten_general(data, key, rows)
+    else:
+        _flatten_swagger(data, key, rows)
+
+    api_row = {
+        **key,
+        'crawled_url': data.get('crawled_url', ''),
+        'crawled_time': data.get('crawled_time', ''),
+        'title': _to_str(api_info.get('title', '')),
+        'description': _to_str(api_info.get('description', '')),
+        'version': _to_str(api_info.get('version', '')),
+        'base_url': _to_str(api_info.get('base_url', '')),
+        'endpoint_count': len(rows['endpoints'])
+    }
+    for field in API_INFO_FIELDS:
+        api_row[field] = _to_str(info.get(field, ''))
+    rows['apis'].append(api_row)
+
+    return rows
+
+
+def _field_attributes(field: Dict, **extra) -> str:
+    """평탄화 필드의 부가 정보 (attributes 컬럼)"""
+    return _to_str({
+        **extra,
+        'required': field.get('required', False),
+        'format': field.get('format', ''),
+        'ref': field.get('ref', ''),
+        'circular': field.get('circular', False)
+    })
+
+
+def _flatten_swagger(data: Dict, key: Dict, rows: Dict[str, List[Dict]]):
+    """Swagger/LINK 결과의 endpoints(파라미터/응답 포함) 정규화
+
+    스키마 평탄화 필드(fields)가 있는 body 파라미터는 '{파라미터}.{필드}' 행을 추가하고,
+    응답은 필드마다 한 행으로 기록 (필드가 없으면 응답 코드당 한 행)
+    """
+    for index, endpoint in enumerate(data.get('endpoints', []) or []):
+        if not isinstance(endpoint, dict):
+            continue
+        rows['endpoints'].append({
+            **key,
+            'endpoint_index': index,
+            'method': _to_str(endpoint.get('method', '')),
+            'path': _to_str(endpoint.get('path', '')),
+            'description': _to_str(endpoint.get('description', '')),
+            'section': _to_str(endpoint.get('section', '')),
+            'tags': _to_str(endpoint.get('tags', [])),
+            'attributes': ''
+        })
+        for param in endpoint.get('parameters', []) or []:
+            param_name = _to_str(param.get('name', ''))
+            rows['parameters'].append({
+                **key,
+                'endpoint_index': index,
+                'name': param_name,
+                'description': _to_str(param.get('description', '')),
+                'required': bool(param.get('required', False)),
+                'type': _to_str(param.get('type', '')),
+                'attributes': _to_str({'in': param['in']}) if param.get('in') else ''
+            })
+            for field in param.get('fields', []) or []:
+                rows['parameters'].append({
+                    **key,
+                    'endpoint_index': index,
+                    'name': f"{param_name}.{field.get('name', '')}",
+                    'description': _to_str(field.get('description', '')),
+                    'required': bool(field.get('required', False)),
+                    'type': _to_str(field.get('type', '')),
+                    'attributes': _field_attributes(field, **{'in': param.get('in', '')})
+                })
+        for response in endpoint.get('responses', []) or []:
+            fields = response.get('fields', []) or []
+            for field in fields:
+                rows['responses'].append({
+                    **key,
+                    'endpoint_index': index,
+                    'status_code': _to_str(response.get('status_code', '')),
+                    'name': _to_str(field.get('name', '')),
+                    'description': _to_str(field.get('description', '')),
+                    'type': _to_str(field.get('type', '')),
+                    'attributes': _field_attributes(field, response_description=response.get('description', ''))
+                })
+            if fields:
+                continue
+            rows['responses'].append({
+                **key,
+                'endpoint_index': index,
+                'status_code': _to_str(response.get('status_code', '')),
+                'name': '',
+                'description': _to_str(response.get('description', '')),
+                'type': _to_str(response.get('type', '')),
+                'attributes': ''
+            })
+
+
+def _flatten_general(data: Dict, key: Dict, rows: Dict[str, List[Dict]]):
+    """일반 API 결과의 api_details(요청변수/출력결과 표) 정규화"""
+    index = 0
+    for detail in data.get('api_details', []) or []:
+        descriptions = detail.get('descriptions') if isinstance(detail, dict) else None
+        if not isinstance(descriptions, dict):
+            continue
+
+        request_rows = descriptions.get(GeneralApiProcessor.REQUEST_TABLE_KEY) or []
+        response_rows = descriptions.get(GeneralApiProcessor.RESPONSE_TABLE_KEY) or []
+        basic_info = {
+            k: v for k, v in descriptions.items()
+            if k not in (GeneralApiProcessor.REQUEST_TABLE_KEY, GeneralApiProcessor.RESPONSE_TABLE_KEY)
+        }
+
+        rows['endpoints'].append({
+            **key,
+            'endpoint_index': index,
+            'method': '',
+            'path': '',
+            'description': '',
+            'section': '',
+            'tags': '',
+            'attributes': _to_str(basic_info)
+        })
+        for row in request_rows:
+            rows['parameters'].append({
+                **key,
+                'endpoint_index': index,
+                'name': _first(row, GENERAL_NAME_KEYS),
+                'description': _first(row, GENERAL_DESCRIPTION_KEYS),
+                'required': str(row.get(GENERAL_REQUIRED_KEY, '')).strip() in GENERAL_REQUIRED_VALUES,
+                'type': _first(row, GENERAL_TYPE_KEYS),
+                'attributes': _to_str(row)
+            })
+        for row in response_rows:
+            rows['responses'].append({
+                **key,
+                'endpoint_index': index,
+                'status_code': '',
+                'name': _first(row, GENERAL_NAME_KEYS),
+                'description': _first(row, GENERAL_DESCRIPTION_KEYS),
+                'type': _first(row, GENERAL_TYPE_KEYS),
+                'attributes': _to_str(row)
+            })
+        index += 1
+
+
+class ParquetExporter:
+    """결과를 테이블별로 모아 일정 건수마다 파티션 파일로 기록"""
+
+    def __init__(self, output_dir: str, flush_every: int = 500):
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as e:
+            raise ImportError("parquet 형식은 pyarrow가 필요합니다. (pip install pyarrow)") from e
+
+        self.output_dir = output_dir
+        self.flush_every = flush_every
+        self._rows: Dict[str, List[Dict]] = {table: [] for table in PARQUET_TABLES}
+        self._pending = 0
+        self.written_files: List[str] = []
+
+    def add(self, data: Dict):
+        """결과 하나 추가 (flush_every 건마다 기록)"""
+        for table, table_rows in flatten_result(data).items():
+            self._rows[table].extend(table_rows)
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """모인 행을 테이블별 데이터셋에 기록
+
+        모든 테이블을 먼저 변환한 뒤 기록하고, 전부 기록한 후에만 행을 비움
+        도중에 기록이 실패하면 이번 flush에서 쓴 파일을 지우고 행을 그대로 두어 다음 flush에서 배치 전체를 다시 기록
+        """
+        if not self._pending:
+            return
+        built = [
+            (table, self._build_table(table, self._rows[table]))
+            for table in PARQUET_TABLES if self._rows[table]
+        ]
+        written: List[str] = []
+        try:
+            for table, arrow_table in built:
+                self._write_table(table, arrow_table, written)
+        except Exception:
+            for path in written:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            raise
+        self.written_files.extend(written)
+        self._rows = {table: [] for table in PARQUET_TABLES}
+        self._pending = 0
+
+    def close(self):
+        """남은 행 기록"""
+        self.flush()
+
+    def _build_table(self, table: str, table_rows: List[Dict]):
+        """행 목록을 pyarrow Table로 변환 (반복 값 컬럼은 dictionary 타입)"""
+        import pyarrow as pa
+
+        arrays, names = [], []
+        for column in TABLE_COLUMNS[table]:
+            values = [row.get(column) for row in table_rows]
+            if column in ('endpoint_index', 'endpoint_count'):
+                array = pa.array(values, type=pa.int32())
+            elif column == 'required':
+                array = pa.array(values, type=pa.bool_())
+            else:
+                array = pa.array(values, type=pa.string())
+                if column in DICTIONARY_COLUMNS:
+                    array = array.dictionary_encode()
+            arrays.append(array)
+            names.append(column)
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def _write_table(self, table: str, arrow_table, written: List[str]):
+        """api_type 파티션으로 데이터셋에 추가 (파일명에 uuid가 붙어 기존 파일과 충돌 없음), 기록한 파일 경로는 written에 추가"""
+        import pyarrow.parquet as pq
+
+        root_path = os.path.join(self.output_dir, table)
+        pq.write_to_dataset(
+            arrow_table,
+            root_path=root_path,
+            partition_cols=[PARTITION_COLUMN],
+            file_visitor=lambda visited: written.append(visited.path)
+        )
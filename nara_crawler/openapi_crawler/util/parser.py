@@ -2,8 +2,15 @@ import json
 import re
 import os
 import csv
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+
+from util.swagger_resolver import HTTP_METHODS, SwaggerResolver
+
+# XML 출력 규칙
+_XML_INDENT = '  '
+_XML_TAG_CLEAN_RE = re.compile(r'[^a-zA-Z0-9_-]')
+# XML 1.0에서 허용되지 않는 문자 (제어문자, 서로게이트, U+FFFE/U+FFFF)
+_XML_INVALID_CHAR_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+_XML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '"': '&quot;', '>': '&gt;'})
 
 class NaraParser:
     """나라장터 API 파서 클래스 - 크롤러 통합용"""
@@ -45,21 +52,27 @@ class NaraParser:
         return ""
 
     def extract_endpoints(self, swagger_json):
-        """엔드포인트 정보 추출 - 크롤러 호환용"""
+        """엔드포인트 정보 추출 - 크롤러 호환용 ($ref 해석, 파라미터/응답 스키마 평탄화 필드 포함)"""
         endpoints = []
         if not swagger_json:
             return endpoints
         
+        resolver = SwaggerResolver(swagger_json)
         paths = swagger_json.get('paths', {})
         for path, methods in paths.items():
+            if not isinstance(methods, dict):
+                continue
+            path_params = methods.get('parameters', [])
             for method, data in methods.items():
-                if method in ['get', 'post', 'put', 'delete', 'patch']:
+                if method in HTTP_METHODS and isinstance(data, dict):
                     endpoint = {
                         'method': method.upper(),
                         'path': path,
                         'description': data.get('summary', '') or data.get('description', ''),
-                        'parameters': self._extract_swagger_parameters(data.get('parameters', [])),
-                        'responses': self._extract_swagger_responses(data.get('responses', {})),
+                        'parameters': self._extract_swagger_parameters(
+                            data.get('parameters', []), resolver, path_params, data.get('requestBody')
+                        ),
+                        'responses': self._extract_swagger_responses(data.get('responses', {}), resolver),
                         'tags': data.get('tags', []),
                         'section': data.get('tags', ['Default'])[0] if data.get('tags') else 'Default'
                     }
@@ -67,31 +80,32 @@ class NaraParser:
         
         return endpoints
 
-    def _extract_swagger_parameters(self, params_list):
-        """Swagger 파라미터 추출"""
-        return [{
-            'name': param.get('name', ''),
-            'description': param.get('description', ''),
-            'required': param.get('required', False),
-            'type': param.get('type', '') or (param.get('schema', {}).get('type', '') if 'schema' in param else '')
-        } for param in params_list]
+    def _extract_swagger_parameters(self, params_list, resolver=None, path_params=None, request_body=None):
+        """Swagger 파라미터 추출 (경로 공통 파라미터 병합, body/requestBody 스키마는 fields로 평탄화)"""
+        resolver = resolver or SwaggerResolver({})
+        return resolver.parameters(params_list, path_params, request_body)
 
-    def _extract_swagger_responses(self, responses_dict):
-        """Swagger 응답 추출"""
-        return [{
-            'status_code': status_code,
-            'description': data.get('description', '')
-        } for status_code, data in responses_dict.items()]
+    def _extract_swagger_responses(self, responses_dict, resolver=None):
+        """Swagger 응답 추출 (응답 스키마는 fields로 평탄화)"""
+        resolver = resolver or SwaggerResolver({})
+        return resolver.responses(responses_dict)
 
 
 class DataExporter:
     """데이터 내보내기 클래스 - 크롤러 통합용"""
-    
+
+    # data 폴더를 기본 디렉토리로 사용
+    DATA_DIR = './data'
+    CSV_FILE_NAME = 'all_result_table.csv'
+    CSV_ENCODING = 'cp949'
+    CSV_TARGET_FIELDS = [
+        '분류체계', '제공기관', '관리부서명', '관리부서 전화번호', 'API 유형',
+        '데이터포맷', '활용신청', '키워드', '등록일', '수정일', '비용부과유무', '이용허락범위'
+    ]
+
     @staticmethod
-    def save_crawling_result(data, output_dir, api_id, formats=['json', 'xml']):
-        """크롤링 결과 저장 - 메인 저장 함수"""
-        saved_files, errors = [], []
-        
+    def resolve_output_path(data):
+        """저장 디렉토리와 파일명 접두어 결정 (API 타입/기관별 디렉토리, {문서번호}_{수정일})"""
         # 기본 정보 추출
         table_info = data.get('info', {})
         org_name = table_info.get('제공기관', 'unknown_org')
@@ -109,8 +123,7 @@ class DataExporter:
         org_name = re.sub(r'[^\w\s-]', '', org_name)
         org_name = re.sub(r'[\s]+', '_', org_name).strip()
 
-        # data 폴더를 기본 디렉토리로 사용
-        data_dir = './data'
+        data_dir = DataExporter.DATA_DIR
 
         # API 타입에 따른 디렉토리 설정
         api_type = data.get('api_type', 'unknown')
@@ -127,6 +140,39 @@ class DataExporter:
             base_dir = os.path.join(data_dir, '기타', org_name)
         
         file_prefix = f"{doc_num}_{modified_date}"
+        return base_dir, file_prefix
+
+    @staticmethod
+    def csv_path():
+        """통합 CSV 경로 (data 폴더 바로 하위)"""
+        return os.path.join(DataExporter.DATA_DIR, DataExporter.CSV_FILE_NAME)
+
+    @staticmethod
+    def parquet_dir():
+        """Parquet 데이터셋 루트 (data/parquet/{테이블}/api_type=...)"""
+        return os.path.join(DataExporter.DATA_DIR, 'parquet')
+
+    @staticmethod
+    def spec_dir():
+        """Swagger 명세 저장소 (data/specs/{hash}.json)"""
+        return os.path.join(DataExporter.DATA_DIR, 'specs')
+
+    @staticmethod
+    def packed_dir():
+        """packed 출력 모드 세그먼트 루트 (data/packed/{유형}/{기관}.jsonl)"""
+        return os.path.join(DataExporter.DATA_DIR, 'packed')
+
+    @staticmethod
+    def api_index_path():
+        """파라미터/응답 필드/경로 역색인 (data/api_index.sqlite)"""
+        return os.path.join(DataExporter.DATA_DIR, 'api_index.sqlite')
+
+    @staticmethod
+    def save_crawling_result(data, output_dir, api_id, formats=['json', 'xml']):
+        """크롤링 결과 저장 - 메인 저장 함수"""
+        saved_files, errors = [], []
+
+        base_dir, file_prefix = DataExporter.resolve_output_path(data)
         os.makedirs(base_dir, exist_ok=True)
         
         # 형식별 저장
@@ -144,8 +190,8 @@ class DataExporter:
                         saved_files.append(file_path)
                 elif format_type == 'csv':
                     # CSV는 data 폴더 바로 하위에 저장
-                    os.makedirs('./data', exist_ok=True)
-                    file_path = os.path.join('./data', 'all_result_table.csv')
+                    os.makedirs(DataExporter.DATA_DIR, exist_ok=True)
+                    file_path = DataExporter.csv_path()
                     success, error = DataExporter._save_as_csv(data, file_path)
                     if success:
                         saved_files.append(file_path)
@@ -158,10 +204,11 @@ class DataExporter:
         return saved_files, errors
 
     @staticmethod
-    def _save_as_json(data, file_path):
+    def _save_as_json(data, file_path, make_dirs=True):
         """JSON 저장"""
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            if make_dirs:
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
             return True, None
@@ -169,76 +216,105 @@ class DataExporter:
             return False, f"JSON 저장 실패: {str(e)}"
 
     @staticmethod
-    def _save_as_xml(data, file_path):
-        """XML 저장"""
+    def _xml_tag_name(name):
+        """XML 태그명 정리 (영문/숫자/_/- 외 문자는 _로 치환)"""
+        clean_name = _XML_TAG_CLEAN_RE.sub('_', str(name))
+        if clean_name and clean_name[0].isdigit():
+            clean_name = f"item_{clean_name}"
+        if not clean_name:
+            clean_name = "unnamed_item"
+        if clean_name[0] == '-':
+            raise ValueError(f"유효하지 않은 XML 태그명: {clean_name}")
+        return clean_name
+
+    @staticmethod
+    def _xml_text(value):
+        """XML 텍스트 노드 문자열 (개행 정규화 + 이스케이프)"""
+        if _XML_INVALID_CHAR_RE.search(value):
+            raise ValueError("XML에서 허용되지 않는 문자가 포함되어 있습니다.")
+        if '\r' in value:
+            value = value.replace('\r\n', '\n').replace('\r', '\n')
+        return value.translate(_XML_ESCAPE_TABLE)
+
+    @staticmethod
+    def _write_xml_element(write, value, tag, indent):
+        """요소 하나를 들여쓰기와 함께 스트리밍 출력 (minidom toprettyxml과 같은 형태)"""
+        if isinstance(value, dict):
+            children = [(DataExporter._xml_tag_name(k), v) for k, v in value.items()]
+        elif isinstance(value, list):
+            # 리스트 항목 중 dict가 아닌 값은 문자열로 기록
+            children = [
+                (f"item_{i}", item if isinstance(item, dict) else (str(item) if item is not None else ""))
+                for i, item in enumerate(value)
+            ]
+        else:
+            children = None
+
+        if children:
+            write(f"{indent}<{tag}>\n")
+            child_indent = indent + _XML_INDENT
+            for child_tag, child_value in children:
+                DataExporter._write_xml_element(write, child_value, child_tag, child_indent)
+            write(f"{indent}</{tag}>\n")
+            return
+
+        text = '' if children is not None or value is None else str(value)
+        if text:
+            write(f"{indent}<{tag}>{DataExporter._xml_text(text)}</{tag}>\n")
+        else:
+            write(f"{indent}<{tag}/>\n")
+
+    @staticmethod
+    def _save_as_xml(data, file_path, make_dirs=True):
+        """XML 저장 (트리를 만들지 않고 임시 파일에 바로 기록한 뒤 교체)"""
+        tmp_path = f"{file_path}.tmp"
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            def _dict_to_xml(d, parent, name=None):
-                if name is None:
-                    element = parent
-                else:
-                    clean_name = re.sub(r'[^a-zA-Z0-9_-]', '_', str(name))
-                    if clean_name and clean_name[0].isdigit():
-                        clean_name = f"item_{clean_name}"
-                    if not clean_name:
-                        clean_name = "unnamed_item"
-                    element = SubElement(parent, clean_name)
-                
-                if isinstance(d, dict):
-                    for key, value in d.items():
-                        _dict_to_xml(value, element, key)
-                elif isinstance(d, list):
-                    for i, item in enumerate(d):
-                        if isinstance(item, dict):
-                            _dict_to_xml(item, element, f"item_{i}")
-                        else:
-                            item_elem = SubElement(element, f"item_{i}")
-                            item_elem.text = str(item) if item is not None else ""
-                else:
-                    element.text = str(d) if d is not None else ""
-            
-            root = Element("api_documentation")
-            _dict_to_xml(data, root)
-            
-            rough_string = tostring(root, encoding='utf-8')
-            reparsed = minidom.parseString(rough_string)
-            pretty_xml = reparsed.toprettyxml(indent='  ', encoding='utf-8')
-            
-            with open(file_path, 'wb') as f:
-                f.write(pretty_xml)
-            
+            if make_dirs:
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+                DataExporter._write_xml_element(f.write, data, "api_documentation", '')
+            os.replace(tmp_path, file_path)
+
             return True, None
         except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return False, f"XML 저장 실패: {str(e)}"
 
+    @staticmethod
+    def build_csv_row(data):
+        """통합 CSV 한 행 생성 (테이블 정보가 없으면 None)"""
+        info_data = data.get('info', {})
+
+        if not info_data:
+            return None
+
+        filtered_data = {
+            '문서번호': data.get('api_id', ''),
+            '크롤링시간': data.get('crawled_time', ''),
+            'URL': data.get('crawled_url', '')
+        }
+
+        for field in DataExporter.CSV_TARGET_FIELDS:
+            filtered_data[field] = info_data.get(field, '')
+
+        return filtered_data
+
     @staticmethod
     def _save_as_csv(data, file_path):
         """CSV 저장 - 모든 문서 정보 누적"""
         try:
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            info_data = data.get('info', {})
+            filtered_data = DataExporter.build_csv_row(data)
             
-            if not info_data:
+            if not filtered_data:
                 return False, "저장할 테이블 정보가 없습니다."
             
-            target_fields = [
-                '분류체계', '제공기관', '관리부서명', '관리부서 전화번호', 'API 유형',
-                '데이터포맷', '활용신청', '키워드', '등록일', '수정일', '비용부과유무', '이용허락범위'
-            ]
-            
-            filtered_data = {
-                '문서번호': data.get('api_id', ''),
-                '크롤링시간': data.get('crawled_time', ''),
-                'URL': data.get('crawled_url', '')
-            }
-            
-            for field in target_fields:
-                filtered_data[field] = info_data.get(field, '')
-            
             file_exists = os.path.isfile(file_path)
             
-            with open(file_path, 'a', encoding='cp949', newline='') as f:
+            with open(file_path, 'a', encoding=DataExporter.CSV_ENCODING, newline='') as f:
                 writer = csv.DictWriter(f, fieldnames=filtered_data.keys())
                 if not file_exists:
                     writer.writeheader()
@@ -0,0 +1,212 @@
+"""
+호스트별 공유 토큰 버킷 Rate Limiter
+메타데이터 스캐너(스레드), BeautifulSoup(aiohttp), Playwright(라우팅) 요청이 모두 같은 버킷에서 토큰을 받아
+www.data.go.kr에 대한 합산 요청 속도를 제한 (대기실 진입 방지)
+
+- 호스트 버킷: catalog/page/detail 요청 합산 속도 제한 (asset 요청은 제외)
+- 엔드포인트 클래스 버킷: 클래스별 추가 제한 (예: detail=5)
+- 현재 요청 속도(최근 window_sec 기준)와 대기 중인 요청 수(queue depth) 제공
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from util.common import DETAIL_FUNCTION_PATH
+
+
+# 엔드포인트 클래스
+ENDPOINT_CATALOG = 'catalog'   # /catalog/{번호}/openapi.json (메타데이터 스캔)
+ENDPOINT_PAGE = 'page'         # /data/{번호}/openapi.do (문서 페이지)
+ENDPOINT_DETAIL = 'detail'     # selectApiDetailFunction.do (상세기능 POST)
+ENDPOINT_ASSET = 'asset'       # 스크립트, 스타일시트 등 페이지 부속 리소스
+ENDPOINT_CLASSES = (ENDPOINT_CATALOG, ENDPOINT_PAGE, ENDPOINT_DETAIL, ENDPOINT_ASSET)
+
+# 호스트 전체 버킷 키
+_HOST_BUCKET = '*'
+
+
+def classify_endpoint(url: str) -> str:
+    """URL 경로로 엔드포인트 클래스 결정"""
+    path = urlparse(url).path
+    if path.startswith('/catalog/'):
+        return ENDPOINT_CATALOG
+    if path == DETAIL_FUNCTION_PATH:
+        return ENDPOINT_DETAIL
+    if path.startswith('/data/') and path.endswith('.do'):
+        return ENDPOINT_PAGE
+    return ENDPOINT_ASSET
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (토큰을 예약하고 대기 시간을 반환하는 방식, FIFO 순서 보장)"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나 예약, 사용 가능해질 때까지 기다려야 하는 시간(초) 반환"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class _BucketStats:
+    """버킷별 요청 통계"""
+
+    def __init__(self):
+        self.scheduled = deque()
+        self.total = 0
+        self.waiting = 0
+
+
+class RateLimiter:
+    """호스트 및 엔드포인트 클래스별 공유 Rate Limiter (asyncio/스레드 겸용)"""
+
+    def __init__(self, host_rate: float = 0.0, class_rates: Optional[Dict[str, float]] = None,
+                 burst: Optional[float] = None, window_sec: float = 10.0):
+        """
+        Args:
+            host_rate: 호스트당 초당 요청 수 (0이면 제한 없음, 통계만 수집)
+            class_rates: 엔드포인트 클래스별 초당 요청 수 (예: {'detail': 5})
+            burst: 버킷 용량 (기본값: 속도와 같음)
+            window_sec: 현재 속도 계산 구간 (초)
+        """
+        self.host_rate = host_rate
+        self.class_rates = dict(class_rates or {})
+        self.burst = burst
+        self.window_sec = window_sec
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._stats: Dict[Tuple[str, str], _BucketStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """속도 제한 설정 여부"""
+        return self.host_rate > 0 or any(rate > 0 for rate in self.class_rates.values())
+
+    def settings(self, shares: int = 1) -> Dict:
+        """다른 프로세스에서 같은 설정으로 만들 수 있는 인자 (shares개 프로세스로 속도를 나눔)"""
+        shares = max(1, shares)
+        return {
+            'host_rate': self.host_rate / shares,
+            'class_rates': {cls: rate / shares for cls, rate in self.class_rates.items()},
+            'burst': self.burst / shares if self.burst else None,
+            'window_sec': self.window_sec
+        }
+
+    def _bucket(self, host: str, key: str, rate: float) -> TokenBucket:
+        bucket = self._buckets.get((host, key))
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault((host, key), TokenBucket(rate, self.burst))
+        return bucket
+
+    def _stat(self, host: str, endpoint_class: str) -> _BucketStats:
+        stat = self._stats.get((host, endpoint_class))
+        if stat is None:
+            with self._lock:
+                stat = self._stats.setdefault((host, endpoint_class), _BucketStats())
+        return stat
+
+    def reserve(self, url: str, endpoint_class: Optional[str] = None) -> Tuple[float, _BucketStats]:
+        """요청 하나에 필요한 토큰 예약 (호스트 버킷 + 클래스 버킷 중 긴 대기 시간)"""
+        host = urlparse(url).hostname or ''
+        endpoint_class = endpoint_class or classify_endpoint(url)
+
+        delay = 0.0
+        if endpoint_class != ENDPOINT_ASSET and self.host_rate > 0:
+            delay = self._bucket(host, _HOST_BUCKET, self.host_rate).reserve()
+        class_rate = self.class_rates.get(endpoint_class, 0)
+        if class_rate > 0:
+            delay = max(delay, self._bucket(host, endpoint_class, class_rate).reserve())
+
+        stat = self._stat(host, endpoint_class)
+        with self._lock:
+            stat.scheduled.append(time.monotonic() + delay)
+            stat.total += 1
+            self._trim(stat, time.monotonic())
+        return delay, stat
+
+    async def acquire(self, url: str, endpoint_class: Optional[str] = None):
+        """비동기 토큰 획득 (aiohttp, Playwright 라우팅)"""
+        delay, stat = self.reserve(url, endpoint_class)
+        if delay <= 0:
+            return
+        with self._lock:
+            stat.waiting += 1
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            with self._lock:
+                stat.waiting -= 1
+
+    def acquire_sync(self, url: str, endpoint_class: Optional[str] = None):
+        """동기 토큰 획득 (스캐너 스레드)"""
+        delay, stat = self.reserve(url, endpoint_class)
+        if delay <= 0:
+            return
+        with self._lock:
+            stat.waiting += 1
+        try:
+            time.sleep(delay)
+        finally:
+            with self._lock:
+                stat.waiting -= 1
+
+    def _trim(self, stat: _BucketStats, now: float):
+        """속도 계산 구간 밖의 기록 제거"""
+        while stat.scheduled and stat.scheduled[0] < now - self.window_sec:
+            stat.scheduled.popleft()
+
+    def snapshot(self) -> Dict:
+        """
+        호스트별 현재 속도와 대기 요청 수
+
+        Returns:
+            {host: {'rate': 초당 요청 수, 'queue_depth': 대기 수, 'total': 누적 요청 수,
+                    'classes': {클래스: {...}}}}
+        """
+        now = time.monotonic()
+        hosts: Dict[str, Dict] = {}
+        with self._lock:
+            for (host, endpoint_class), stat in self._stats.items():
+                self._trim(stat, now)
+                sent = sum(1 for t in stat.scheduled if t <= now)
+                info = {
+                    'rate': round(sent / self.window_sec, 2),
+                    'queue_depth': stat.waiting,
+                    'total': stat.total
+                }
+                host_info = hosts.setdefault(host, {'rate': 0.0, 'queue_depth': 0, 'total': 0, 'classes': {}})
+                host_info['rate'] = round(host_info['rate'] + info['rate'], 2)
+                host_info['queue_depth'] += info['queue_depth']
+                host_info['total'] += info['total']
+                host_info['classes'][endpoint_class] = info
+        return hosts
+
+
+def parse_class_rates(values) -> Dict[str, float]:
+    """CLI 'detail=5' 형식 목록을 {'detail': 5.0}으로 변환"""
+    class_rates = {}
+    for value in values or []:
+        name, sep, rate = value.partition('=')
+        name = name.strip()
+        if not sep or name not in ENDPOINT_CLASSES:
+            raise ValueError(f"잘못된 클래스별 속도 형식: {value} (예: detail=5, 클래스: {', '.join(ENDPOINT_CLASSES)})")
+        class_rates[name] = float(rate)
+    return class_rates
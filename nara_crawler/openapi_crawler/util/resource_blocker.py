@@ -0,0 +1,108 @@
+"""
+Playwright 리소스 차단 프로필
+추출에 필요 없는 리소스(이미지, 미디어, 폰트 등)와 스크립트가 아닌 3rd party 요청(외부 스타일시트, 분석 비콘 등)을 라우팅 단계에서 차단
+1st party 스타일시트는 inner_text() 결과에 영향을 주므로 유지
+3rd party 스크립트는 허용 (fn_* 상세기능 핸들러와 Swagger UI가 CDN의 jQuery 등 라이브러리에 의존), 스크립트를 차단하면 URL을 출력
+"""
+
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Route, Request
+
+
+# 추출에 필요 없는 리소스 타입
+# 1st party stylesheet는 유지: inner_text() 결과가 CSS 표시 여부(display:none 등)에 따라 달라짐
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({
+    'image',
+    'media',
+    'font',
+    'texttrack',
+    'eventsource',
+    'websocket',
+    'manifest',
+    'other'
+})
+
+# 1st party 호스트 (swaggerJson, fn_* 핸들러를 정의하는 스크립트 포함)
+DEFAULT_FIRST_PARTY_HOSTS = ('data.go.kr',)
+
+# 3rd party 호스트에서도 허용하는 리소스 타입 (CDN에서 받는 jQuery 등 페이지 스크립트 의존 라이브러리)
+DEFAULT_THIRD_PARTY_ALLOWED_TYPES = frozenset({'script'})
+
+
+class ResourceBlockProfile:
+    """라우팅 차단 규칙
+
+    - 문서(navigation) 요청은 항상 허용
+    - 1st party 호스트가 아닌 요청은 third_party_allowed_types(기본: script)가 아니면 차단 (외부 스타일시트, 분석 비콘 등)
+    - 그 밖의 요청도 blocked_resource_types에 해당하면 차단
+    - script, xhr, fetch 등 추출에 필요한 1st party 요청은 허용
+    - 차단한 스크립트 URL은 한 번씩 출력 (상세기능 추출 실패 원인 추적용)
+    """
+
+    def __init__(self, blocked_resource_types: Optional[Iterable[str]] = None,
+                 first_party_hosts: Optional[Iterable[str]] = None,
+                 allow_third_party: bool = False,
+                 third_party_allowed_types: Optional[Iterable[str]] = None):
+        self.blocked_resource_types = frozenset(
+            DEFAULT_BLOCKED_RESOURCE_TYPES if blocked_resource_types is None else blocked_resource_types
+        )
+        self.first_party_hosts = tuple(
+            DEFAULT_FIRST_PARTY_HOSTS if first_party_hosts is None else first_party_hosts
+        )
+        self.allow_third_party = allow_third_party
+        self.third_party_allowed_types = frozenset(
+            DEFAULT_THIRD_PARTY_ALLOWED_TYPES if third_party_allowed_types is None else third_party_allowed_types
+        )
+        self.stats = {
+            'allowed': 0,
+            'blocked': 0
+        }
+        # 차단한 스크립트 URL (같은 URL은 한 번만 출력)
+        self.blocked_scripts = set()
+
+    def is_first_party(self, host: str, page_host: str = '') -> bool:
+        """1st party 호스트 여부 (등록 호스트의 서브도메인 또는 현재 페이지와 같은 호스트)"""
+        if not host:
+            return True
+        if page_host and host == page_host:
+            return True
+        return any(host == h or host.endswith('.' + h) for h in self.first_party_hosts)
+
+    def should_block(self, request: Request) -> bool:
+        """요청 차단 여부 판단"""
+        if request.is_navigation_request():
+            return False
+
+        host = urlparse(request.url).hostname or ''
+        try:
+            page_host = urlparse(request.frame.url).hostname or ''
+        except Exception:
+            page_host = ''
+
+        if (not self.allow_third_party and not self.is_first_party(host, page_host)
+                and request.resource_type not in self.third_party_allowed_types):
+            return True
+
+        return request.resource_type in self.blocked_resource_types
+
+    def record_blocked(self, request: Request):
+        """차단 통계 기록, 스크립트 차단은 URL 출력"""
+        self.stats['blocked'] += 1
+        if request.resource_type == 'script' and request.url not in self.blocked_scripts:
+            self.blocked_scripts.add(request.url)
+            print(f"   🚫 스크립트 차단: {request.url}")
+
+    async def handle_route(self, route: Route):
+        """context.route 핸들러"""
+        if self.should_block(route.request):
+            self.record_blocked(route.request)
+            await route.abort()
+        else:
+            self.stats['allowed'] += 1
+            await route.continue_()
+
+    async def install(self, context: BrowserContext):
+        """컨텍스트에 라우팅 규칙 설치"""
+        await context.route('**/*', self.handle_route)
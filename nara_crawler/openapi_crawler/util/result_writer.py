@@ -0,0 +1,249 @@
+"""
+비동기 결과 저장기
+크롤링 결과가 나오는 즉시 큐에 넣고, 전용 스레드가 JSON/XML/CSV/Parquet으로 저장
+- CSV 파일 핸들을 한 번만 열어 batch_size 행마다(또는 유휴 시) flush
+- Parquet은 ParquetExporter가 테이블별로 모아서 기록
+- spec_store가 있으면 swagger_json은 specs/{hash}.json에 한 번만 쓰고 결과에는 해시 참조만 저장
+- output_mode='packed'면 JSON/XML 개별 파일 대신 유형/기관별 JSONL 세그먼트에 추가 (PackedStore)
+- 이미 만든 디렉토리는 캐시하여 makedirs 반복 호출 방지
+"""
+
+import asyncio
+import csv
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from util.parser import DataExporter
+from util.packed_store import PACKED_FORMATS, PackedStore
+from util.parquet_exporter import ParquetExporter
+from util.spec_store import SpecStore
+from util.timing import PhaseTimer
+
+
+# 큐 종료 신호
+_STOP = object()
+
+# 출력 모드 (tree: 문서별 JSON/XML 파일, packed: 유형/기관별 세그먼트)
+OUTPUT_MODES = ('tree', 'packed')
+
+
+class AsyncResultWriter:
+    """크롤링과 저장을 겹쳐 실행하는 백그라운드 저장기"""
+
+    def __init__(self, formats: List[str], batch_size: int = 50,
+                 idle_flush_sec: float = 1.0, max_queue_size: int = 0,
+                 on_saved: Optional[Callable[[Dict, List[str]], None]] = None,
+                 spec_store: Optional[SpecStore] = None, output_mode: str = 'tree'):
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(f"지원하지 않는 출력 모드: {output_mode} (사용 가능: {', '.join(OUTPUT_MODES)})")
+        self.formats = formats
+        self.output_mode = output_mode
+        # Swagger 명세 중복 제거 저장소 (None이면 결과마다 swagger_json 전체 저장)
+        self.spec_store = spec_store
+        # 저장 성공 시 (data, 저장 경로) 콜백 (저장 스레드에서 호출)
+        self.on_saved = on_saved
+        self.batch_size = batch_size
+        self.idle_flush_sec = idle_flush_sec
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self.saved_info = {
+            'total_saved': 0,
+            'failed_saves': 0,
+            'saved_files': []
+        }
+
+        self._thread: Optional[threading.Thread] = None
+        self._created_dirs = set()
+        self._csv_file = None
+        self._csv_writer = None
+        self._csv_pending = 0
+        self._csv_path = DataExporter.csv_path()
+        # pyarrow가 없으면 여기서 ImportError (크롤링 시작 전에 실패)
+        self._parquet = ParquetExporter(DataExporter.parquet_dir()) if 'parquet' in formats else None
+        self._parquet_recorded = False
+        # packed 모드: json/xml 대신 세그먼트에 한 번만 기록 (기존 구조는 python -m util.packed_store export)
+        self._packed = PackedStore(DataExporter.packed_dir()) if output_mode == 'packed' else None
+
+    def start(self):
+        """저장 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='result-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, result: Dict):
+        """크롤링 결과 제출 (성공 결과만 저장, 크롤러의 on_result 콜백으로 사용)"""
+        if result.get('success') and result.get('data'):
+            self.queue.put(result)
+
+    async def close(self) -> Dict:
+        """남은 결과를 모두 저장하고 스레드 종료 후 저장 통계 반환"""
+        if self._thread is not None:
+            self.queue.put(_STOP)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._thread.join)
+            self._thread = None
+        return self.saved_info
+
+    def _ensure_dir(self, path: str):
+        """디렉토리 생성 (생성 이력 캐시)"""
+        if path and path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+
+    def _run(self):
+        """큐 소비 루프"""
+        try:
+            while True:
+                try:
+                    item = self.queue.get(timeout=self.idle_flush_sec)
+                except queue.Empty:
+                    self._flush_csv()
+                    self._flush_packed()
+                    continue
+
+                if item is _STOP:
+                    break
+                self._write(item)
+        finally:
+            self._close_csv()
+            self._close_parquet()
+            self._close_packed()
+
+    def _write(self, result: Dict):
+        """결과 하나를 형식별로 저장 (소요 시간은 result['timings']['save']에 기록)"""
+        start = time.perf_counter()
+        try:
+            self._write_formats(result)
+        finally:
+            PhaseTimer(result.setdefault('timings', {})).add('save', time.perf_counter() - start)
+
+    def _write_formats(self, result: Dict):
+        """형식별 저장 및 저장 통계 갱신"""
+        data = result['data']
+        saved_files, errors = [], []
+
+        if self.spec_store is not None:
+            try:
+                data = self.spec_store.externalize(data)
+            except OSError as e:
+                print(f"   ⚠️ 명세 저장 실패, 결과에 포함합니다 ({result.get('url', '')}): {e}")
+
+        try:
+            base_dir, file_prefix = DataExporter.resolve_output_path(data)
+        except Exception as e:
+            print(f"   ❌ 저장 경로 결정 실패 ({result.get('url', '')}): {e}")
+            self.saved_info['failed_saves'] += 1
+            return
+
+        formats = self.formats
+        if self._packed is not None and any(f in PACKED_FORMATS for f in formats):
+            try:
+                saved_files.append(self._packed.append(data, base_dir, file_prefix))
+            except Exception as e:
+                errors.append(f"packed 저장 실패: {str(e)}")
+            formats = [f for f in formats if f not in PACKED_FORMATS]
+
+        for format_type in formats:
+            try:
+                if format_type == 'json':
+                    self._ensure_dir(base_dir)
+                    file_path = os.path.join(base_dir, f"{file_prefix}.json")
+                    success, error = DataExporter._save_as_json(data, file_path, make_dirs=False)
+                elif format_type == 'xml':
+                    self._ensure_dir(base_dir)
+                    file_path = os.path.join(base_dir, f"{file_prefix}.xml")
+                    success, error = DataExporter._save_as_xml(data, file_path, make_dirs=False)
+                elif format_type == 'csv':
+                    file_path = self._csv_path
+                    success, error = self._append_csv(data)
+                elif format_type == 'parquet' and self._parquet is not None:
+                    file_path = self._parquet.output_dir
+                    self._parquet.add(data)
+                    success, error = True, None
+                else:
+                    continue
+
+                if success:
+                    saved_files.append(file_path)
+                else:
+                    errors.append(error)
+            except Exception as e:
+                errors.append(f"{format_type} 저장 실패: {str(e)}")
+
+        if saved_files:
+            self.saved_info['total_saved'] += 1
+            for path in saved_files:
+                # Parquet 데이터셋 경로는 모든 문서가 같으므로 저장 통계에는 한 번만 기록
+                if self._parquet is not None and path == self._parquet.output_dir:
+                    if self._parquet_recorded:
+                        continue
+                    self._parquet_recorded = True
+                self.saved_info['saved_files'].append(path)
+            if self.on_saved:
+                try:
+                    self.on_saved(data, saved_files)
+                except Exception as e:
+                    print(f"   ⚠️ 저장 후처리 실패 ({result.get('url', '')}): {e}")
+        else:
+            self.saved_info['failed_saves'] += 1
+            if errors:
+                print(f"   ❌ 저장 실패 ({result.get('url', '')}): {'; '.join(errors)}")
+
+    def _append_csv(self, data: Dict):
+        """통합 CSV에 한 행 추가 (batch_size 행마다 flush)"""
+        row = DataExporter.build_csv_row(data)
+        if not row:
+            return False, "저장할 테이블 정보가 없습니다."
+
+        if self._csv_writer is None:
+            self._ensure_dir(os.path.dirname(self._csv_path))
+            write_header = not os.path.isfile(self._csv_path) or os.path.getsize(self._csv_path) == 0
+            self._csv_file = open(self._csv_path, 'a', encoding=DataExporter.CSV_ENCODING, newline='')
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=list(row.keys()))
+            if write_header:
+                self._csv_writer.writeheader()
+
+        try:
+            # writerow는 한 행을 한 번에 write하므로 인코딩 실패 시 부분 행이 남지 않음
+            self._csv_writer.writerow(row)
+        except UnicodeEncodeError as e:
+            return False, f"CSV 저장 실패: {str(e)}"
+        self._csv_pending += 1
+        if self._csv_pending >= self.batch_size:
+            self._flush_csv()
+        return True, None
+
+    def _flush_csv(self):
+        """대기 중인 CSV 행 flush"""
+        if self._csv_file is not None and self._csv_pending:
+            self._csv_file.flush()
+            self._csv_pending = 0
+
+    def _close_csv(self):
+        """CSV 파일 핸들 정리"""
+        if self._csv_file is not None:
+            self._flush_csv()
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+
+    def _flush_packed(self):
+        """packed 세그먼트 flush"""
+        if self._packed is not None:
+            self._packed.flush()
+
+    def _close_packed(self):
+        """packed 세그먼트 핸들 정리"""
+        if self._packed is not None:
+            self._packed.close()
+
+    def _close_parquet(self):
+        """남은 Parquet 행 기록"""
+        if self._parquet is not None:
+            try:
+                self._parquet.close()
+            except Exception as e:
+                print(f"   ❌ Parquet 저장 실패: {e}")
@@ -0,0 +1,125 @@
+"""
+크롤링 방식 라우팅 이력
+문서번호별로 마지막에 성공한 크롤러(beautifulsoup/playwright)와 API 타입을 저장하여
+다음 실행에서 BS 시도 없이 바로 맞는 크롤러로 보냄
+- 브라우저가 필요했던 문서도 reprobe_interval회 실행마다 한 번은 BS로 다시 시도 (사이트 변경 대응)
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from util.common import ApiIdExtractor
+
+
+ROUTE_STATIC = 'static'
+ROUTE_DYNAMIC = 'dynamic'
+ROUTE_UNKNOWN = 'unknown'
+
+
+class RoutingHistory:
+    """문서번호 → 성공 크롤러/API 타입 이력 (JSON 파일, 스레드 안전)"""
+
+    def __init__(self, path: str, reprobe_interval: int = 5):
+        """
+        Args:
+            path: 이력 파일 경로
+            reprobe_interval: Playwright로 바로 보낸 실행 횟수가 이 값에 도달하면 BS로 재시도
+        """
+        self.path = path
+        self.reprobe_interval = reprobe_interval
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """이력 파일 로드 (없거나 손상되면 빈 이력)"""
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️ 라우팅 이력 로드 실패, 새로 시작합니다: {e}")
+            self.entries = {}
+
+    def route(self, url: str) -> str:
+        """URL의 라우팅 결정 (static: BS 우선, dynamic: Playwright 직행, unknown: 이력 없음)"""
+        entry = self.entries.get(ApiIdExtractor.extract_api_id(url))
+        if not entry:
+            return ROUTE_UNKNOWN
+        if entry.get('method') != 'playwright':
+            return ROUTE_STATIC
+        if entry.get('runs_since_probe', 0) >= self.reprobe_interval:
+            return ROUTE_STATIC
+        return ROUTE_DYNAMIC
+
+    def split(self, urls: List[str]) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """
+        URL을 라우팅 결과별로 분류하고 Playwright 직행 문서의 실행 횟수를 갱신
+
+        Returns:
+            (static_urls, dynamic_urls, unknown_urls, reprobe_urls) - reprobe_urls는 static_urls에 포함
+        """
+        static_urls, dynamic_urls, unknown_urls, reprobe_urls = [], [], [], []
+        with self._lock:
+            for url in urls:
+                route = self.route(url)
+                entry = self.entries.get(ApiIdExtractor.extract_api_id(url))
+                if route == ROUTE_DYNAMIC:
+                    dynamic_urls.append(url)
+                    entry['runs_since_probe'] = entry.get('runs_since_probe', 0) + 1
+                    self._dirty = True
+                elif route == ROUTE_STATIC:
+                    static_urls.append(url)
+                    if entry.get('method') == 'playwright':
+                        # 재확인 시작: BS가 다시 실패해도 다음 주기까지 Playwright 직행
+                        reprobe_urls.append(url)
+                        entry['runs_since_probe'] = 0
+                        self._dirty = True
+                else:
+                    unknown_urls.append(url)
+        return static_urls, dynamic_urls, unknown_urls, reprobe_urls
+
+    def record(self, result: Dict):
+        """성공 결과의 크롤러와 API 타입 기록 (실패 결과는 무시)"""
+        if not result.get('success') or not result.get('data'):
+            return
+        doc_id = str(result.get('api_id') or ApiIdExtractor.extract_api_id(result.get('url', '')))
+        method = result.get('method', '')
+        with self._lock:
+            previous = self.entries.get(doc_id, {})
+            # Playwright가 계속 필요하면 카운터 유지, 크롤러가 바뀌면 초기화
+            runs_since_probe = 0
+            if method == 'playwright' and previous.get('method') == 'playwright':
+                runs_since_probe = previous.get('runs_since_probe', 0)
+            self.entries[doc_id] = {
+                'method': method,
+                'api_type': result['data'].get('api_type', 'unknown'),
+                'runs_since_probe': runs_since_probe,
+                'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            self._dirty = True
+
+    def summary(self) -> Dict[str, int]:
+        """크롤러별 문서 수"""
+        counts: Dict[str, int] = {}
+        for entry in self.entries.values():
+            method = entry.get('method', 'unknown')
+            counts[method] = counts.get(method, 0) + 1
+        return counts
+
+    def save(self):
+        """변경 사항이 있으면 임시 파일에 쓴 뒤 교체"""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
@@ -13,7 +13,7 @@ class BaseMetadataScanner:
     """공공데이터포털 메타데이터 스캐너 베이스 클래스"""
     
     def __init__(self, scan_type, start_num, end_num, max_workers=50, 
-                 max_retries=3, retry_delay=1, timeout=5):
+                 max_retries=3, retry_delay=1, timeout=5, rate_limiter=None):
         self.start_num = start_num
         self.end_num = end_num
         self.max_workers = max_workers
@@ -21,6 +21,8 @@ class BaseMetadataScanner:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
+        # 크롤러와 공유하는 호스트별 속도 제한 (util.rate_limiter.RateLimiter, None이면 제한 없음)
+        self.rate_limiter = rate_limiter
         self.base_url = f"https://www.data.go.kr/catalog/{{}}/{self.scan_type}.json"
         self.results = {
             'total': 0,
@@ -146,6 +148,8 @@ class BaseMetadataScanner:
         url = self.base_url.format(num)
         
         try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire_sync(url)
             response = requests.get(url, timeout=self.timeout)
             
             if response.status_code == 200:
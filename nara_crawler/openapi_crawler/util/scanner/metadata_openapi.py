@@ -4,9 +4,9 @@ class OpenAPIMetadataScanner(BaseMetadataScanner):
     """공공데이터포털 OpenAPI 메타데이터 스캐너"""
     
     def __init__(self, start_num, end_num, max_workers=50, 
-                 max_retries=3, retry_delay=1, timeout=5):
+                 max_retries=3, retry_delay=1, timeout=5, rate_limiter=None):
         super().__init__('openapi', start_num, end_num, max_workers, 
-                        max_retries, retry_delay, timeout)
+                        max_retries, retry_delay, timeout, rate_limiter)
     
     def extract_data_info(self, data, num, has_data, retry_count):
         """OpenAPI 정보 추출"""
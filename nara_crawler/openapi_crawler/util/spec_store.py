@@ -0,0 +1,134 @@
+"""
+Swagger 명세 중복 제거 저장소
+여러 문서번호가 같은 Swagger 명세를 공개하는 경우가 많아, 명세를 내용 해시로 한 번만 저장하고 결과에는 해시 참조만 남김
+- spec_hash: 키 순서와 무관한 정규화 JSON의 sha256 (추출 직후 원본 기준)
+- EndpointCache: 해시별 NaraParser.extract_endpoints 결과 메모이제이션 (--spec-store일 때만 사용, 엔드포인트 dict는 문서 간 공유, 읽기 전용)
+- SpecStore: data/specs/{hash}.json에 명세 기록 (이미 있으면 건너뜀), 결과의 swagger_json을 참조로 교체
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+
+# 결과 data에서 명세를 가리키는 키 ({'hash': ..., 'path': 'specs/{hash}.json'})
+SPEC_REF_KEY = 'swagger_spec'
+
+
+def spec_hash(swagger_json: Dict) -> str:
+    """명세 내용 해시 (키 순서/공백과 무관)"""
+    encoded = json.dumps(swagger_json, ensure_ascii=False, sort_keys=True,
+                         separators=(',', ':'), default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class EndpointCache:
+    """명세 해시 → 엔드포인트 목록 LRU 캐시 (스레드 안전)
+
+    enabled가 False면 호출자는 명세 해시를 계산하지 않고 바로 추출 (명세 전체 직렬화 비용 생략)
+
+    주의: 반환 목록은 문서별 새 list지만 안의 엔드포인트 dict(하위 파라미터/응답 포함)는
+    같은 명세의 모든 문서가 공유하므로 호출자는 절대 변경하면 안 됨 (한 문서의 변경이 다른 문서에 그대로 반영됨)
+    - 정제는 compute 안에서 끝내고, 크롤러 마무리 정제는 PRECLEANED_KEYS로 endpoints를 건너뜀
+      (tests/test_spec_store.py가 마무리 정제 후에도 공유 dict가 그대로인지 확인)
+    - 결과를 고쳐야 하면 해당 엔드포인트를 복사한 뒤 수정
+    깊은 복사는 큰 명세에서 다시 추출하는 것과 비슷한 비용이라 하지 않음 (benchmark/bench_swagger_resolver.py)
+    """
+
+    def __init__(self, maxsize: int = 256, enabled: bool = False):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._entries: 'OrderedDict[str, List[Dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get_or_compute(self, key: str, compute: Callable[[], List[Dict]]) -> List[Dict]:
+        with self._lock:
+            endpoints = self._entries.get(key)
+            if endpoints is not None:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return list(endpoints)
+
+        endpoints = compute()
+        with self._lock:
+            self.stats['misses'] += 1
+            self._entries[key] = endpoints
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return list(endpoints)
+
+
+# 프로세스 공용 캐시 (BS/PW 추출과 샤드 프로세스별로 하나씩, --spec-store일 때 main/샤드 워커가 활성화)
+ENDPOINT_CACHE = EndpointCache()
+
+
+class SpecStore:
+    """specs/{hash}.json 명세 저장소 (저장 스레드에서 사용)"""
+
+    def __init__(self, spec_dir: str):
+        self.spec_dir = spec_dir
+        self._known = set()
+        self._lock = threading.Lock()
+        self.stats = {'written': 0, 'reused': 0}
+
+    def spec_path(self, digest: str) -> str:
+        return os.path.join(self.spec_dir, f'{digest}.json')
+
+    def put(self, swagger_json: Dict, digest: Optional[str] = None) -> str:
+        """명세 저장 (같은 해시 파일이 있으면 건너뜀), 해시 반환"""
+        digest = digest or spec_hash(swagger_json)
+        with self._lock:
+            if digest in self._known:
+                self.stats['reused'] += 1
+                return digest
+            path = self.spec_path(digest)
+            if os.path.isfile(path):
+                self.stats['reused'] += 1
+            else:
+                os.makedirs(self.spec_dir, exist_ok=True)
+                tmp_path = f'{path}.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(swagger_json, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, path)
+                self.stats['written'] += 1
+            self._known.add(digest)
+        return digest
+
+    def externalize(self, data: Dict) -> Dict:
+        """swagger_json을 명세 저장소 참조로 바꾼 결과 (원본 data는 변경하지 않음)"""
+        swagger_json = data.get('swagger_json')
+        if not swagger_json:
+            return data
+        digest = self.put(swagger_json, data.get('swagger_hash'))
+        externalized = {}
+        for key, value in data.items():
+            if key == 'swagger_json':
+                externalized[SPEC_REF_KEY] = {
+                    'hash': digest,
+                    'path': f'{os.path.basename(self.spec_dir)}/{digest}.json'
+                }
+            else:
+                externalized[key] = value
+        return externalized
+
+    def load(self, digest: str) -> Dict:
+        """해시로 명세 로드"""
+        with open(self.spec_path(digest), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def inline(self, data: Dict) -> Dict:
+        """참조를 명세 원문으로 되돌린 결과 (externalize의 역변환)"""
+        ref = data.get(SPEC_REF_KEY)
+        if not ref:
+            return data
+        inlined = {}
+        for key, value in data.items():
+            if key == SPEC_REF_KEY:
+                inlined['swagger_json'] = self.load(ref['hash'])
+            else:
+                inlined[key] = value
+        return inlined
@@ -0,0 +1,156 @@
+"""
+swaggerJson 추출 유틸리티
+HTML 원문에서 swaggerJson 대입문을 선형 탐색하고 DOM 파싱 없이 JSON을 직접 디코딩
+"""
+import json
+import re
+from typing import Dict, Optional
+
+
+# swaggerJson 대입문 (var/let/const 선언 또는 window 속성)
+_ASSIGNMENT_RE = re.compile(r'(?:\b(?:var|let|const)\s+|\bwindow\.)swaggerJson\s*=\s*')
+_JSON_PARSE_PREFIX = 'JSON.parse('
+
+_decoder = json.JSONDecoder(strict=False)
+
+
+def _find_closing_quote(text: str, start: int, quote: str) -> Optional[int]:
+    """start 위치의 여는 따옴표(', `)와 짝인 닫는 따옴표 인덱스
+
+    str.find로 따옴표 후보 사이를 건너뛰고, 앞에 붙은 백슬래시 개수가 홀수면 이스케이프로 보고 계속 탐색
+    """
+    i = text.find(quote, start + 1)
+    while i != -1:
+        backslashes = 0
+        j = i - 1
+        while j > start and text[j] == '\\':
+            backslashes += 1
+            j -= 1
+        if backslashes % 2 == 0:
+            return i
+        i = text.find(quote, i + 1)
+    return None
+
+
+def _find_balanced_end(text: str, start: int) -> Optional[int]:
+    """start 위치의 '{'와 짝이 맞는 '}' 다음 인덱스 반환 (문자열 내부 괄호는 무시)"""
+    depth = 0
+    in_string = None
+    i = start
+    length = len(text)
+    while i < length:
+        ch = text[i]
+        if in_string:
+            if ch == '\\':
+                i += 2
+                continue
+            if ch == in_string:
+                in_string = None
+        elif ch == '"' or ch == "'":
+            in_string = ch
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return None
+
+
+def _loads_lenient(json_str: str) -> Optional[Dict]:
+    """JSON 파싱 (실패 시 이스케이프된 따옴표/개행을 정리한 뒤 재시도)"""
+    try:
+        return json.loads(json_str, strict=False)
+    except json.JSONDecodeError:
+        pass
+
+    json_str = json_str.replace('\\"', '"')
+    json_str = json_str.replace('\\n', '')
+    json_str = json_str.replace('\\r', '')
+    json_str = json_str.replace('\\t', '')
+    try:
+        return json.loads(json_str, strict=False)
+    except json.JSONDecodeError:
+        return None
+
+
+def _unescape_js_string(literal: str) -> Optional[str]:
+    """작은따옴표 JS 문자열 리터럴 내용을 실제 문자열로 변환"""
+    literal = literal.replace("\\'", "'").replace('"', '\\"')
+    try:
+        return json.loads(f'"{literal}"', strict=False)
+    except json.JSONDecodeError:
+        return None
+
+
+def _decode_value(text: str, pos: int) -> Optional[Dict]:
+    """대입문 우변(pos 위치)의 값을 디코딩"""
+    ch = text[pos:pos + 1]
+
+    # 객체 리터럴: raw_decode로 바로 디코딩, 실패하면 괄호 짝으로 범위를 잘라 재시도
+    if ch == '{':
+        try:
+            obj, _ = _decoder.raw_decode(text, pos)
+            return obj
+        except json.JSONDecodeError:
+            end = _find_balanced_end(text, pos)
+            if end is None:
+                return None
+            return _loads_lenient(text[pos:end])
+
+    # 템플릿 리터럴: `{...}` (내용 안의 \`는 이스케이프된 백틱)
+    if ch == '`':
+        end = _find_closing_quote(text, pos, '`')
+        if end is None:
+            return None
+        return _loads_lenient(text[pos + 1:end].replace('\\`', '`'))
+
+    # 문자열 리터럴: "{...}" - JSON 문자열 규칙과 같으므로 raw_decode로 바로 해제
+    if ch == '"':
+        try:
+            inner, _ = _decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return None
+        return _loads_lenient(inner) if isinstance(inner, str) else None
+
+    # 문자열 리터럴: '{...}'
+    if ch == "'":
+        end = _find_closing_quote(text, pos, "'")
+        if end is None:
+            return None
+        literal = text[pos + 1:end]
+        inner = _unescape_js_string(literal)
+        if inner is None:
+            return _loads_lenient(literal)
+        return _loads_lenient(inner)
+
+    # JSON.parse("...") 형태
+    if text.startswith(_JSON_PARSE_PREFIX, pos):
+        inner_pos = pos + len(_JSON_PARSE_PREFIX)
+        while inner_pos < len(text) and text[inner_pos].isspace():
+            inner_pos += 1
+        return _decode_value(text, inner_pos)
+
+    return None
+
+
+def extract_swagger_json_from_html(html: str) -> Optional[Dict]:
+    """
+    HTML 원문에서 swaggerJson 추출
+
+    Args:
+        html: 페이지 HTML 원문
+
+    Returns:
+        Swagger JSON 딕셔너리 (없으면 None)
+    """
+    if not html or 'swaggerJson' not in html:
+        return None
+
+    for match in _ASSIGNMENT_RE.finditer(html):
+        swagger_json = _decode_value(html, match.end())
+        if swagger_json and isinstance(swagger_json, dict):
+            return swagger_json
+
+    return None
@@ -0,0 +1,296 @@
+"""
+Swagger/OpenAPI $ref 해석 및 스키마 평탄화
+- Swagger 2.0 (definitions, parameters, responses, in: body)와 OpenAPI 3.x (components, requestBody, content) 지원
+- 내부 참조(#/...)만 해석, 외부 파일 참조는 ref 이름만 남김
+- 참조별 평탄화 결과를 메모이제이션하여 수백 개 경로가 같은 스키마를 참조해도 한 번만 계산
+- 순환 참조는 다시 만나는 지점에서 끊고 필드에 circular=True 표시
+
+평탄화 필드 (스키마 하위 속성을 점 경로로 나열, 배열 항목은 '[]')
+    {'name': 'response.body.items[].bidNtceNo', 'type': 'string', 'format': '',
+     'description': '입찰공고번호', 'required': False, 'ref': '', 'circular': False, 'depth': 5}
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch')
+
+# OpenAPI 3 content에서 스키마를 고를 때의 미디어 타입 우선순위
+_PREFERRED_MEDIA_TYPES = ('application/json', 'application/xml', 'text/xml')
+_COMPOSITION_KEYS = ('allOf', 'oneOf', 'anyOf')
+
+
+class SwaggerResolver:
+    """명세 하나에 대한 $ref 해석기 (명세별로 생성, 참조별 결과 메모이제이션)"""
+
+    def __init__(self, spec: Dict, max_depth: int = 8):
+        """
+        Args:
+            spec: Swagger 2.0 또는 OpenAPI 3.x 명세
+            max_depth: 평탄화 필드 최대 깊이 (더 깊은 필드는 생략)
+        """
+        self.spec = spec if isinstance(spec, dict) else {}
+        self.max_depth = max_depth
+        self._pointers: Dict[str, Optional[Dict]] = {}
+        self._fields_memo: Dict[str, List[Dict]] = {}
+
+    @property
+    def is_openapi3(self) -> bool:
+        return str(self.spec.get('openapi', '')).startswith('3')
+
+    # ------------------------------------------------------------------
+    # 참조 해석
+    # ------------------------------------------------------------------
+    def resolve_pointer(self, ref: str) -> Optional[Dict]:
+        """내부 참조(#/a/b)가 가리키는 노드 (없거나 외부 참조면 None)"""
+        if ref in self._pointers:
+            return self._pointers[ref]
+
+        node = None
+        if ref.startswith('#/'):
+            node = self.spec
+            for token in ref[2:].split('/'):
+                token = unquote(token).replace('~1', '/').replace('~0', '~')
+                if isinstance(node, dict) and token in node:
+                    node = node[token]
+                elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+                    node = node[int(token)]
+                else:
+                    node = None
+                    break
+        if not isinstance(node, dict):
+            node = None
+        self._pointers[ref] = node
+        return node
+
+    def deref(self, node) -> Dict:
+        """$ref 체인을 끝까지 따라간 노드 (순환/해석 불가면 빈 dict)"""
+        seen = set()
+        while isinstance(node, dict) and isinstance(node.get('$ref'), str):
+            ref = node['$ref']
+            if ref in seen:
+                return {}
+            seen.add(ref)
+            node = self.resolve_pointer(ref)
+        return node if isinstance(node, dict) else {}
+
+    @staticmethod
+    def ref_name(ref: str) -> str:
+        """참조의 마지막 이름 (#/definitions/Item → Item)"""
+        return unquote(ref.rsplit('/', 1)[-1]) if ref else ''
+
+    # ------------------------------------------------------------------
+    # 스키마 평탄화
+    # ------------------------------------------------------------------
+    def schema_type(self, schema) -> str:
+        """스키마 타입 문자열 (배열은 array[항목 타입])"""
+        schema = self.deref(schema)
+        schema_type = schema.get('type', '')
+        if isinstance(schema_type, list):
+            schema_type = next((t for t in schema_type if t != 'null'), '')
+        if schema_type == 'array':
+            item_type = self.schema_type(schema.get('items')) if isinstance(schema.get('items'), dict) else ''
+            return f'array[{item_type}]' if item_type else 'array'
+        if not schema_type and (schema.get('properties') or any(k in schema for k in _COMPOSITION_KEYS)):
+            return 'object'
+        return schema_type or ''
+
+    def schema_fields(self, schema) -> List[Dict]:
+        """스키마의 평탄화 필드 목록 (호출자가 변경해도 되는 새 dict)"""
+        fields, _ = self._fields(schema, [])
+        return [dict(field) for field in fields if field['depth'] <= self.max_depth]
+
+    def _fields(self, schema, stack: List[str]) -> Tuple[List[Dict], Set[str]]:
+        """스키마 하위 필드 (상대 이름)와 순환으로 끊긴 참조 집합"""
+        if not isinstance(schema, dict):
+            return [], set()
+        ref = schema.get('$ref')
+        if isinstance(ref, str):
+            return self._ref_fields(ref, stack)
+
+        fields: List[Dict] = []
+        cuts: Set[str] = set()
+
+        for key in _COMPOSITION_KEYS:
+            for sub_schema in schema.get(key) or []:
+                sub_fields, sub_cuts = self._fields(sub_schema, stack)
+                fields.extend(sub_fields)
+                cuts |= sub_cuts
+
+        properties = schema.get('properties')
+        if isinstance(properties, dict):
+            required = schema.get('required')
+            required = set(required) if isinstance(required, list) else set()
+            for name, prop in properties.items():
+                cuts |= self._add_property(fields, str(name), prop, name in required, stack)
+        elif isinstance(schema.get('items'), dict):
+            # 최상위가 배열인 스키마: 항목 필드를 '[]' 아래에 나열
+            item_fields, item_cuts = self._fields(schema['items'], stack)
+            fields.extend(self._prefixed(item_fields, '[]'))
+            cuts |= item_cuts
+
+        return self._unique(fields), cuts
+
+    def _ref_fields(self, ref: str, stack: List[str]) -> Tuple[List[Dict], Set[str]]:
+        """참조 스키마의 필드 (순환 밖에서 계산된 결과만 메모이제이션)"""
+        memo = self._fields_memo.get(ref)
+        if memo is not None:
+            return memo, set()
+        if ref in stack:
+            return [], {ref}
+        target = self.resolve_pointer(ref)
+        if target is None:
+            return [], set()
+
+        stack.append(ref)
+        try:
+            fields, cuts = self._fields(target, stack)
+        finally:
+            stack.pop()
+
+        # 이 참조에서 끊긴 순환은 호출 위치와 무관하므로 결과를 재사용할 수 있음
+        cuts.discard(ref)
+        if not cuts:
+            self._fields_memo[ref] = fields
+        return fields, cuts
+
+    def _add_property(self, fields: List[Dict], name: str, prop, required: bool,
+                      stack: List[str]) -> Set[str]:
+        """속성 하나와 그 하위 필드 추가, 끊긴 참조 집합 반환"""
+        if not isinstance(prop, dict):
+            return set()
+        target = self.deref(prop)
+        ref = prop.get('$ref', '') if isinstance(prop.get('$ref'), str) else ''
+
+        # 배열은 항목 스키마 기준으로 하위 필드와 참조 판단
+        child_schema, child_prefix = prop, name
+        if target.get('type') == 'array' and isinstance(target.get('items'), dict):
+            child_schema, child_prefix = target['items'], f'{name}[]'
+            item_ref = child_schema.get('$ref')
+            ref = item_ref if isinstance(item_ref, str) else ref
+
+        fields.append({
+            'name': name,
+            'type': self.schema_type(prop),
+            'format': str(target.get('format', '') or ''),
+            'description': str(prop.get('description') or target.get('description') or ''),
+            'required': required,
+            'ref': self.ref_name(ref),
+            'circular': bool(ref) and ref in stack,
+            'depth': 1
+        })
+
+        child_fields, cuts = self._fields(child_schema, stack)
+        fields.extend(self._prefixed(child_fields, child_prefix))
+        return cuts
+
+    @staticmethod
+    def _prefixed(fields: Iterable[Dict], prefix: str) -> List[Dict]:
+        """하위 필드 이름/깊이를 상위 필드 기준으로 변환 (새 dict)"""
+        result = []
+        for field in fields:
+            name = field['name']
+            joined = f'{prefix}{name}' if name.startswith('[]') else f'{prefix}.{name}'
+            result.append({**field, 'name': joined, 'depth': field['depth'] + 1})
+        return result
+
+    @staticmethod
+    def _unique(fields: List[Dict]) -> List[Dict]:
+        """이름 중복 제거 (allOf 병합 등, 먼저 나온 필드 유지)"""
+        seen = set()
+        unique = []
+        for field in fields:
+            if field['name'] not in seen:
+                seen.add(field['name'])
+                unique.append(field)
+        return unique
+
+    # ------------------------------------------------------------------
+    # 엔드포인트 단위
+    # ------------------------------------------------------------------
+    def content_schema(self, node: Dict) -> Optional[Dict]:
+        """응답/요청 본문의 스키마 (Swagger 2: schema, OpenAPI 3: content의 우선 미디어 타입)"""
+        if isinstance(node.get('schema'), dict):
+            return node['schema']
+        content = node.get('content')
+        if not isinstance(content, dict) or not content:
+            return None
+        for media_type in _PREFERRED_MEDIA_TYPES:
+            if isinstance(content.get(media_type), dict):
+                return content[media_type].get('schema')
+        for media_type, media in content.items():
+            if 'json' in media_type and isinstance(media, dict):
+                return media.get('schema')
+        media = next(iter(content.values()))
+        return media.get('schema') if isinstance(media, dict) else None
+
+    def parameters(self, operation_params, path_params=None, request_body=None) -> List[Dict]:
+        """
+        경로/오퍼레이션 파라미터 병합 (같은 name+in은 오퍼레이션 우선), OpenAPI 3 requestBody는 in=body로 추가
+
+        Returns:
+            [{'name', 'description', 'required', 'type', 'in', ('fields')}]
+        """
+        merged: Dict[Tuple[str, str], Dict] = {}
+        for param in list(path_params or []) + list(operation_params or []):
+            param = self.deref(param)
+            if param:
+                merged[(str(param.get('name', '')), str(param.get('in', '')))] = param
+
+        result = []
+        for param in merged.values():
+            schema = self.content_schema(param)
+            entry = {
+                'name': param.get('name', ''),
+                'description': param.get('description', ''),
+                'required': param.get('required', False),
+                'type': param.get('type', '') or (self.schema_type(schema) if schema else ''),
+                'in': param.get('in', '')
+            }
+            fields = self.schema_fields(schema) if schema else []
+            if fields:
+                entry['fields'] = fields
+            result.append(entry)
+
+        body = self.deref(request_body) if request_body else {}
+        schema = self.content_schema(body) if body else None
+        if body:
+            entry = {
+                'name': 'body',
+                'description': body.get('description', ''),
+                'required': body.get('required', False),
+                'type': self.schema_type(schema) if schema else '',
+                'in': 'body'
+            }
+            fields = self.schema_fields(schema) if schema else []
+            if fields:
+                entry['fields'] = fields
+            result.append(entry)
+
+        return result
+
+    def responses(self, responses) -> List[Dict]:
+        """
+        응답 코드별 설명과 본문 스키마 필드
+
+        Returns:
+            [{'status_code', 'description', ('type', 'fields')}]
+        """
+        result = []
+        if not isinstance(responses, dict):
+            return result
+        for status_code, response in responses.items():
+            response = self.deref(response)
+            entry = {
+                'status_code': status_code,
+                'description': response.get('description', '')
+            }
+            schema = self.content_schema(response)
+            if schema:
+                entry['type'] = self.schema_type(schema)
+                fields = self.schema_fields(schema)
+                if fields:
+                    entry['fields'] = fields
+            result.append(entry)
+        return result
@@ -9,50 +9,63 @@ from playwright.async_api import Page
 from util.text_cleaner import clean_text
 
 
+# 모든 table/tr의 th/td 원문을 한 번의 evaluate로 수집
+# (innerText 사용: 기존 inner_text()와 동일한 렌더링 텍스트)
+_COLLECT_TABLE_ROWS_JS = '''() => {
+    const text = (elem) => (elem ? elem.innerText : null);
+    const rows = [];
+    document.querySelectorAll('table').forEach(table => {
+        table.querySelectorAll('tr').forEach(row => {
+            const th = row.querySelector('th');
+            if (!th) return;
+
+            const td = row.querySelector('td');
+            const strong = td ? td.querySelector('strong') : null;
+            rows.push({
+                key: text(th),
+                value: text(td),
+                strong_tel: strong ? text(strong.querySelector('#telNoDiv, #telNo')) : null,
+                td_tel: td ? text(td.querySelector('#telNoDiv, #telNo')) : null,
+                link: td ? text(td.querySelector('a')) : null
+            });
+        });
+    });
+    return rows;
+}'''
+
+
 async def extract_table_info_pw(page: Page) -> Dict:
-    """Playwright로 테이블 정보 추출"""
+    """Playwright로 테이블 정보 추출 (단일 evaluate 호출)"""
     table_info = {}
     # 모든 테이블 선택 (dataset-table 외의 중요 정보도 포함)
-    tables = await page.query_selector_all('table')
-
-    for table in tables:
-        rows = await table.query_selector_all('tr')
-        for row in rows:
-            try:
-                th = await row.query_selector('th')
-                if th:  # th만 있어도 처리
-                    key = clean_text(await th.inner_text())
-                    if not key:  # key가 비어있으면 스킵
-                        continue
-
-                    value = ''
-                    td = await row.query_selector('td')
-                    if td:
-                        value = clean_text(await td.inner_text())
-
-                        # 전화번호 특별 처리 (div#telNoDiv 또는 span#telNo)
-                        if '전화번호' in key:
-                            # strong 태그 안의 div#telNoDiv 또는 span#telNo 우선 찾기
-                            strong_tag = await td.query_selector('strong')
-                            if strong_tag:
-                                tel_elem = await strong_tag.query_selector('#telNoDiv, #telNo')
-                                if tel_elem:
-                                    value = clean_text(await tel_elem.inner_text())
-                            # td 바로 아래의 div#telNoDiv 또는 span#telNo도 확인
-                            if not value:
-                                tel_elem = await td.query_selector('#telNoDiv, #telNo')
-                                if tel_elem:
-                                    value = clean_text(await tel_elem.inner_text())
-
-                        # 링크 처리
-                        if not value:
-                            link = await td.query_selector('a')
-                            if link:
-                                value = clean_text(await link.inner_text())
-
-                    # 값이 없어도 저장 (빈 문자열로)
-                    table_info[key] = value
-            except:
+    rows = await page.evaluate(_COLLECT_TABLE_ROWS_JS)
+
+    for row in rows:
+        try:
+            key = clean_text(row['key'])
+            if not key:  # key가 비어있으면 스킵
                 continue
 
-    return table_info
\ No newline at end of file
+            value = ''
+            if row['value'] is not None:
+                value = clean_text(row['value'])
+
+                # 전화번호 특별 처리 (div#telNoDiv 또는 span#telNo)
+                if '전화번호' in key:
+                    # strong 태그 안의 div#telNoDiv 또는 span#telNo 우선
+                    if row['strong_tel'] is not None:
+                        value = clean_text(row['strong_tel'])
+                    # td 바로 아래의 div#telNoDiv 또는 span#telNo도 확인
+                    if not value and row['td_tel'] is not None:
+                        value = clean_text(row['td_tel'])
+
+                # 링크 처리
+                if not value and row['link'] is not None:
+                    value = clean_text(row['link'])
+
+            # 값이 없어도 저장 (빈 문자열로)
+            table_info[key] = value
+        except Exception:
+            continue
+
+    return table_info
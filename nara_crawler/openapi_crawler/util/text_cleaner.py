@@ -4,14 +4,29 @@
 import re
 
 
+# 정제 패턴 (모듈 로드 시 한 번만 컴파일)
+_TAG_RE = re.compile(r'<[^>]+>')
+# 개행/탭/공백 연속 구간 → 공백 1개 ([\n\r\t]+ → ' ' 후 ' +' → ' '와 동일)
+_WHITESPACE_RE = re.compile(r'[ \n\r\t]+')
+_CONTROL_WS_RE = re.compile(r'[\n\r\t]+')
+_SPACES_RE = re.compile(r' +')
+
+# 추출 시점에 이미 정제된 결과 data 키 (크롤러 마무리 정제에서 하위 트리째 건너뜀)
+# - info/api_details/endpoints/general_api_info/api_info: 생성하는 곳에서 clean_text 적용
+# - swagger_json: 원본 명세 그대로 보존 (spec_hash, 명세 저장소와 같은 내용)
+PRECLEANED_KEYS = frozenset({
+    'info', 'api_info', 'endpoints', 'api_details', 'general_api_info', 'swagger_json'
+})
+
+
 def clean_text(text):
     """텍스트 정제"""
     if not isinstance(text, str):
         return text
-    text = re.sub(r'[\n\r\t]+', ' ', text)
-    text = re.sub(r'<[^>]+>', '', text)
-    text = re.sub(r' +', ' ', text)
-    return text.strip()
+    # 태그가 없으면 공백 정리 한 번으로 끝
+    if '<' in text:
+        text = _TAG_RE.sub('', text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
 
 
 def clean_text_preserve_tags(text):
@@ -19,43 +34,70 @@ def clean_text_preserve_tags(text):
     if not isinstance(text, str):
         return text
     # 개행, 캐리지 리턴, 탭 문자 제거
-    text = re.sub(r'[\n\r\t]+', '', text)
+    text = _CONTROL_WS_RE.sub('', text)
     # 연속된 공백을 하나로
-    text = re.sub(r' +', ' ', text)
+    text = _SPACES_RE.sub(' ', text)
     return text.strip()
 
 
-def clean_all_text(obj, skip_keys=None):
-    """재귀적으로 모든 텍스트 정제
+def _as_set(keys):
+    if keys is None:
+        return frozenset()
+    if isinstance(keys, (set, frozenset)):
+        return keys
+    return set(keys)
+
+
+def clean_all_text(obj, skip_keys=None, in_place=False, skip_subtrees=None):
+    """모든 텍스트 정제 (재귀 호출 없이 스택으로 순회)
 
     Args:
         obj: 정제할 객체 (dict, list, str 등)
         skip_keys: HTML 태그를 보존할 키 이름 목록 (set 또는 list)
                   이 키들의 값은 태그를 보존하고 공백 문자만 정리
+        in_place: True면 dict/list를 복사하지 않고 그대로 수정
+        skip_subtrees: 정제하지 않고 그대로 둘 키 이름 목록 (예: 'swagger_json')
+                       복사 모드에서도 해당 값은 원본 객체를 그대로 참조
     """
-    if skip_keys is None:
-        skip_keys = set()
-    elif not isinstance(skip_keys, set):
-        skip_keys = set(skip_keys)
-
-    if isinstance(obj, dict):
-        result = {}
-        for k, v in obj.items():
-            if k in skip_keys:
-                # skip_keys에 해당하는 키는 태그 보존하면서 공백만 정리
-                if isinstance(v, str):
-                    result[k] = clean_text_preserve_tags(v)
-                elif isinstance(v, (dict, list)):
-                    result[k] = clean_all_text(v, skip_keys)
-                else:
-                    result[k] = v
-            else:
-                # 일반 키는 태그 제거
-                result[k] = clean_all_text(v, skip_keys)
-        return result
-    elif isinstance(obj, list):
-        return [clean_all_text(v, skip_keys) for v in obj]
-    elif isinstance(obj, str):
+    skip_keys = _as_set(skip_keys)
+    skip_subtrees = _as_set(skip_subtrees)
+
+    if isinstance(obj, str):
         return clean_text(obj)
-    else:
-        return obj
\ No newline at end of file
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    root = obj if in_place else (dict(obj) if isinstance(obj, dict) else list(obj))
+    stack = [root]
+
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            for k, v in container.items():
+                if k in skip_subtrees:
+                    continue
+                if isinstance(v, str):
+                    # skip_keys에 해당하는 키는 태그 보존하면서 공백만 정리
+                    container[k] = clean_text_preserve_tags(v) if k in skip_keys else clean_text(v)
+                elif isinstance(v, dict):
+                    child = v if in_place else dict(v)
+                    container[k] = child
+                    stack.append(child)
+                elif isinstance(v, list):
+                    child = v if in_place else list(v)
+                    container[k] = child
+                    stack.append(child)
+        else:
+            for i, v in enumerate(container):
+                if isinstance(v, str):
+                    container[i] = clean_text(v)
+                elif isinstance(v, dict):
+                    child = v if in_place else dict(v)
+                    container[i] = child
+                    stack.append(child)
+                elif isinstance(v, list):
+                    child = v if in_place else list(v)
+                    container[i] = child
+                    stack.append(child)
+
+    return root
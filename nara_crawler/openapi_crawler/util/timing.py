@@ -0,0 +1,176 @@
+"""
+URL별 단계 시간 측정
+- PhaseTimer: 결과 dict의 'timings'에 단계별 소요 시간(초)을 누적
+- aiohttp TraceConfig: 커넥터 대기, DNS, 연결, TTFB를 요청별 PhaseTimer에 기록
+- summarize_timings: 단계별 p50/p95/p99와 가장 느린 URL 요약
+
+단계
+    queue_wait  세마포어/rate limiter/커넥터/컨텍스트 풀 대기
+    dns, connect, ttfb, download   (BeautifulSoup HTTP 요청)
+    goto, ready, evaluate          (Playwright 페이지 로드, 준비 대기, page.evaluate 추출)
+    parse       HTML 파싱 및 추출
+    detail      상세기능 POST (정적 경로)
+    clean       텍스트 정제
+    save        파일 저장 (저장 스레드)
+    total       저장을 제외한 URL 처리 전체 시간
+"""
+
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Optional
+
+import aiohttp
+
+
+PHASE_ORDER = (
+    'queue_wait', 'dns', 'connect', 'ttfb', 'download', 'goto', 'ready',
+    'evaluate', 'parse', 'detail', 'clean', 'save', 'total'
+)
+
+
+class PhaseTimer:
+    """단계별 소요 시간 누적기 (같은 단계는 합산)"""
+
+    def __init__(self, phases: Optional[Dict[str, float]] = None):
+        self.phases = phases if phases is not None else {}
+
+    def add(self, phase: str, seconds: float):
+        """단계 시간 추가"""
+        self.phases[phase] = round(self.phases.get(phase, 0.0) + max(0.0, seconds), 6)
+
+    @contextmanager
+    def phase(self, phase: str):
+        """with 블록 실행 시간을 단계에 추가"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+
+def _timer(ctx: SimpleNamespace) -> Optional[PhaseTimer]:
+    """요청에 전달된 PhaseTimer (trace_request_ctx)"""
+    timer = getattr(ctx, 'trace_request_ctx', None)
+    return timer if isinstance(timer, PhaseTimer) else None
+
+
+async def _on_request_start(session, ctx, params):
+    ctx.request_start = time.perf_counter()
+    ctx.excluded = 0.0
+
+
+async def _on_connection_queued_start(session, ctx, params):
+    ctx.queued_start = time.perf_counter()
+
+
+async def _on_connection_queued_end(session, ctx, params):
+    elapsed = time.perf_counter() - ctx.queued_start
+    ctx.excluded += elapsed
+    timer = _timer(ctx)
+    if timer:
+        timer.add('queue_wait', elapsed)
+
+
+async def _on_dns_resolvehost_start(session, ctx, params):
+    ctx.dns_start = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(session, ctx, params):
+    elapsed = time.perf_counter() - ctx.dns_start
+    ctx.dns = getattr(ctx, 'dns', 0.0) + elapsed
+    timer = _timer(ctx)
+    if timer:
+        timer.add('dns', elapsed)
+
+
+async def _on_connection_create_start(session, ctx, params):
+    ctx.connect_start = time.perf_counter()
+    ctx.dns = 0.0
+
+
+async def _on_connection_create_end(session, ctx, params):
+    elapsed = time.perf_counter() - ctx.connect_start
+    ctx.excluded += elapsed
+    timer = _timer(ctx)
+    if timer:
+        # 연결 생성 시간에는 DNS 조회가 포함되어 있으므로 제외
+        timer.add('connect', elapsed - ctx.dns)
+
+
+async def _on_request_end(session, ctx, params):
+    timer = _timer(ctx)
+    if timer:
+        # 응답 헤더 수신까지 걸린 시간에서 커넥터 대기/연결 시간 제외
+        timer.add('ttfb', time.perf_counter() - ctx.request_start - ctx.excluded)
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """요청별 trace_request_ctx(PhaseTimer)에 단계 시간을 기록하는 TraceConfig"""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_connection_queued_start.append(_on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(_on_connection_queued_end)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * pct // 100))
+    return values[int(min(rank, len(values))) - 1]
+
+
+def summarize_timings(results: Iterable[Dict], slowest: int = 10) -> Dict:
+    """
+    결과 목록의 단계 시간 요약
+
+    Returns:
+        {'phases': {단계: {'count', 'p50', 'p95', 'p99', 'max', 'total'}},
+         'slowest_urls': [{'url', 'method', 'total', 'timings'}, ...]}
+    """
+    per_phase: Dict[str, List[float]] = {}
+    ranked = []
+
+    for result in results:
+        timings = result.get('timings')
+        if not timings:
+            continue
+        for phase, seconds in timings.items():
+            per_phase.setdefault(phase, []).append(seconds)
+        ranked.append((timings.get('total', 0.0), result))
+
+    phases = {}
+    ordered = [p for p in PHASE_ORDER if p in per_phase] + sorted(p for p in per_phase if p not in PHASE_ORDER)
+    for phase in ordered:
+        values = sorted(per_phase[phase])
+        phases[phase] = {
+            'count': len(values),
+            'p50': round(percentile(values, 50), 3),
+            'p95': round(percentile(values, 95), 3),
+            'p99': round(percentile(values, 99), 3),
+            'max': round(values[-1], 3),
+            'total': round(sum(values), 3)
+        }
+
+    ranked.sort(key=lambda item: item[0], reverse=True)
+    slowest_urls = [
+        {
+            'url': result.get('url'),
+            'method': result.get('method'),
+            'total': round(total, 3),
+            'timings': {k: round(v, 3) for k, v in result['timings'].items()}
+        }
+        for total, result in ranked[:slowest]
+    ]
+
+    return {
+        'phases': phases,
+        'slowest_urls': slowest_urls
+    }